@@ -16,6 +16,7 @@ from typing import Dict, List, Optional, Any, Union, Tuple
 import logging
 import time
 import json
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 import os
@@ -234,7 +235,7 @@ class AlphaVantageCollector:
             logger.info("🌟 Alpha Vantage Premium tier detected")
         
         # Rate limiting
-        self.call_timestamps = []
+        self.call_timestamps = deque()
         self.daily_calls = 0
         self.last_reset = datetime.now().date()
         
@@ -339,7 +340,9 @@ class AlphaVantageCollector:
         
         # Check per-minute limit
         one_minute_ago = now - timedelta(minutes=1)
-        recent_calls = [t for t in self.call_timestamps if t > one_minute_ago]
+        recent_calls = self.call_timestamps
+        while recent_calls and recent_calls[0] <= one_minute_ago:
+            recent_calls.popleft()
         
         calls_per_minute = self.config.effective_calls_per_minute
         if len(recent_calls) >= calls_per_minute:
@@ -351,9 +354,6 @@ class AlphaVantageCollector:
         # Record this call
         self.call_timestamps.append(now)
         self.daily_calls += 1
-        
-        # Clean old timestamps
-        self.call_timestamps = [t for t in self.call_timestamps if t > one_minute_ago]
     
     def _track_api_call(self, function_name: str, symbol: str = None, success: bool = True):
         """Track API call for pipeline run statistics"""
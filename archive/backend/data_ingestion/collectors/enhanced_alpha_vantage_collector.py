@@ -10,12 +10,13 @@ Includes Top 200 global companies integration with immense data population strat
 
 import asyncio
 import aiohttp
+import asyncpg
 from aiohttp import TCPConnector
 import ssl
 import certifi
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Set
 import logging
 import time
 import json
@@ -24,11 +25,13 @@ import sys
 from dataclasses import dataclass, field
 from enum import Enum
 import hashlib
+import itertools
 
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from backend.utils.logging_utils import setup_logger
+from backend.config.settings import settings
 from backend.db.postgres_handler import PostgresHandler
 from backend.embeddings.vector_store import ChromaVectorStore
 from backend.embeddings.embedder import Embedder
@@ -36,6 +39,22 @@ from top_200_companies import TOP_200_COMPANIES, US_TRADEABLE_SYMBOLS, MEGA_CAP_
 
 logger = setup_logger(__name__)
 
+# C-accelerated JSON for jsonb payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Rust-backed fast tokenizer for batch chunking
+try:
+    from transformers import AutoTokenizer
+    TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    TRANSFORMERS_AVAILABLE = False
+    AutoTokenizer = None
+
 class AlphaVantageFunction(Enum):
     """Complete Alpha Vantage API functions - All supported endpoints"""
     
@@ -232,6 +251,84 @@ class DataIngestionMetrics:
             "calls_per_minute": self.total_api_calls / max(1, runtime / 60),
         }
 
+# ============= PREPARED HOT STATEMENTS =============
+
+FUNDAMENTAL_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS fundamental_data (
+        id SERIAL PRIMARY KEY,
+        ticker VARCHAR(20) NOT NULL,
+        data_type VARCHAR(50) NOT NULL,
+        data JSONB NOT NULL,
+        source VARCHAR(30) DEFAULT 'alpha_vantage',
+        updated_at TIMESTAMP DEFAULT NOW(),
+        UNIQUE(ticker, data_type, source)
+    )
+"""
+
+# Upserts executed once per row/article; prepared once per connection so the
+# server skips parse/plan on every call
+HOT_STATEMENTS = {
+    "market_upsert": """
+        INSERT INTO market_prices (ticker, timestamp, open, high, low, close, volume, source)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+        ON CONFLICT (ticker, timestamp) DO UPDATE SET
+            open = EXCLUDED.open,
+            high = EXCLUDED.high,
+            low = EXCLUDED.low,
+            close = EXCLUDED.close,
+            volume = EXCLUDED.volume,
+            source = EXCLUDED.source
+    """,
+    "fundamental_upsert": """
+        INSERT INTO fundamental_data (ticker, data_type, data, source)
+        VALUES ($1, $2, $3, $4)
+        ON CONFLICT (ticker, data_type, source) DO UPDATE SET
+            data = EXCLUDED.data,
+            updated_at = NOW()
+    """,
+    "earnings_upsert": """
+        INSERT INTO earnings_data (ticker, fiscal_date_ending, reported_eps, 
+                                 estimated_eps, surprise, surprise_percentage, source)
+        VALUES ($1, $2, $3, $4, $5, $6, $7)
+        ON CONFLICT (ticker, fiscal_date_ending) DO UPDATE SET
+            reported_eps = EXCLUDED.reported_eps,
+            estimated_eps = EXCLUDED.estimated_eps,
+            surprise = EXCLUDED.surprise,
+            surprise_percentage = EXCLUDED.surprise_percentage
+    """,
+    "headline_upsert_returning": """
+        INSERT INTO news_headlines (ticker, headline, url, source, published_at)
+        VALUES ($1, $2, $3, $4, $5)
+        ON CONFLICT (url) DO UPDATE SET headline = EXCLUDED.headline
+        RETURNING id
+    """,
+    "sentiment_upsert": """
+        INSERT INTO news_sentiment (headline_id, sentiment_score, sentiment_label, confidence, model_version)
+        VALUES ($1, $2, $3, $4, $5)
+        ON CONFLICT (headline_id) DO UPDATE SET
+            sentiment_score = EXCLUDED.sentiment_score,
+            sentiment_label = EXCLUDED.sentiment_label
+    """,
+}
+
+# jsonb binary wire format is a version byte followed by the JSON text
+JSONB_BINARY_VERSION = b"\x01"
+
+def _encode_jsonb(value: Any) -> bytes:
+    return JSONB_BINARY_VERSION + orjson.dumps(value)
+
+def _decode_jsonb(data: bytes) -> Any:
+    return orjson.loads(data[1:])
+
+class HotStatementConnection(asyncpg.Connection):
+    """Pooled connection carrying its own prepared HOT_STATEMENTS, prepared on first use"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hot_statements: Dict[str, asyncpg.prepared_stmt.PreparedStatement] = {}
+        # Keys whose PREPARE failed here (e.g. missing table or constraint); run as plain SQL
+        self.unprepared_statements: Set[str] = set()
+
 class EnhancedAlphaVantageCollector:
     """
     Enhanced Alpha Vantage collector supporting ALL API endpoints
@@ -243,13 +340,28 @@ class EnhancedAlphaVantageCollector:
         self.db = PostgresHandler()
         self.vector_store = ChromaVectorStore()
         self.embedder = Embedder()
+        self.tokenizer = self._load_tokenizer()
         self.metrics = DataIngestionMetrics()
+        
+        # Vector ids: one run epoch plus a monotonic per-collector counter
+        self._run_ts = int(time.time())
+        self._id_gen = itertools.count()
+        
+        # Latest stored published_at per news source; loaded on first news batch
+        self._news_hwm: Optional[Dict[str, datetime]] = None
         self.session = None
         
+        # Bounded pool shared by all storage tasks; created in setup()
+        self.pool: Optional[asyncpg.Pool] = None
+        
         # Rate limiting
         self._last_call_time = 0
         self._call_count = 0
         self._call_window_start = datetime.now()
+        self._rate_lock = asyncio.Lock()  # Calls are spaced key-wide, even when collections run concurrently
+        
+        # Bounds in-flight per-symbol requests to the tier's per-minute allowance
+        self.sem = asyncio.Semaphore(config.effective_calls_per_minute)
         
         # Major currency pairs for FX data
         self.major_forex_pairs = [
@@ -279,15 +391,98 @@ class EnhancedAlphaVantageCollector:
             timeout=aiohttp.ClientTimeout(total=self.config.timeout),
             trust_env=True
         )
+        try:
+            await self.setup()
+        except Exception as e:
+            logger.error(f"Failed to initialize storage pool: {e}")
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         if self.session:
             await self.session.close()
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+    
+    async def setup(self):
+        """Create the shared connection pool; hot statements are prepared lazily per connection"""
+        if self.pool is None:
+            self.pool = await asyncpg.create_pool(
+                host=settings.POSTGRES_HOST,
+                port=settings.POSTGRES_PORT,
+                database=settings.POSTGRES_DB,
+                user=settings.POSTGRES_USER,
+                password=settings.POSTGRES_PASSWORD,
+                min_size=5,
+                max_size=20,
+                max_queries=50000,
+                connection_class=HotStatementConnection,
+                init=self._init_connection
+            )
+            logger.info("Alpha Vantage storage pool initialized")
+            
+            try:
+                async with self.pool.acquire() as conn:
+                    await conn.execute(FUNDAMENTAL_TABLE_DDL)
+            except Exception as e:
+                logger.warning(f"Could not ensure fundamental_data table: {e}")
+    
+    @staticmethod
+    async def _init_connection(conn: HotStatementConnection):
+        """Register JSON codecs on a new pooled connection"""
+        if ORJSON_AVAILABLE:
+            await conn.set_type_codec(
+                'jsonb', encoder=_encode_jsonb, decoder=_decode_jsonb,
+                schema='pg_catalog', format='binary'
+            )
+        else:
+            await conn.set_type_codec('jsonb', encoder=json.dumps, decoder=json.loads, schema='pg_catalog')
+    
+    @staticmethod
+    async def _hot_statement(conn: HotStatementConnection, key: str) -> Optional[asyncpg.prepared_stmt.PreparedStatement]:
+        """Prepared handle for a hot statement on this connection, preparing it on first use; None if it can't be prepared"""
+        statement = conn.hot_statements.get(key)
+        if statement is None and key not in conn.unprepared_statements:
+            try:
+                statement = await conn.prepare(HOT_STATEMENTS[key])
+                conn.hot_statements[key] = statement
+            except Exception as e:
+                conn.unprepared_statements.add(key)
+                logger.warning(f"Could not prepare hot statement {key}, falling back to plain queries: {e}")
+        return statement
+    
+    async def _run_hot(self, key: str, method: str, *args) -> Any:
+        """Run a hot statement through its prepared handle, or as plain SQL if it could not be prepared"""
+        if self.pool is None:
+            await self.setup()
+        async with self.pool.acquire() as conn:
+            statement = await self._hot_statement(conn, key)
+            if statement is not None:
+                return await getattr(statement, method)(*args)
+            return await getattr(conn, method)(HOT_STATEMENTS[key], *args)
+    
+    async def _execute_hot(self, key: str, *args) -> List[Any]:
+        """Execute a hot statement on a pooled connection"""
+        return await self._run_hot(key, 'fetch', *args)
+    
+    async def _executemany_hot(self, key: str, rows: List[Tuple]):
+        """Execute a hot statement for a batch of rows on a pooled connection"""
+        if not rows:
+            return
+        await self._run_hot(key, 'executemany', rows)
+    
+    async def _fetch_hot_scalar(self, key: str, *args) -> Any:
+        """Fetch a single value from a hot statement (e.g. RETURNING id)"""
+        return await self._run_hot(key, 'fetchval', *args)
     
     async def _rate_limit(self):
         """Implement rate limiting based on configuration"""
+        async with self._rate_lock:
+            return await self._reserve_call_slot()
+    
+    async def _reserve_call_slot(self):
+        """Wait for the next call slot; must be called with _rate_lock held"""
         current_time = time.time()
         time_since_last_call = current_time - self._last_call_time
         
@@ -298,6 +493,7 @@ class EnhancedAlphaVantageCollector:
             sleep_time = min_interval - time_since_last_call
             logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
             await asyncio.sleep(sleep_time)
+            current_time = time.time()
         
         # Check daily limit
         window_elapsed = (datetime.now() - self._call_window_start).total_seconds()
@@ -369,14 +565,95 @@ class EnhancedAlphaVantageCollector:
         self.metrics.add_call_result(False)
         return None
     
+    # ============= TEXT CHUNKING =============
+    
+    def _load_tokenizer(self):
+        """Load the fast tokenizer matching the embedding model, if available"""
+        if not TRANSFORMERS_AVAILABLE:
+            return None
+        try:
+            return AutoTokenizer.from_pretrained(settings.EMBEDDING_MODEL_NAME, use_fast=True)
+        except Exception as e:
+            logger.warning(f"Fast tokenizer unavailable, using embedder chunking: {e}")
+            return None
+    
+    def _chunk_texts(self, texts: List[str], max_length: int) -> List[List[str]]:
+        """
+        Chunk a batch of texts in a single tokenizer call.
+        Returns one list of chunks per input text, in input order.
+        """
+        if not texts:
+            return []
+        if self.tokenizer is None:
+            return [self.embedder.create_chunks(text, max_length=max_length) for text in texts]
+        
+        encoded = self.tokenizer(
+            texts,
+            max_length=max_length,
+            truncation=True,
+            stride=30,
+            return_overflowing_tokens=True,
+            padding=False,
+            add_special_tokens=False
+        )
+        
+        grouped = [[] for _ in texts]
+        for input_ids, parent in zip(encoded["input_ids"], encoded["overflow_to_sample_mapping"]):
+            grouped[parent].append(self.tokenizer.decode(input_ids, skip_special_tokens=True))
+        return grouped
+    
+    @staticmethod
+    def _overview_text(data: Dict, symbol: str) -> str:
+        """Searchable text for a company overview"""
+        return "\n".join((
+            f"Company: {data.get('Name', symbol)}",
+            f"Sector: {data.get('Sector', 'N/A')}",
+            f"Industry: {data.get('Industry', 'N/A')}",
+            f"Description: {data.get('Description', 'No description available')}",
+            f"Market Cap: ${data.get('MarketCapitalization', 'N/A')}",
+            f"P/E Ratio: {data.get('PERatio', 'N/A')}",
+            f"EPS: ${data.get('EPS', 'N/A')}",
+            f"Revenue: ${data.get('RevenueTTM', 'N/A')}",
+        ))
+    
+    @staticmethod
+    def _news_text(article: Dict) -> str:
+        """Searchable text for a news article"""
+        return "\n".join((
+            f"Title: {article.get('title', '')}",
+            f"Summary: {article.get('summary', '')}",
+            f"Source: {article.get('source', '')}",
+            f"Sentiment: {article.get('overall_sentiment_label', 'Neutral')}",
+        ))
+    
+    # ============= BOUNDED FAN-OUT =============
+    
+    async def _gather_bounded(self, items: List[Any], fetch_one, key=lambda item: item) -> Dict[Any, Any]:
+        """
+        Run fetch_one for every item under the shared semaphore.
+        Returns {key(item): result} for items that produced a result.
+        """
+        async def _one(item):
+            async with self.sem:
+                return await fetch_one(item)
+        
+        outcomes = await asyncio.gather(*[_one(item) for item in items], return_exceptions=True)
+        
+        results = {}
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error collecting {key(item)}: {outcome}")
+            elif outcome is not None:
+                results[key(item)] = outcome
+        return results
+    
     # ============= CORE STOCK DATA COLLECTION =============
     
     async def collect_daily_prices(self, symbols: List[str], outputsize: str = "compact") -> Dict[str, pd.DataFrame]:
         """Collect daily price data for symbols"""
         logger.info(f"Collecting daily prices for {len(symbols)} symbols")
-        results = {}
         
-        for symbol in symbols:
+        async def _fetch_one(symbol: str) -> Optional[pd.DataFrame]:
             try:
                 data = await self._make_api_call(
                     AlphaVantageFunction.TIME_SERIES_DAILY_ADJUSTED,
@@ -394,22 +671,21 @@ class EnhancedAlphaVantageCollector:
                     
                     # Store in PostgreSQL
                     await self._store_market_data(df, symbol)
-                    results[symbol] = df
                     
                     logger.info(f"✅ Collected {len(df)} daily price records for {symbol}")
+                    return df
                 
             except Exception as e:
                 logger.error(f"Error collecting daily prices for {symbol}: {e}")
-                continue
+            return None
         
-        return results
+        return await self._gather_bounded(symbols, _fetch_one)
     
     async def collect_intraday_prices(self, symbols: List[str], interval: str = "5min") -> Dict[str, pd.DataFrame]:
         """Collect intraday price data"""
         logger.info(f"Collecting intraday prices for {len(symbols)} symbols")
-        results = {}
         
-        for symbol in symbols:
+        async def _fetch_one(symbol: str) -> Optional[pd.DataFrame]:
             try:
                 data = await self._make_api_call(
                     AlphaVantageFunction.TIME_SERIES_INTRADAY,
@@ -426,24 +702,23 @@ class EnhancedAlphaVantageCollector:
                     df['symbol'] = symbol
                     
                     await self._store_market_data(df, symbol)
-                    results[symbol] = df
                     
                     logger.info(f"✅ Collected {len(df)} intraday records for {symbol}")
+                    return df
                 
             except Exception as e:
                 logger.error(f"Error collecting intraday prices for {symbol}: {e}")
-                continue
+            return None
         
-        return results
+        return await self._gather_bounded(symbols, _fetch_one)
     
     # ============= FUNDAMENTAL DATA COLLECTION =============
     
     async def collect_company_overviews(self, symbols: List[str]) -> Dict[str, Dict]:
         """Collect company overview/fundamental data"""
         logger.info(f"Collecting company overviews for {len(symbols)} symbols")
-        results = {}
         
-        for symbol in symbols:
+        async def _fetch_one(symbol: str) -> Optional[Dict]:
             try:
                 data = await self._make_api_call(
                     AlphaVantageFunction.OVERVIEW,
@@ -451,25 +726,25 @@ class EnhancedAlphaVantageCollector:
                 )
                 
                 if data and "Symbol" in data:
-                    # Store in PostgreSQL and vector database
+                    # Store in PostgreSQL; vectors are chunked as one batch below
                     await self._store_fundamental_data(data, symbol)
-                    await self._store_company_overview_vectors(data, symbol)
                     
-                    results[symbol] = data
                     logger.info(f"✅ Collected company overview for {symbol}")
+                    return data
                 
             except Exception as e:
                 logger.error(f"Error collecting overview for {symbol}: {e}")
-                continue
+            return None
         
+        results = await self._gather_bounded(symbols, _fetch_one)
+        await self._store_company_overview_vectors(results)
         return results
     
     async def collect_earnings_data(self, symbols: List[str]) -> Dict[str, Dict]:
         """Collect earnings data"""
         logger.info(f"Collecting earnings data for {len(symbols)} symbols")
-        results = {}
         
-        for symbol in symbols:
+        async def _fetch_one(symbol: str) -> Optional[Dict]:
             try:
                 data = await self._make_api_call(
                     AlphaVantageFunction.EARNINGS,
@@ -478,15 +753,15 @@ class EnhancedAlphaVantageCollector:
                 
                 if data and "symbol" in data:
                     await self._store_earnings_data(data, symbol)
-                    results[symbol] = data
                     
                     logger.info(f"✅ Collected earnings data for {symbol}")
+                    return data
                 
             except Exception as e:
                 logger.error(f"Error collecting earnings for {symbol}: {e}")
-                continue
+            return None
         
-        return results
+        return await self._gather_bounded(symbols, _fetch_one)
     
     # ============= NEWS & SENTIMENT COLLECTION =============
     
@@ -536,9 +811,9 @@ class EnhancedAlphaVantageCollector:
     async def collect_forex_data(self) -> Dict[str, pd.DataFrame]:
         """Collect forex data for major currency pairs"""
         logger.info(f"Collecting forex data for {len(self.major_forex_pairs)} pairs")
-        results = {}
         
-        for from_currency, to_currency in self.major_forex_pairs:
+        async def _fetch_one(currencies: Tuple[str, str]) -> Optional[pd.DataFrame]:
+            from_currency, to_currency = currencies
             try:
                 # Daily forex data
                 data = await self._make_api_call(
@@ -556,24 +831,26 @@ class EnhancedAlphaVantageCollector:
                     df['pair'] = pair
                     
                     await self._store_forex_data(df, pair)
-                    results[pair] = df
                     
                     logger.info(f"✅ Collected forex data for {pair}")
+                    return df
                 
             except Exception as e:
                 logger.error(f"Error collecting forex for {from_currency}/{to_currency}: {e}")
-                continue
+            return None
         
-        return results
+        return await self._gather_bounded(
+            self.major_forex_pairs, _fetch_one,
+            key=lambda currencies: f"{currencies[0]}{currencies[1]}"
+        )
     
     # ============= CRYPTO DATA COLLECTION =============
     
     async def collect_crypto_data(self) -> Dict[str, pd.DataFrame]:
         """Collect cryptocurrency data"""
         logger.info(f"Collecting crypto data for {len(self.major_crypto)} cryptocurrencies")
-        results = {}
         
-        for crypto in self.major_crypto:
+        async def _fetch_one(crypto: str) -> Optional[pd.DataFrame]:
             try:
                 data = await self._make_api_call(
                     AlphaVantageFunction.DIGITAL_CURRENCY_DAILY,
@@ -593,24 +870,23 @@ class EnhancedAlphaVantageCollector:
                     df['symbol'] = f"{crypto}-USD"
                     
                     await self._store_crypto_data(df, crypto)
-                    results[crypto] = df
                     
                     logger.info(f"✅ Collected crypto data for {crypto}")
+                    return df
                 
             except Exception as e:
                 logger.error(f"Error collecting crypto for {crypto}: {e}")
-                continue
+            return None
         
-        return results
+        return await self._gather_bounded(self.major_crypto, _fetch_one)
     
     # ============= COMMODITIES DATA COLLECTION =============
     
     async def collect_commodities_data(self) -> Dict[str, pd.DataFrame]:
         """Collect commodities data"""
         logger.info(f"Collecting commodities data for {len(self.commodities)} commodities")
-        results = {}
         
-        for commodity in self.commodities:
+        async def _fetch_one(commodity: str) -> Optional[pd.DataFrame]:
             try:
                 data = await self._make_api_call(getattr(AlphaVantageFunction, commodity))
                 
@@ -621,55 +897,61 @@ class EnhancedAlphaVantageCollector:
                     df['commodity'] = commodity.lower()
                     
                     await self._store_commodities_data(df, commodity)
-                    results[commodity] = df
                     
                     logger.info(f"✅ Collected commodities data for {commodity}")
+                    return df
                 
             except Exception as e:
                 logger.error(f"Error collecting commodity {commodity}: {e}")
-                continue
+            return None
         
-        return results
+        return await self._gather_bounded(self.commodities, _fetch_one)
     
     # ============= TECHNICAL INDICATORS COLLECTION =============
     
     async def collect_technical_indicators(self, symbols: List[str]) -> Dict[str, Dict[str, pd.DataFrame]]:
         """Collect technical indicators for symbols"""
         logger.info(f"Collecting technical indicators for {len(symbols)} symbols")
-        results = {}
         
-        for symbol in symbols[:10]:  # Limit for API calls
-            results[symbol] = {}
-            
-            for indicator in self.tech_indicators[:3]:  # Top 3 indicators
-                try:
-                    params = {"symbol": symbol, "interval": "daily", "time_period": 20}
-                    
-                    if indicator == "BBANDS":
-                        params.update({"time_period": 20, "series_type": "close"})
-                    elif indicator == "MACD":
-                        params.update({"series_type": "close"})
-                    elif indicator == "STOCH":
-                        params.update({"fastkperiod": 5, "slowkperiod": 3, "slowdperiod": 3})
-                    
-                    data = await self._make_api_call(getattr(AlphaVantageFunction, indicator), **params)
+        symbols = symbols[:10]  # Limit for API calls
+        indicators = self.tech_indicators[:3]  # Top 3 indicators
+        
+        async def _fetch_one(job: Tuple[str, str]) -> Optional[pd.DataFrame]:
+            symbol, indicator = job
+            try:
+                params = {"symbol": symbol, "interval": "daily", "time_period": 20}
+                
+                if indicator == "BBANDS":
+                    params.update({"time_period": 20, "series_type": "close"})
+                elif indicator == "MACD":
+                    params.update({"series_type": "close"})
+                elif indicator == "STOCH":
+                    params.update({"fastkperiod": 5, "slowkperiod": 3, "slowdperiod": 3})
+                
+                data = await self._make_api_call(getattr(AlphaVantageFunction, indicator), **params)
+                
+                if data and f"Technical Analysis: {indicator}" in data:
+                    df = pd.DataFrame.from_dict(data[f"Technical Analysis: {indicator}"], orient='index')
+                    df.index = pd.to_datetime(df.index)
+                    df = df.astype(float)
+                    df['symbol'] = symbol
+                    df['indicator'] = indicator
                     
-                    if data and f"Technical Analysis: {indicator}" in data:
-                        df = pd.DataFrame.from_dict(data[f"Technical Analysis: {indicator}"], orient='index')
-                        df.index = pd.to_datetime(df.index)
-                        df = df.astype(float)
-                        df['symbol'] = symbol
-                        df['indicator'] = indicator
-                        
-                        await self._store_technical_indicators(df, symbol, indicator)
-                        results[symbol][indicator] = df
-                        
-                        logger.info(f"✅ Collected {indicator} for {symbol}")
+                    await self._store_technical_indicators(df, symbol, indicator)
                     
-                except Exception as e:
-                    logger.error(f"Error collecting {indicator} for {symbol}: {e}")
-                    continue
+                    logger.info(f"✅ Collected {indicator} for {symbol}")
+                    return df
+                
+            except Exception as e:
+                logger.error(f"Error collecting {indicator} for {symbol}: {e}")
+            return None
+        
+        jobs = [(symbol, indicator) for symbol in symbols for indicator in indicators]
+        collected = await self._gather_bounded(jobs, _fetch_one)
         
+        results = {symbol: {} for symbol in symbols}
+        for (symbol, indicator), df in collected.items():
+            results[symbol][indicator] = df
         return results
     
     # ============= ECONOMIC INDICATORS COLLECTION =============
@@ -677,7 +959,6 @@ class EnhancedAlphaVantageCollector:
     async def collect_economic_indicators(self) -> Dict[str, pd.DataFrame]:
         """Collect economic indicators"""
         logger.info("Collecting economic indicators")
-        results = {}
         
         economic_indicators = [
             AlphaVantageFunction.REAL_GDP,
@@ -687,7 +968,7 @@ class EnhancedAlphaVantageCollector:
             AlphaVantageFunction.UNEMPLOYMENT
         ]
         
-        for indicator in economic_indicators:
+        async def _fetch_one(indicator: AlphaVantageFunction) -> Optional[pd.DataFrame]:
             try:
                 params = {}
                 if indicator == AlphaVantageFunction.TREASURY_YIELD:
@@ -702,35 +983,31 @@ class EnhancedAlphaVantageCollector:
                     df['indicator'] = indicator.value
                     
                     await self._store_economic_indicators(df, indicator.value)
-                    results[indicator.value] = df
                     
                     logger.info(f"✅ Collected economic indicator: {indicator.value}")
+                    return df
                 
             except Exception as e:
                 logger.error(f"Error collecting economic indicator {indicator.value}: {e}")
-                continue
+            return None
         
-        return results
+        return await self._gather_bounded(
+            economic_indicators, _fetch_one,
+            key=lambda indicator: indicator.value
+        )
     
     # ============= DATA STORAGE METHODS =============
     
     async def _store_market_data(self, df: pd.DataFrame, symbol: str):
         """Store market data in PostgreSQL"""
         try:
-            for index, row in df.iterrows():
-                await self.db.async_execute_query("""
-                    INSERT INTO market_prices (ticker, timestamp, open, high, low, close, volume, source)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                    ON CONFLICT (ticker, timestamp) DO UPDATE SET
-                        open = EXCLUDED.open,
-                        high = EXCLUDED.high,
-                        low = EXCLUDED.low,
-                        close = EXCLUDED.close,
-                        volume = EXCLUDED.volume,
-                        source = EXCLUDED.source
-                """, (symbol, index, float(row.get('open', 0)), float(row.get('high', 0)), 
-                     float(row.get('low', 0)), float(row.get('close', 0)), 
-                     int(row.get('volume', 0)), 'alpha_vantage'))
+            rows = [
+                (symbol, index, float(row.get('open', 0)), float(row.get('high', 0)), 
+                 float(row.get('low', 0)), float(row.get('close', 0)), 
+                 int(row.get('volume', 0)), 'alpha_vantage')
+                for index, row in df.iterrows()
+            ]
+            await self._executemany_hot("market_upsert", rows)
                      
         except Exception as e:
             logger.error(f"Error storing market data for {symbol}: {e}")
@@ -738,165 +1015,208 @@ class EnhancedAlphaVantageCollector:
     async def _store_fundamental_data(self, data: Dict, symbol: str):
         """Store fundamental data as JSON in a dedicated table"""
         try:
-            # Create table if it doesn't exist
-            await self.db.async_execute_query("""
-                CREATE TABLE IF NOT EXISTS fundamental_data (
-                    id SERIAL PRIMARY KEY,
-                    ticker VARCHAR(20) NOT NULL,
-                    data_type VARCHAR(50) NOT NULL,
-                    data JSONB NOT NULL,
-                    source VARCHAR(30) DEFAULT 'alpha_vantage',
-                    updated_at TIMESTAMP DEFAULT NOW(),
-                    UNIQUE(ticker, data_type, source)
-                )
-            """)
-            
-            await self.db.async_execute_query("""
-                INSERT INTO fundamental_data (ticker, data_type, data, source)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (ticker, data_type, source) DO UPDATE SET
-                    data = EXCLUDED.data,
-                    updated_at = NOW()
-            """, (symbol, 'company_overview', json.dumps(data), 'alpha_vantage'))
+            # Table is created when pooled connections are initialized;
+            # the jsonb codec serializes the payload
+            await self._execute_hot(
+                "fundamental_upsert",
+                symbol, 'company_overview', data, 'alpha_vantage'
+            )
             
         except Exception as e:
             logger.error(f"Error storing fundamental data for {symbol}: {e}")
     
-    async def _store_company_overview_vectors(self, data: Dict, symbol: str):
-        """Store company overview data in vector database"""
+    async def _store_company_overview_vectors(self, overviews: Dict[str, Dict]):
+        """Store a round of company overviews in vector database"""
+        symbols = list(overviews)
         try:
-            # Create searchable text from overview
-            overview_text = f"""
-            Company: {data.get('Name', symbol)}
-            Sector: {data.get('Sector', 'N/A')}
-            Industry: {data.get('Industry', 'N/A')}
-            Description: {data.get('Description', 'No description available')}
-            Market Cap: ${data.get('MarketCapitalization', 'N/A')}
-            P/E Ratio: {data.get('PERatio', 'N/A')}
-            EPS: ${data.get('EPS', 'N/A')}
-            Revenue: ${data.get('RevenueTTM', 'N/A')}
-            """
-            
-            # Create chunks for embedding
-            chunks = self.embedder.create_chunks(overview_text, max_length=300)
-            
-            for i, chunk in enumerate(chunks):
-                embedding = await self.embedder.embed_text(chunk)
+            # Chunk all overviews for this round in one batch
+            all_chunks = self._chunk_texts(
+                [self._overview_text(overviews[symbol], symbol) for symbol in symbols],
+                max_length=300
+            )
+        except Exception as e:
+            logger.error(f"Error chunking overview text: {e}")
+            return
+        
+        for symbol, chunks in zip(symbols, all_chunks):
+            data = overviews[symbol]
+            try:
+                embeddings = await self._embed_chunks(chunks)
+                for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+                    if embedding is None:
+                        continue
+                    
+                    metadata = {
+                        "ticker": symbol,
+                        "company_name": data.get('Name', symbol),
+                        "data_type": "company_overview",
+                        "sector": data.get('Sector', 'Unknown'),
+                        "industry": data.get('Industry', 'Unknown'),
+                        "source": "alpha_vantage",
+                        "chunk_index": i,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    
+                    # Store in vector database
+                    await self.vector_store.add_vectors([{
+                        "id": f"{symbol}_ov_{self._run_ts}_{next(self._id_gen)}",
+                        "vector": embedding,
+                        "metadata": metadata,
+                        "content": chunk
+                    }])
                 
-                metadata = {
-                    "ticker": symbol,
-                    "company_name": data.get('Name', symbol),
-                    "data_type": "company_overview",
-                    "sector": data.get('Sector', 'Unknown'),
-                    "industry": data.get('Industry', 'Unknown'),
-                    "source": "alpha_vantage",
-                    "chunk_index": i,
-                    "timestamp": datetime.now().isoformat()
-                }
+                self.metrics.vector_embeddings_created += len(chunks)
                 
-                # Store in vector database
-                await self.vector_store.add_vectors([{
-                    "id": f"{symbol}_overview_{i}_{int(time.time())}",
-                    "vector": embedding,
-                    "metadata": metadata,
-                    "content": chunk
-                }])
-            
-            self.metrics.vector_embeddings_created += len(chunks)
-            
-        except Exception as e:
-            logger.error(f"Error storing overview vectors for {symbol}: {e}")
+            except Exception as e:
+                logger.error(f"Error storing overview vectors for {symbol}: {e}")
     
     async def _store_earnings_data(self, data: Dict, symbol: str):
         """Store earnings data"""
         try:
             # Store quarterly earnings
             if "quarterlyEarnings" in data:
-                for earnings in data["quarterlyEarnings"]:
-                    await self.db.async_execute_query("""
-                        INSERT INTO earnings_data (ticker, fiscal_date_ending, reported_eps, 
-                                                 estimated_eps, surprise, surprise_percentage, source)
-                        VALUES ($1, $2, $3, $4, $5, $6, $7)
-                        ON CONFLICT (ticker, fiscal_date_ending) DO UPDATE SET
-                            reported_eps = EXCLUDED.reported_eps,
-                            estimated_eps = EXCLUDED.estimated_eps,
-                            surprise = EXCLUDED.surprise,
-                            surprise_percentage = EXCLUDED.surprise_percentage
-                    """, (symbol, earnings.get('fiscalDateEnding'), 
-                         float(earnings.get('reportedEPS', 0)),
-                         float(earnings.get('estimatedEPS', 0)),
-                         float(earnings.get('surprise', 0)),
-                         float(earnings.get('surprisePercentage', 0)),
-                         'alpha_vantage'))
+                rows = [
+                    (symbol, earnings.get('fiscalDateEnding'), 
+                     float(earnings.get('reportedEPS', 0)),
+                     float(earnings.get('estimatedEPS', 0)),
+                     float(earnings.get('surprise', 0)),
+                     float(earnings.get('surprisePercentage', 0)),
+                     'alpha_vantage')
+                    for earnings in data["quarterlyEarnings"]
+                ]
+                await self._executemany_hot("earnings_upsert", rows)
             
         except Exception as e:
             logger.error(f"Error storing earnings data for {symbol}: {e}")
     
+    async def _load_news_hwm(self) -> Dict[str, datetime]:
+        """Load the latest stored published_at per news source"""
+        if self.pool is None:
+            await self.setup()
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT source, max(published_at) AS hwm FROM news_headlines GROUP BY source"
+            )
+        return {
+            row['source']: row['hwm'].replace(tzinfo=None)
+            for row in rows if row['hwm'] is not None
+        }
+    
+    async def _stored_news_urls(self, urls: List[str]) -> Set[str]:
+        """Return the subset of urls already present in news_headlines"""
+        if not urls:
+            return set()
+        if self.pool is None:
+            await self.setup()
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch("SELECT url FROM news_headlines WHERE url = ANY($1::text[])", urls)
+        return {row['url'] for row in rows}
+    
     async def _store_news_sentiment_data(self, data: Dict):
         """Store news sentiment data"""
         try:
             if "feed" in data:
-                for article in data["feed"]:
-                    # Store headline
-                    headline_id = await self.db.async_fetch_scalar("""
-                        INSERT INTO news_headlines (ticker, headline, url, source, published_at)
-                        VALUES ($1, $2, $3, $4, $5)
-                        ON CONFLICT (url) DO UPDATE SET headline = EXCLUDED.headline
-                        RETURNING id
-                    """, (
-                        article.get('ticker_sentiment', [{}])[0].get('ticker', '') if article.get('ticker_sentiment') else '',
-                        article.get('title', ''),
-                        article.get('url', ''),
-                        article.get('source', 'alpha_vantage'),
-                        datetime.fromisoformat(article.get('time_published', datetime.now().isoformat()))
-                    ))
+                if self._news_hwm is None:
+                    self._news_hwm = await self._load_news_hwm()
+                
+                # Parse all publish times in one pass; missing or malformed ones are stored as NULL
+                published = [
+                    None if pd.isna(ts) else ts
+                    for ts in pd.to_datetime(
+                        [article.get('time_published') for article in data["feed"]],
+                        format="%Y%m%dT%H%M%S",
+                        errors="coerce"
+                    ).to_pydatetime()
+                ]
+                
+                # Articles at or below their source's high-water mark, or without a publish time, may already be stored;
+                # confirm by url so only those are skipped for re-embedding
+                maybe_stored = [
+                    article.get('url', '')
+                    for article, published_at in zip(data["feed"], published)
+                    if published_at is None
+                    or published_at <= self._news_hwm.get(article.get('source', 'alpha_vantage'), datetime.min)
+                ]
+                stored_urls = await self._stored_news_urls([url for url in maybe_stored if url])
+                is_new = [article.get('url', '') not in stored_urls for article in data["feed"]]
+                
+                if stored_urls:
+                    logger.info(f"Skipping embedding for {len(stored_urls)} already-stored news articles")
+                
+                # Chunk the new articles in one batch
+                new_chunks = iter(self._chunk_texts(
+                    [self._news_text(article) for article, new in zip(data["feed"], is_new) if new],
+                    max_length=350
+                ))
+                
+                for article, published_at, new in zip(data["feed"], published, is_new):
+                    chunks = next(new_chunks) if new else []
+                    
+                    # Upsert every headline; embed only new articles while it is stored
+                    headline_id, embeddings = await asyncio.gather(
+                        self._fetch_hot_scalar(
+                            "headline_upsert_returning",
+                            article.get('ticker_sentiment', [{}])[0].get('ticker', '') if article.get('ticker_sentiment') else '',
+                            article.get('title', ''),
+                            article.get('url', ''),
+                            article.get('source', 'alpha_vantage'),
+                            published_at
+                        ),
+                        self._embed_chunks(chunks)
+                    )
                     
-                    # Store sentiment
+                    # Store sentiment and vectors concurrently
                     overall_sentiment = article.get('overall_sentiment_label', 'Neutral')
                     sentiment_score = article.get('overall_sentiment_score', 0)
                     
-                    await self.db.async_execute_query("""
-                        INSERT INTO news_sentiment (headline_id, sentiment_score, sentiment_label, confidence, model_version)
-                        VALUES ($1, $2, $3, $4, $5)
-                        ON CONFLICT (headline_id) DO UPDATE SET
-                            sentiment_score = EXCLUDED.sentiment_score,
-                            sentiment_label = EXCLUDED.sentiment_label
-                    """, (headline_id, float(sentiment_score), overall_sentiment, 0.8, 'alpha_vantage'))
+                    await asyncio.gather(
+                        self._execute_hot(
+                            "sentiment_upsert",
+                            headline_id, float(sentiment_score), overall_sentiment, 0.8, 'alpha_vantage'
+                        ),
+                        self._store_news_vectors(article, published_at, chunks, embeddings)
+                    )
                     
-                    # Store in vector database
-                    await self._store_news_vectors(article)
+                    # Advance the source's high-water mark once the article is stored
+                    source = article.get('source', 'alpha_vantage')
+                    if published_at is not None and published_at > self._news_hwm.get(source, datetime.min):
+                        self._news_hwm[source] = published_at
             
         except Exception as e:
             logger.error(f"Error storing news sentiment data: {e}")
     
-    async def _store_news_vectors(self, article: Dict):
-        """Store news article in vector database"""
+    async def _embed_chunks(self, chunks: List[str]) -> List[Any]:
+        """Embed pre-chunked text in a worker thread, without storing it"""
+        if not chunks:
+            return []
         try:
-            content = f"""
-            Title: {article.get('title', '')}
-            Summary: {article.get('summary', '')}
-            Source: {article.get('source', '')}
-            Sentiment: {article.get('overall_sentiment_label', 'Neutral')}
-            """
-            
-            chunks = self.embedder.create_chunks(content, max_length=350)
-            
-            for i, chunk in enumerate(chunks):
-                embedding = await self.embedder.embed_text(chunk)
+            # The embedder is synchronous; run it off the event loop so DB writes can overlap it
+            return await asyncio.to_thread(self.embedder.embed_batch, chunks)
+        except Exception as e:
+            logger.error(f"Error embedding chunks: {e}")
+            return []
+    
+    async def _store_news_vectors(self, article: Dict, published_at: Optional[datetime],
+                                  chunks: List[str], embeddings: List[Any]):
+        """Store embedded news article chunks in vector database"""
+        try:
+            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+                if embedding is None:
+                    continue
                 
                 metadata = {
                     "data_type": "news_article",
                     "source": article.get('source', 'alpha_vantage'),
                     "sentiment_label": article.get('overall_sentiment_label', 'Neutral'),
                     "sentiment_score": article.get('overall_sentiment_score', 0),
-                    "published_at": article.get('time_published', datetime.now().isoformat()),
+                    "published_at": article.get('time_published') or (published_at.isoformat() if published_at else ''),
                     "chunk_index": i,
                     "url": article.get('url', ''),
                     "tickers": [t.get('ticker', '') for t in article.get('ticker_sentiment', [])]
                 }
                 
                 await self.vector_store.add_vectors([{
-                    "id": f"news_{int(time.time())}_{i}",
+                    "id": f"news_{self._run_ts}_{next(self._id_gen)}",
                     "vector": embedding,
                     "metadata": metadata,
                     "content": chunk
@@ -971,42 +1291,31 @@ class EnhancedAlphaVantageCollector:
         }
         
         try:
-            # 1. Core market data
-            logger.info("📊 Collecting market data...")
-            results["market_data"]["daily"] = await self.collect_daily_prices(symbols)
-            
-            # 2. Fundamental data  
-            logger.info("📋 Collecting fundamental data...")
-            results["fundamental_data"]["overviews"] = await self.collect_company_overviews(symbols[:5])
-            results["fundamental_data"]["earnings"] = await self.collect_earnings_data(symbols[:5])
-            
-            # 3. News and sentiment
-            logger.info("📰 Collecting news and sentiment...")
-            results["news_sentiment"] = await self.collect_news_sentiment(tickers=symbols[:10])
-            
-            # 4. Top gainers/losers
-            logger.info("📈📉 Collecting top gainers and losers...")
-            results["top_movers"] = await self.collect_top_gainers_losers()
-            
-            # 5. Forex data
-            logger.info("💱 Collecting forex data...")
-            results["forex_data"] = await self.collect_forex_data()
-            
-            # 6. Crypto data
-            logger.info("₿ Collecting crypto data...")
-            results["crypto_data"] = await self.collect_crypto_data()
-            
-            # 7. Commodities
-            logger.info("🛢️ Collecting commodities data...")
-            results["commodities_data"] = await self.collect_commodities_data()
-            
-            # 8. Technical indicators
-            logger.info("📊 Collecting technical indicators...")
-            results["technical_indicators"] = await self.collect_technical_indicators(symbols[:3])
+            # Sub-collections are independent; run them concurrently and let
+            # _rate_limit space the underlying API calls
+            logger.info("📊 Launching market, fundamental, news, forex, crypto, commodities, technical and economic collection...")
+            async with asyncio.TaskGroup() as tg:
+                t_market = tg.create_task(self.collect_daily_prices(symbols))
+                t_overviews = tg.create_task(self.collect_company_overviews(symbols[:5]))
+                t_earnings = tg.create_task(self.collect_earnings_data(symbols[:5]))
+                t_news = tg.create_task(self.collect_news_sentiment(tickers=symbols[:10]))
+                t_movers = tg.create_task(self.collect_top_gainers_losers())
+                t_forex = tg.create_task(self.collect_forex_data())
+                t_crypto = tg.create_task(self.collect_crypto_data())
+                t_commodities = tg.create_task(self.collect_commodities_data())
+                t_technical = tg.create_task(self.collect_technical_indicators(symbols[:3]))
+                t_economic = tg.create_task(self.collect_economic_indicators())
             
-            # 9. Economic indicators
-            logger.info("🏛️ Collecting economic indicators...")
-            results["economic_indicators"] = await self.collect_economic_indicators()
+            results["market_data"]["daily"] = t_market.result()
+            results["fundamental_data"]["overviews"] = t_overviews.result()
+            results["fundamental_data"]["earnings"] = t_earnings.result()
+            results["news_sentiment"] = t_news.result()
+            results["top_movers"] = t_movers.result()
+            results["forex_data"] = t_forex.result()
+            results["crypto_data"] = t_crypto.result()
+            results["commodities_data"] = t_commodities.result()
+            results["technical_indicators"] = t_technical.result()
+            results["economic_indicators"] = t_economic.result()
             
             # Compile final metrics
             results["metrics"] = self.metrics.get_summary()
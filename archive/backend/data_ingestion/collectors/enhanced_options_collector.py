@@ -5,19 +5,77 @@ Supports Yahoo Finance, Alpaca, TD Ameritrade, and Tradier APIs.
 
 import logging
 import asyncio
+import atexit
+import threading
 import yfinance as yf
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ..config.settings import settings
+from ..db.postgres_handler import db
 from ..utils.logging_utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# Keep-alive pool size per provider host; each provider gets its own pool
+PROVIDER_POOL_SIZES = {
+    "yahoo": 16,
+    "alpaca": 16,
+    "td_ameritrade": 16,
+    "tradier": 16,
+    "polygon": 16,
+}
+
+# Columnar layout of processed options chains
+OPTIONS_SCHEMA = pa.schema([
+    ('ticker', pa.string()),
+    ('option_type', pa.string()),
+    ('expiration_date', pa.string()),
+    ('strike', pa.float64()),
+    ('bid', pa.float64()),
+    ('ask', pa.float64()),
+    ('last', pa.float64()),
+    ('volume', pa.int64()),
+    ('open_interest', pa.int64()),
+    ('implied_volatility', pa.float64()),
+    ('contract_symbol', pa.string()),
+    ('timestamp', pa.string()),
+    ('source', pa.string()),
+])
+
+# Yahoo Finance column -> schema column for numeric fields
+YAHOO_NUMERIC_COLUMNS = {
+    'strike': ('strike', np.float64),
+    'bid': ('bid', np.float64),
+    'ask': ('ask', np.float64),
+    'lastPrice': ('last', np.float64),
+    'volume': ('volume', np.int64),
+    'openInterest': ('open_interest', np.int64),
+    'impliedVolatility': ('implied_volatility', np.float64),
+}
+
+# options_data column -> (table column, Arrow type) used when flushing via COPY
+OPTIONS_DB_COLUMNS = {
+    'ticker': ('ticker', None),
+    'option_type': ('option_type', None),
+    'expiration_date': ('expiration_date', pa.date32()),
+    'strike_price': ('strike', None),
+    'timestamp': ('timestamp', pa.timestamp('us')),
+    'bid': ('bid', None),
+    'ask': ('ask', None),
+    'last_price': ('last', None),
+    'volume': ('volume', None),
+    'open_interest': ('open_interest', None),
+    'implied_volatility': ('implied_volatility', None),
+    'source': ('source', None),
+}
+
 class EnhancedOptionsFlowCollector:
     """Enhanced options flow collector with multiple provider support."""
     
@@ -26,17 +84,31 @@ class EnhancedOptionsFlowCollector:
         self.providers = self._get_available_providers()
         logger.info(f"Initialized with providers: {', '.join(self.providers)}")
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def setup_sessions(self):
-        """Setup HTTP sessions with retry strategies."""
-        self.session = requests.Session()
+        """Setup one HTTP session per provider so a stalled provider cannot drain another's pool."""
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.sessions: Dict[str, requests.Session] = {}
+        for provider, pool_size in PROVIDER_POOL_SIZES.items():
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=pool_size, max_retries=retry_strategy)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self.sessions[provider] = session
+    
+    def close(self):
+        """Close all provider sessions and their keep-alive pools."""
+        for session in self.sessions.values():
+            session.close()
     
     def _get_available_providers(self) -> List[str]:
         """Determine which providers are available based on configuration."""
@@ -70,19 +142,31 @@ class EnhancedOptionsFlowCollector:
         Returns:
             List of options data dictionaries
         """
+        return self.collect_yahoo_options_table(ticker).to_pylist()
+    
+    def collect_yahoo_options_table(self, ticker: str) -> pa.Table:
+        """
+        Collect Yahoo Finance options chains as a single Arrow table.
+        
+        Args:
+            ticker: Stock ticker symbol
+            
+        Returns:
+            Arrow table with OPTIONS_SCHEMA columns (empty on failure)
+        """
         try:
             logger.info(f"Collecting Yahoo Finance options data for {ticker}")
             
             # Create yfinance ticker object
-            yf_ticker = yf.Ticker(ticker)
+            yf_ticker = yf.Ticker(ticker, session=self.sessions["yahoo"])
             
             # Get options expiration dates
             expirations = yf_ticker.options
             if not expirations:
                 logger.warning(f"No options expiration dates found for {ticker}")
-                return []
+                return OPTIONS_SCHEMA.empty_table()
             
-            all_options_data = []
+            tables = []
             
             # Process first few expiration dates to avoid rate limits
             for exp_date in expirations[:3]:  # Limit to first 3 expirations
@@ -92,58 +176,103 @@ class EnhancedOptionsFlowCollector:
                     
                     # Process calls
                     if hasattr(options_chain, 'calls') and not options_chain.calls.empty:
-                        calls_data = self._process_yahoo_options_data(
+                        tables.append(self._process_yahoo_options_data(
                             options_chain.calls, ticker, exp_date, 'call'
-                        )
-                        all_options_data.extend(calls_data)
+                        ))
                     
                     # Process puts
                     if hasattr(options_chain, 'puts') and not options_chain.puts.empty:
-                        puts_data = self._process_yahoo_options_data(
+                        tables.append(self._process_yahoo_options_data(
                             options_chain.puts, ticker, exp_date, 'put'
-                        )
-                        all_options_data.extend(puts_data)
+                        ))
                         
                 except Exception as e:
                     logger.warning(f"Failed to process options for {ticker} exp {exp_date}: {e}")
                     continue
             
-            logger.info(f"Collected {len(all_options_data)} Yahoo Finance options records for {ticker}")
-            return all_options_data
+            table = pa.concat_tables(tables) if tables else OPTIONS_SCHEMA.empty_table()
+            logger.info(f"Collected {table.num_rows} Yahoo Finance options records for {ticker}")
+            return table
             
         except Exception as e:
             logger.error(f"Failed to collect Yahoo Finance options data for {ticker}: {e}")
-            return []
+            return OPTIONS_SCHEMA.empty_table()
     
     def _process_yahoo_options_data(self, options_df: pd.DataFrame, ticker: str, 
-                                  exp_date: str, option_type: str) -> List[Dict[str, Any]]:
-        """Process Yahoo Finance options DataFrame into standard format."""
-        options_data = []
-        
-        for _, row in options_df.iterrows():
-            try:
-                option_data = {
-                    'ticker': ticker,
-                    'option_type': option_type,
-                    'expiration_date': exp_date,
-                    'strike': float(row.get('strike', 0)),
-                    'bid': float(row.get('bid', 0)),
-                    'ask': float(row.get('ask', 0)),
-                    'last': float(row.get('lastPrice', 0)),
-                    'volume': int(row.get('volume', 0)) if pd.notna(row.get('volume')) else 0,
-                    'open_interest': int(row.get('openInterest', 0)) if pd.notna(row.get('openInterest')) else 0,
-                    'implied_volatility': float(row.get('impliedVolatility', 0)) if pd.notna(row.get('impliedVolatility')) else 0,
-                    'contract_symbol': row.get('contractSymbol', ''),
-                    'timestamp': datetime.now().isoformat(),
-                    'source': 'yahoo_finance'
-                }
-                options_data.append(option_data)
-                
-            except Exception as e:
-                logger.warning(f"Failed to process Yahoo option row: {e}")
-                continue
-        
-        return options_data
+                                  exp_date: str, option_type: str) -> pa.Table:
+        """Convert a Yahoo Finance options DataFrame into an OPTIONS_SCHEMA Arrow table."""
+        n = len(options_df)
+        columns = {
+            'ticker': [ticker] * n,
+            'option_type': [option_type] * n,
+            'expiration_date': [exp_date] * n,
+        }
+        
+        # Column-wise numeric coercion; missing or NaN values become 0
+        for yahoo_col, (col, dtype) in YAHOO_NUMERIC_COLUMNS.items():
+            if yahoo_col in options_df:
+                values = pd.to_numeric(options_df[yahoo_col], errors='coerce').fillna(0)
+                columns[col] = values.to_numpy(dtype=dtype)
+            else:
+                columns[col] = np.zeros(n, dtype=dtype)
+        
+        if 'contractSymbol' in options_df:
+            columns['contract_symbol'] = options_df['contractSymbol'].fillna('').astype(str).to_numpy()
+        else:
+            columns['contract_symbol'] = [''] * n
+        
+        columns['timestamp'] = [datetime.now().isoformat()] * n
+        columns['source'] = ['yahoo_finance'] * n
+        
+        return pa.Table.from_pydict(columns, schema=OPTIONS_SCHEMA)
+    
+    async def store_options_tables(self, tables: List[pa.Table]) -> int:
+        """
+        Flush collected options tables to options_data with a single COPY.
+        
+        Rows are copied into a temp table and upserted from there so existing
+        (ticker, option_type, expiration_date, strike_price, timestamp) rows are skipped.
+        
+        Returns:
+            Number of rows inserted into options_data
+        """
+        tables = [table for table in tables if table.num_rows]
+        if not tables:
+            return 0
+        
+        final = pa.concat_tables(tables)
+        db_columns = list(OPTIONS_DB_COLUMNS)
+        arrays = []
+        for col, cast_type in OPTIONS_DB_COLUMNS.values():
+            array = final.column(col)
+            arrays.append((array.cast(cast_type) if cast_type is not None else array).to_pylist())
+        
+        try:
+            async with db.get_async_connection() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        "CREATE TEMP TABLE options_data_stage "
+                        "(LIKE options_data INCLUDING DEFAULTS) ON COMMIT DROP"
+                    )
+                    await conn.copy_records_to_table(
+                        'options_data_stage',
+                        records=zip(*arrays),
+                        columns=db_columns
+                    )
+                    status = await conn.execute(f"""
+                        INSERT INTO options_data ({', '.join(db_columns)})
+                        SELECT {', '.join(db_columns)} FROM options_data_stage
+                        ON CONFLICT DO NOTHING
+                    """)
+            
+            # Status is "INSERT 0 <rows>"; rows skipped by ON CONFLICT are not counted
+            stored_count = int(status.split()[-1])
+            logger.info(f"Stored {stored_count} of {final.num_rows} copied options records in options_data")
+            return stored_count
+            
+        except Exception as e:
+            logger.error(f"Failed to store options tables: {e}")
+            return 0
     
     def collect_alpaca_options_data(self, ticker: str) -> List[Dict[str, Any]]:
         """
@@ -166,52 +295,71 @@ class EnhancedOptionsFlowCollector:
             logger.error(f"Failed to collect Alpaca options data for {ticker}: {e}")
             return []
     
-    def collect_options_data_multi_provider(self, tickers: List[str]) -> List[Dict[str, Any]]:
+    async def collect_options_data_multi_provider(self, tickers: List[str]) -> int:
         """
-        Collect options data from multiple providers with fallback logic.
+        Collect options data from multiple providers and flush it to options_data.
+        
+        Every provider's chains are kept as Arrow tables and written together
+        by store_options_tables.
         
         Args:
             tickers: List of ticker symbols
             
         Returns:
-            Combined options data from all available providers
+            Number of options records inserted
         """
-        all_options_data = []
+        tables = []
         
         for ticker in tickers:
-            ticker_data = []
-            
             # Try each provider in priority order
             for provider in self.providers:
                 try:
                     if provider == "yahoo":
-                        provider_data = self.collect_yahoo_options_data(ticker)
+                        table = await asyncio.to_thread(self.collect_yahoo_options_table, ticker)
                     elif provider == "alpaca":
-                        provider_data = self.collect_alpaca_options_data(ticker)
+                        table = pa.Table.from_pylist(self.collect_alpaca_options_data(ticker), schema=OPTIONS_SCHEMA)
                     elif provider == "tradier":
                         # Use existing Tradier implementation from original collector
-                        provider_data = []  # Placeholder
+                        continue  # Placeholder
                     else:
                         continue
                     
-                    if provider_data:
-                        ticker_data.extend(provider_data)
+                    if table.num_rows:
+                        tables.append(table)
                         logger.info(f"Successfully collected data from {provider} for {ticker}")
                         
                 except Exception as e:
                     logger.warning(f"Provider {provider} failed for {ticker}: {e}")
                     continue
-            
-            all_options_data.extend(ticker_data)
         
-        return all_options_data
+        return await self.store_options_tables(tables)
 
 # Global instance for compatibility
 enhanced_options_flow_collector = EnhancedOptionsFlowCollector()
 
-def collect_options_flow_data(tickers: List[str]) -> List[Dict[str, Any]]:
-    """Compatibility function for existing pipeline."""
-    return enhanced_options_flow_collector.collect_options_data_multi_provider(tickers)
+# Long-lived event loop shared by the sync wrapper, so the asyncpg pool survives across calls
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the background event loop."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="enhanced-options-loop", daemon=True).start()
+            atexit.register(lambda: loop.call_soon_threadsafe(loop.stop))
+            _background_loop = loop
+        return _background_loop
+
+
+def collect_options_flow_data(tickers: List[str]) -> int:
+    """Compatibility function for existing pipeline; returns the number of records stored."""
+    return asyncio.run_coroutine_threadsafe(
+        enhanced_options_flow_collector.collect_options_data_multi_provider(tickers),
+        _get_background_loop()
+    ).result()
 
 if __name__ == "__main__":
     # Test the enhanced collector
@@ -5,9 +5,20 @@ Monitors Coinbase, Binance, Solana, and other critical infrastructure.
 
 import logging
 import asyncio
+import csv
+import gzip
+import io
 import json
+import socket
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse
+import aiohttp
+import numpy as np
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -18,11 +29,195 @@ from ..utils.logging_utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# C-accelerated JSON for status/RPC payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Async S3/MinIO client for archiving raw payloads
+try:
+    import aioboto3
+    AIOBOTO3_AVAILABLE = True
+except ImportError:
+    AIOBOTO3_AVAILABLE = False
+    aioboto3 = None
+
+# libuv-based event loop for the private collection loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON response body, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a JSON request body, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+# Seconds a health-check result stays fresh; status pages move on the order of minutes
+CHECK_CACHE_TTLS = {
+    'coinbase': 60,
+    'binance': 30,
+    'solana': 15,
+}
+# Failed checks are cached briefly so a down endpoint isn't hammered
+ERROR_CACHE_TTL = 5
+
+# (connect, read) timeout for the Binance liveness probe
+BINANCE_PING_TIMEOUT = (1.0, 2.0)
+
+# Coinbase incident statuses that no longer count as active
+COINBASE_TERMINAL_STATUSES = frozenset(('resolved', 'postmortem'))
+
+# Coinbase page status -> severity; anything else is medium with active incidents, low otherwise
+COINBASE_SEVERITY = {
+    'major_outage': 'critical',
+    'critical': 'critical',
+    'partial_outage': 'high',
+    'degraded_performance': 'high',
+}
+
+# Solana congestion rules, first match wins: predicate(tps, slot_time) -> (severity, incident_type, note)
+SOLANA_RULES = [
+    (lambda tps, slot_time: tps < 1000, ('medium', 'low_throughput', " - Low throughput detected")),
+    (lambda tps, slot_time: slot_time > 1.0, ('medium', 'slow_slots', " - Slow slot processing")),
+]
+SOLANA_HEALTHY = ('low', 'normal_operation', "")
+
+# Server-side prepared batch upserts; rows arrive as one array per column and are unnested.
+# Repeated observations coalesce onto one row (see migration 005): open incidents per
+# platform/type/severity, resolved ones per platform/type/severity/day.
+_INFRA_UPSERT_HEAD = """
+    INSERT INTO infra_incidents
+    (platform, incident_type, description, severity, started_at, resolved_at, source, raw_uri)
+    SELECT * FROM unnest($1::varchar[], $2::varchar[], $3::text[], $4::varchar[],
+                         $5::timestamp[], $6::timestamp[], $7::varchar[], $8::text[])
+"""
+INFRA_UPSERT_STATEMENTS = {
+    'infra_ins': _INFRA_UPSERT_HEAD + """
+    ON CONFLICT (platform, incident_type, severity) WHERE resolved_at IS NULL
+    DO UPDATE SET description = EXCLUDED.description, last_seen_at = NOW()
+    RETURNING id
+""",
+    'infra_ins_resolved': _INFRA_UPSERT_HEAD + """
+    ON CONFLICT (platform, incident_type, severity, (started_at::date)) WHERE resolved_at IS NOT NULL
+    DO UPDATE SET description = EXCLUDED.description, resolved_at = EXCLUDED.resolved_at,
+                  last_seen_at = NOW()
+    RETURNING id
+""",
+}
+INFRA_UPSERT_EXECUTE = (
+    "EXECUTE {} (%s::varchar[], %s::varchar[], %s::text[], %s::varchar[], "
+    "%s::timestamp[], %s::timestamp[], %s::varchar[], %s::text[])"
+)
+
+# Connections from the shared sync pool that already hold the prepared upserts; module-level
+# because the pool is shared by every collector instance
+_PREPARED_CONNS = weakref.WeakSet()
+
+
+# COPY-based bulk path: rows land in a transaction-scoped staging table and are merged
+# with the same coalescing rules, keeping the newest row per key within the batch
+INFRA_COLUMNS = "platform, incident_type, description, severity, started_at, resolved_at, source, raw_uri"
+INFRA_STAGE_DDL = """
+    CREATE TEMP TABLE infra_incidents_stage (
+        platform VARCHAR(50),
+        incident_type VARCHAR(50),
+        description TEXT,
+        severity VARCHAR(10),
+        started_at TIMESTAMP,
+        resolved_at TIMESTAMP,
+        source VARCHAR(30),
+        raw_uri TEXT
+    ) ON COMMIT DROP
+"""
+INFRA_STAGE_MERGES = (
+    f"""
+    INSERT INTO infra_incidents ({INFRA_COLUMNS})
+    SELECT DISTINCT ON (platform, incident_type, severity) {INFRA_COLUMNS}
+    FROM infra_incidents_stage
+    WHERE resolved_at IS NULL
+    ORDER BY platform, incident_type, severity, started_at DESC
+    ON CONFLICT (platform, incident_type, severity) WHERE resolved_at IS NULL
+    DO UPDATE SET description = EXCLUDED.description, last_seen_at = NOW()
+    """,
+    f"""
+    INSERT INTO infra_incidents ({INFRA_COLUMNS})
+    SELECT DISTINCT ON (platform, incident_type, severity, started_at::date) {INFRA_COLUMNS}
+    FROM infra_incidents_stage
+    WHERE resolved_at IS NOT NULL
+    ORDER BY platform, incident_type, severity, started_at::date, started_at DESC
+    ON CONFLICT (platform, incident_type, severity, (started_at::date)) WHERE resolved_at IS NOT NULL
+    DO UPDATE SET description = EXCLUDED.description, resolved_at = EXCLUDED.resolved_at,
+                  last_seen_at = NOW()
+    """,
+)
+
+# Shape of every incident record; _mk_incident copies it and fills the variable fields
+_INCIDENT_TEMPLATE = {
+    'platform': None,
+    'incident_type': None,
+    'description': None,
+    'severity': 'low',
+    'started_at': None,
+    'resolved_at': None,
+    'source': None
+}
+
+
+def _mk_incident(platform: str, source: str, ts: datetime, incident_type: str, description: str,
+                 severity: str = 'low', resolved_at: Optional[datetime] = None) -> Dict[str, Any]:
+    """Build an incident record from the shared template."""
+    incident = _INCIDENT_TEMPLATE.copy()
+    incident.update(
+        platform=platform,
+        incident_type=incident_type,
+        description=description,
+        severity=severity,
+        started_at=ts,
+        resolved_at=resolved_at,
+        source=source
+    )
+    return incident
+
+
+def _error_incident(platform: str, source: str, exc: Exception, ts: datetime,
+                    subject: str = 'status') -> Dict[str, Any]:
+    """Build the open api_error incident recorded when a check can't reach its platform."""
+    logger.error(f"Failed to check {platform.capitalize()} {subject}: {exc}")
+    return _mk_incident(platform, source, ts, 'api_error',
+                        f"Failed to fetch {subject}: {str(exc)}", severity='medium')
+
+
 class InfrastructureCollector:
     """Collects infrastructure status data from exchanges and blockchain networks."""
     
-    def __init__(self):
+    # Constant JSON-RPC request for the last 10 Solana performance samples, encoded once
+    _SOL_BODY = _dumps({
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "getRecentPerformanceSamples",
+        "params": [10]
+    })
+    
+    def __init__(self, warmup: bool = False):
         self.session = requests.Session()
+        self.session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'})
         
         # Setup retry strategy
         retry_strategy = Retry(
@@ -30,11 +225,120 @@ class InfrastructureCollector:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep one pool per monitored host so connections survive across cycles
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=retry_strategy,
+            pool_block=False
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        
+        # check key -> (expires_at monotonic, incident dict)
+        self._cache: Dict[str, tuple] = {}
+        
+        if warmup:
+            self.warmup()
+        
+        # Pooled aiohttp session for the async collection cycle, created lazily per event loop
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Private event loop reused by the sync entry points instead of asyncio.run per call
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+    
+    def warmup(self):
+        """Prime DNS and pooled keep-alive connections to every monitored host."""
+        for url in (settings.COINBASE_STATUS_URL, settings.BINANCE_STATUS_URL, settings.SOLANA_RPC_URL):
+            try:
+                parsed = urlparse(url)
+                socket.getaddrinfo(parsed.hostname, parsed.port or 443, type=socket.SOCK_STREAM)
+                self.session.head(url, timeout=5)
+            except (OSError, requests.RequestException) as e:
+                logger.debug(f"Warmup of {url} failed: {e}")
+    
+    def _cache_lookup(self, key: str, ts: datetime) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        # Hand back a copy stamped with the current observation time; a resolved result
+        # resolves at that time too rather than at the original check
+        hit = {**entry[1], 'started_at': ts}
+        if hit.get('resolved_at') is not None:
+            hit['resolved_at'] = ts
+        return hit
+    
+    def _cache_store(self, key: str, ttl: float, result: Dict[str, Any]):
+        if result.get('incident_type') == 'api_error':
+            ttl = min(ttl, ERROR_CACHE_TTL)
+        self._cache[key] = (time.monotonic() + ttl, result)
+    
+    def _cached(self, key: str, ttl: float, fn, refresh_cache: bool = False,
+                ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Return a fresh cached result for key, otherwise call fn(ts) and cache it for ttl seconds."""
+        ts = ts or datetime.now()
+        if not refresh_cache:
+            hit = self._cache_lookup(key, ts)
+            if hit is not None:
+                logger.debug(f"Serving {key} check from cache")
+                return hit
+        result = fn(ts)
+        self._cache_store(key, ttl, result)
+        return result
+    
+    async def _async_cached(self, key: str, ttl: float, fn, refresh_cache: bool = False,
+                            ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Async counterpart of _cached; fn is a coroutine function."""
+        ts = ts or datetime.now()
+        if not refresh_cache:
+            hit = self._cache_lookup(key, ts)
+            if hit is not None:
+                logger.debug(f"Serving {key} check from cache")
+                return hit
+        result = await fn(ts)
+        self._cache_store(key, ttl, result)
+        return result
+    
+    def check_coinbase_status(self, refresh_cache: bool = False,
+                              ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Check Coinbase exchange status."""
+        return self._cached('coinbase', CHECK_CACHE_TTLS['coinbase'],
+                            self._fetch_coinbase_status, refresh_cache, ts)
+    
+    def check_binance_status(self, refresh_cache: bool = False, verify_json: bool = False,
+                             ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Check Binance exchange status."""
+        return self._cached('binance', CHECK_CACHE_TTLS['binance'],
+                            lambda now: self._fetch_binance_status(now, verify_json), refresh_cache, ts)
+    
+    def check_solana_network_health(self, refresh_cache: bool = False,
+                                    ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Check Solana network health and congestion."""
+        return self._cached('solana', CHECK_CACHE_TTLS['solana'],
+                            self._fetch_solana_network_health, refresh_cache, ts)
+    
+    async def async_check_coinbase_status(self, refresh_cache: bool = False,
+                                          ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Check Coinbase exchange status without blocking the event loop."""
+        return await self._async_cached('coinbase', CHECK_CACHE_TTLS['coinbase'],
+                                        self._async_fetch_coinbase_status, refresh_cache, ts)
+    
+    async def async_check_binance_status(self, refresh_cache: bool = False, verify_json: bool = False,
+                                         ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Check Binance exchange status without blocking the event loop."""
+        return await self._async_cached('binance', CHECK_CACHE_TTLS['binance'],
+                                        lambda now: self._async_fetch_binance_status(now, verify_json),
+                                        refresh_cache, ts)
+    
+    async def async_check_solana_network_health(self, refresh_cache: bool = False,
+                                                ts: Optional[datetime] = None) -> Dict[str, Any]:
+        """Check Solana network health without blocking the event loop."""
+        return await self._async_cached('solana', CHECK_CACHE_TTLS['solana'],
+                                        self._async_fetch_solana_network_health, refresh_cache, ts)
     
-    def check_coinbase_status(self) -> Dict[str, Any]:
+    def _fetch_coinbase_status(self, ts: datetime) -> Dict[str, Any]:
         """Check Coinbase exchange status."""
         try:
             logger.info("Checking Coinbase status")
@@ -42,178 +346,241 @@ class InfrastructureCollector:
             response = self.session.get(settings.COINBASE_STATUS_URL, timeout=15)
             response.raise_for_status()
             
-            status_data = response.json()
-            
-            # Parse Coinbase status
-            page = status_data.get('page', {})
-            status = page.get('status', 'unknown')
-            
-            # Check for active incidents
-            incidents = status_data.get('incidents', [])
-            active_incidents = [inc for inc in incidents if inc.get('status') not in ['resolved', 'postmortem']]
-            
-            # Determine severity
-            severity = 'low'
-            if status in ['major_outage', 'critical']:
-                severity = 'critical'
-            elif status in ['partial_outage', 'degraded_performance']:
-                severity = 'high'
-            elif active_incidents:
-                severity = 'medium'
-            
-            # Create incident record
-            incident_data = {
-                'platform': 'coinbase',
-                'incident_type': 'status_check',
-                'description': f"Status: {status}. Active incidents: {len(active_incidents)}",
-                'severity': severity,
-                'started_at': datetime.now(),
-                'resolved_at': None if severity != 'low' else datetime.now(),
-                'source': 'coinbase_status_api',
-                'raw_data': status_data
-            }
-            
-            logger.info(f"Coinbase status: {status}, severity: {severity}")
-            return incident_data
+            return self._parse_coinbase_status(_loads(response.content), ts)
             
         except Exception as e:
-            logger.error(f"Failed to check Coinbase status: {e}")
-            return {
-                'platform': 'coinbase',
-                'incident_type': 'api_error',
-                'description': f"Failed to fetch status: {str(e)}",
-                'severity': 'medium',
-                'started_at': datetime.now(),
-                'resolved_at': None,
-                'source': 'coinbase_status_api'
-            }
-    
-    def check_binance_status(self) -> Dict[str, Any]:
-        """Check Binance exchange status using ping endpoint."""
+            return _error_incident('coinbase', 'coinbase_status_api', e, ts)
+    
+    def _fetch_binance_status(self, ts: datetime, verify_json: bool = False) -> Dict[str, Any]:
+        """Check Binance exchange status using ping endpoint.
+        
+        The ping is liveness-only, so by default a HEAD with a 2xx is treated as healthy;
+        verify_json fetches and inspects the body instead.
+        """
         try:
             logger.info("Checking Binance status")
             
-            response = self.session.get(settings.BINANCE_STATUS_URL, timeout=15)
+            if not verify_json:
+                response = self.session.head(settings.BINANCE_STATUS_URL, timeout=BINANCE_PING_TIMEOUT)
+                if 200 <= response.status_code < 300:
+                    return self._parse_binance_status({}, ts)
+                return _error_incident(
+                    'binance', 'binance_status_api',
+                    requests.HTTPError(f"{response.status_code} {response.reason}"), ts
+                )
+            
+            response = self.session.get(settings.BINANCE_STATUS_URL, timeout=BINANCE_PING_TIMEOUT)
             response.raise_for_status()
             
-            # Ping endpoint returns empty dict {} if successful
-            status_data = response.json()
-            
-            # If we got a response and it's a dict, Binance is operational
-            if isinstance(status_data, dict):
-                severity = 'low'
-                incident_type = 'normal_operation'
-                description = "Binance API responding normally"
-                resolved_at = datetime.now()
-            else:
-                severity = 'medium'
-                incident_type = 'api_issue'
-                description = "Unexpected response from Binance API"
-                resolved_at = None
-            
-            incident_data = {
-                'platform': 'binance',
-                'incident_type': incident_type,
-                'description': description,
-                'severity': severity,
-                'started_at': datetime.now(),
-                'resolved_at': resolved_at,
-                'source': 'binance_status_api',
-                'raw_data': status_data
-            }
-            
-            logger.info(f"Binance status: {description}, severity: {severity}")
-            return incident_data
+            return self._parse_binance_status(_loads(response.content), ts)
             
         except Exception as e:
-            logger.error(f"Failed to check Binance status: {e}")
-            return {
-                'platform': 'binance',
-                'incident_type': 'api_error',
-                'description': f"Failed to fetch status: {str(e)}",
-                'severity': 'medium',
-                'started_at': datetime.now(),
-                'resolved_at': None,
-                'source': 'binance_status_api'
-            }
-    
-    def check_solana_network_health(self) -> Dict[str, Any]:
+            return _error_incident('binance', 'binance_status_api', e, ts)
+    
+    def _fetch_solana_network_health(self, ts: datetime) -> Dict[str, Any]:
         """Check Solana network health and congestion."""
         try:
             logger.info("Checking Solana network health")
             
-            # Get recent performance samples
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getRecentPerformanceSamples",
-                "params": [10]  # Last 10 samples
-            }
-            
             response = self.session.post(
                 settings.SOLANA_RPC_URL,
-                json=payload,
+                data=self._SOL_BODY,
+                headers=JSON_HEADERS,
                 timeout=15
             )
             response.raise_for_status()
             
-            data = response.json()
+            return self._parse_solana_health(_loads(response.content), ts)
             
-            if 'result' not in data:
-                raise Exception(f"Invalid Solana RPC response: {data}")
+        except Exception as e:
+            return _error_incident('solana', 'solana_rpc', e, ts, 'network health')
+    
+    def run_on_loop(self, coro):
+        """Run a coroutine to completion on the collector's reusable (uvloop when available) event loop."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+            return self._loop.run_until_complete(coro)
+    
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get the pooled aiohttp session, recreating it if closed or bound to another loop."""
+        loop = asyncio.get_running_loop()
+        if (self._async_session is None or self._async_session.closed
+                or self._async_session_loop is not loop):
+            # Cache DNS across cycles and race IPv4/IPv6 so a dead v6 route can't stall a check
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=8,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                happy_eyeballs_delay=0.25,
+                family=socket.AF_UNSPEC
+            )
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+            self._async_session_loop = loop
+        return self._async_session
+    
+    async def close_async_session(self):
+        """Close the pooled aiohttp session."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_session_loop = None
+    
+    async def _async_fetch_coinbase_status(self, ts: datetime) -> Dict[str, Any]:
+        """Check Coinbase exchange status without blocking the event loop."""
+        try:
+            logger.info("Checking Coinbase status")
             
-            samples = data['result']
-            if not samples:
-                raise Exception("No performance samples returned")
+            session = await self._get_async_session()
+            async with session.get(settings.COINBASE_STATUS_URL) as response:
+                response.raise_for_status()
+                status_data = _loads(await response.read())
             
-            # Analyze latest sample
-            latest_sample = samples[0]
-            tps = latest_sample.get('numTransactions', 0) / latest_sample.get('samplePeriodSecs', 1)
-            slot_time = latest_sample.get('samplePeriodSecs', 0)
+            return self._parse_coinbase_status(status_data, ts)
             
-            # Determine network health
-            severity = 'low'
-            incident_type = 'normal_operation'
-            description = f"Solana TPS: {tps:.1f}, Slot time: {slot_time}s"
-            
-            # Check for congestion indicators
-            if tps < 1000:  # Low TPS might indicate issues
-                severity = 'medium'
-                incident_type = 'low_throughput'
-                description += " - Low throughput detected"
-            elif slot_time > 1.0:  # Slow slot times
-                severity = 'medium'
-                incident_type = 'slow_slots'
-                description += " - Slow slot processing"
-            
-            incident_data = {
-                'platform': 'solana',
-                'incident_type': incident_type,
-                'description': description,
-                'severity': severity,
-                'started_at': datetime.now(),
-                'resolved_at': datetime.now() if severity == 'low' else None,
-                'source': 'solana_rpc',
-                'raw_data': {'latest_sample': latest_sample, 'tps': tps}
-            }
-            
-            logger.info(f"Solana network: TPS {tps:.1f}, severity: {severity}")
-            return incident_data
+        except Exception as e:
+            return _error_incident('coinbase', 'coinbase_status_api', e, ts)
+    
+    async def _async_fetch_binance_status(self, ts: datetime, verify_json: bool = False) -> Dict[str, Any]:
+        """Check Binance exchange status without blocking the event loop."""
+        try:
+            logger.info("Checking Binance status")
+            
+            session = await self._get_async_session()
+            timeout = aiohttp.ClientTimeout(sock_connect=BINANCE_PING_TIMEOUT[0], total=BINANCE_PING_TIMEOUT[1])
+            if not verify_json:
+                async with session.head(settings.BINANCE_STATUS_URL, timeout=timeout) as response:
+                    status, reason = response.status, response.reason
+                if 200 <= status < 300:
+                    return self._parse_binance_status({}, ts)
+                return _error_incident('binance', 'binance_status_api',
+                                       aiohttp.ClientError(f"{status} {reason}"), ts)
+            
+            async with session.get(settings.BINANCE_STATUS_URL, timeout=timeout) as response:
+                response.raise_for_status()
+                status_data = _loads(await response.read())
+            
+            return self._parse_binance_status(status_data, ts)
+            
+        except Exception as e:
+            return _error_incident('binance', 'binance_status_api', e, ts)
+    
+    async def _async_fetch_solana_network_health(self, ts: datetime) -> Dict[str, Any]:
+        """Check Solana network health without blocking the event loop."""
+        try:
+            logger.info("Checking Solana network health")
+            
+            session = await self._get_async_session()
+            async with session.post(settings.SOLANA_RPC_URL, data=self._SOL_BODY,
+                                    headers=JSON_HEADERS) as response:
+                response.raise_for_status()
+                data = _loads(await response.read())
+            
+            return self._parse_solana_health(data, ts)
             
         except Exception as e:
-            logger.error(f"Failed to check Solana network health: {e}")
-            return {
-                'platform': 'solana',
-                'incident_type': 'api_error',
-                'description': f"Failed to fetch network health: {str(e)}",
-                'severity': 'medium',
-                'started_at': datetime.now(),
-                'resolved_at': None,
-                'source': 'solana_rpc'
-            }
-    
-    def check_general_outages(self) -> List[Dict[str, Any]]:
+            return _error_incident('solana', 'solana_rpc', e, ts, 'network health')
+    
+    def _parse_coinbase_status(self, status_data: Dict[str, Any], ts: datetime) -> Dict[str, Any]:
+        """Build a Coinbase incident record from the status page payload."""
+        # Parse Coinbase status
+        page = status_data.get('page', {})
+        status = page.get('status', 'unknown')
+        
+        # Check for active incidents
+        incidents = status_data.get('incidents', [])
+        active_count = sum(1 for inc in incidents if inc.get('status') not in COINBASE_TERMINAL_STATUSES)
+        
+        # Determine severity
+        severity = COINBASE_SEVERITY.get(status, 'medium' if active_count else 'low')
+        
+        # Create incident record
+        incident_data = _mk_incident(
+            'coinbase', 'coinbase_status_api', ts, 'status_check',
+            f"Status: {status}. Active incidents: {active_count}",
+            severity, None if severity != 'low' else ts
+        )
+        # Raw payloads are only kept when they will be archived to object storage
+        if settings.PERSIST_RAW_INFRA:
+            incident_data['raw_data'] = status_data
+        
+        logger.info(f"Coinbase status: {status}, severity: {severity}")
+        return incident_data
+    
+    def _parse_binance_status(self, status_data: Any, ts: datetime) -> Dict[str, Any]:
+        """Build a Binance incident record from the ping payload."""
+        # Ping endpoint returns empty dict {} if successful
+        # If we got a response and it's a dict, Binance is operational
+        if isinstance(status_data, dict):
+            severity = 'low'
+            incident_type = 'normal_operation'
+            description = "Binance API responding normally"
+            resolved_at = ts
+        else:
+            severity = 'medium'
+            incident_type = 'api_issue'
+            description = "Unexpected response from Binance API"
+            resolved_at = None
+        
+        incident_data = _mk_incident(
+            'binance', 'binance_status_api', ts, incident_type, description, severity, resolved_at
+        )
+        # Raw payloads are only kept when they will be archived to object storage
+        if settings.PERSIST_RAW_INFRA:
+            incident_data['raw_data'] = status_data
+        
+        logger.info(f"Binance status: {description}, severity: {severity}")
+        return incident_data
+    
+    def _parse_solana_health(self, data: Dict[str, Any], ts: datetime) -> Dict[str, Any]:
+        """Build a Solana incident record from getRecentPerformanceSamples."""
+        if 'result' not in data:
+            raise Exception(f"Invalid Solana RPC response: {data}")
+        
+        samples = data['result']
+        if not samples:
+            raise Exception("No performance samples returned")
+        
+        # Aggregate over every returned sample rather than just the latest one
+        latest_sample = samples[0]
+        arr = np.array(
+            [(sample.get('numTransactions', 0), sample.get('samplePeriodSecs', 0)) for sample in samples],
+            dtype=np.float64
+        )
+        num_tx, periods = arr[:, 0], arr[:, 1]
+        total_period = periods.sum()
+        tps = float(num_tx.sum() / total_period) if total_period > 0 else 0.0
+        slot_time = float(periods.mean())
+        # Per-sample TPS spread; a volatile throughput is an early congestion signal
+        tps_std = float(np.std(np.divide(num_tx, periods, out=np.zeros_like(num_tx), where=periods > 0)))
+        
+        # Determine network health from the first matching congestion rule
+        severity, incident_type, note = next(
+            (outcome for rule, outcome in SOLANA_RULES if rule(tps, slot_time)),
+            SOLANA_HEALTHY
+        )
+        description = f"Solana TPS: {tps:.1f} (±{tps_std:.1f}), Slot time: {slot_time:g}s{note}"
+        
+        incident_data = _mk_incident(
+            'solana', 'solana_rpc', ts, incident_type, description,
+            severity, ts if severity == 'low' else None
+        )
+        # Raw payloads are only kept when they will be archived to object storage
+        if settings.PERSIST_RAW_INFRA:
+            incident_data['raw_data'] = {'latest_sample': latest_sample, 'tps': tps, 'tps_std': tps_std,
+                                         'sample_count': len(samples)}
+        
+        logger.info(f"Solana network: TPS {tps:.1f}, severity: {severity}")
+        return incident_data
+    
+    def check_general_outages(self, ts: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Check for general infrastructure outages affecting multiple platforms."""
+        ts = ts or datetime.now()
         incidents = []
         
         try:
@@ -230,29 +597,19 @@ class InfrastructureCollector:
             # This could indicate broader internet/infrastructure issues
             
             # This would be implemented with real monitoring APIs
-            general_status = {
-                'platform': 'general_infrastructure',
-                'incident_type': 'health_check',
-                'description': 'General infrastructure monitoring - no issues detected',
-                'severity': 'low',
-                'started_at': datetime.now(),
-                'resolved_at': datetime.now(),
-                'source': 'infrastructure_monitor'
-            }
+            general_status = _mk_incident(
+                'general_infrastructure', 'infrastructure_monitor', ts, 'health_check',
+                'General infrastructure monitoring - no issues detected', resolved_at=ts
+            )
             
             incidents.append(general_status)
             
         except Exception as e:
             logger.error(f"Failed to check general infrastructure: {e}")
-            incidents.append({
-                'platform': 'general_infrastructure',
-                'incident_type': 'monitor_error',
-                'description': f"Infrastructure monitoring failed: {str(e)}",
-                'severity': 'low',
-                'started_at': datetime.now(),
-                'resolved_at': None,
-                'source': 'infrastructure_monitor'
-            })
+            incidents.append(_mk_incident(
+                'general_infrastructure', 'infrastructure_monitor', ts, 'monitor_error',
+                f"Infrastructure monitoring failed: {str(e)}"
+            ))
         
         return incidents
     
@@ -261,42 +618,129 @@ class InfrastructureCollector:
         if not incidents:
             return 0
         
+        # Timestamps are bound as native datetimes; psycopg2 adapts them without string formatting
+        rows = [
+            (
+                incident['platform'],
+                incident['incident_type'],
+                incident['description'],
+                incident['severity'],
+                incident['started_at'],
+                incident.get('resolved_at'),
+                incident['source'],
+                incident.get('raw_uri')
+            )
+            for incident in incidents
+        ]
+        
+        # Open and resolved observations coalesce against different unique indexes
+        open_rows = [row for row in rows if row[5] is None]
+        resolved_rows = [row for row in rows if row[5] is not None]
         stored_count = 0
+        if open_rows:
+            stored_count += self._insert_incident_rows(open_rows, 'infra_ins')
+        if resolved_rows:
+            stored_count += self._insert_incident_rows(resolved_rows, 'infra_ins_resolved')
         
+        # Log high severity incidents
         for incident in incidents:
-            try:
-                query = """
-                    INSERT INTO infra_incidents 
-                    (platform, incident_type, description, severity, started_at, resolved_at, source)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                """
-                
-                params = (
-                    incident['platform'],
-                    incident['incident_type'],
-                    incident['description'],
-                    incident['severity'],
-                    incident['started_at'].isoformat(),
-                    incident['resolved_at'].isoformat() if incident.get('resolved_at') else None,
-                    incident['source']
-                )
-                
-                incident_id = db.execute_insert(query, params)
-                if incident_id:
-                    stored_count += 1
-                    
-                    # Log high severity incidents
-                    if incident['severity'] in ['high', 'critical']:
-                        logger.warning(f"High severity infrastructure incident: {incident['description']}")
-                    
-            except Exception as e:
-                logger.warning(f"Failed to store infrastructure incident: {e}")
-                continue
+            if incident['severity'] in ['high', 'critical']:
+                logger.warning(f"High severity infrastructure incident: {incident['description']}")
         
         logger.info(f"Stored {stored_count} infrastructure incidents in database")
         return stored_count
     
+    def _insert_incident_rows(self, rows: List[tuple], statement: str) -> int:
+        """Upsert incident rows in one round trip, splitting the batch on failure to isolate bad rows."""
+        conn = None
+        try:
+            conn = db.get_sync_connection()
+            with conn.cursor() as cursor:
+                self._ensure_insert_prepared(conn, cursor)
+                # Column-wise arrays so the whole batch is one EXECUTE of the cached plan
+                cursor.execute(INFRA_UPSERT_EXECUTE.format(statement), [list(column) for column in zip(*rows)])
+                ids = cursor.fetchall()
+            conn.commit()
+            return len(ids)
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            if len(rows) == 1:
+                logger.warning(f"Failed to store infrastructure incident: {e}")
+                return 0
+            logger.warning(f"Batch insert of {len(rows)} incidents failed, retrying in halves: {e}")
+        finally:
+            if conn:
+                db.return_sync_connection(conn)
+        
+        mid = len(rows) // 2
+        return (self._insert_incident_rows(rows[:mid], statement)
+                + self._insert_incident_rows(rows[mid:], statement))
+    
+    def bulk_store_incidents(self, incidents: List[Dict[str, Any]]) -> int:
+        """Bulk-load incidents (e.g. a replay or backfill) through COPY into a staging table.
+        
+        Rows are merged into infra_incidents with the same coalescing rules as
+        store_infrastructure_incidents, in one transaction.
+        """
+        if not incidents:
+            return 0
+        
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for incident in incidents:
+            # Empty unquoted CSV fields load as NULL
+            writer.writerow((
+                incident['platform'],
+                incident['incident_type'],
+                incident['description'],
+                incident['severity'],
+                incident['started_at'],
+                incident.get('resolved_at') or '',
+                incident['source'],
+                incident.get('raw_uri') or ''
+            ))
+        buf.seek(0)
+        
+        conn = None
+        try:
+            conn = db.get_sync_connection()
+            with conn.cursor() as cursor:
+                cursor.execute(INFRA_STAGE_DDL)
+                cursor.copy_expert(
+                    f"COPY infra_incidents_stage ({INFRA_COLUMNS}) FROM STDIN WITH (FORMAT csv)", buf
+                )
+                stored_count = 0
+                for sql in INFRA_STAGE_MERGES:
+                    cursor.execute(sql)
+                    stored_count += cursor.rowcount
+            conn.commit()
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"Bulk load of {len(incidents)} infrastructure incidents failed: {e}")
+            raise
+        finally:
+            if conn:
+                db.return_sync_connection(conn)
+        
+        logger.info(f"Bulk loaded {stored_count} infrastructure incidents")
+        return stored_count
+    
+    def _ensure_insert_prepared(self, conn, cursor):
+        """PREPARE the incident upserts once per pooled connection."""
+        if conn in _PREPARED_CONNS:
+            return
+        # The connection may have been prepared by an earlier run that didn't record it
+        cursor.execute("SELECT name FROM pg_prepared_statements")
+        existing = {row[0] for row in cursor.fetchall()}
+        for name, sql in INFRA_UPSERT_STATEMENTS.items():
+            if name not in existing:
+                cursor.execute(f"PREPARE {name} AS {sql}")
+        # Commit so the statement outlives a rollback of the batch that follows
+        conn.commit()
+        _PREPARED_CONNS.add(conn)
+    
     def generate_infrastructure_alert(self, incidents: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Generate alert if critical infrastructure issues are detected."""
         critical_incidents = [inc for inc in incidents if inc['severity'] in ['high', 'critical']]
@@ -317,93 +761,103 @@ class InfrastructureCollector:
         
         return alert
     
-    async def run_collection_cycle(self) -> Dict[str, Any]:
+    async def archive_raw_payloads(self, incidents: List[Dict[str, Any]]):
+        """Upload raw payloads to object storage and replace them with their URI."""
+        pending = [incident for incident in incidents if 'raw_data' in incident]
+        if not pending:
+            return
+        if not AIOBOTO3_AVAILABLE:
+            logger.warning("PERSIST_RAW_INFRA is set but aioboto3 is not installed; dropping raw payloads")
+            for incident in pending:
+                incident.pop('raw_data', None)
+            return
+        
+        async def _put(client, incident):
+            raw = incident.pop('raw_data')
+            key = f"infra/{incident['platform']}/{incident['started_at'].strftime('%Y%m%dT%H%M%S%f')}.json.gz"
+            try:
+                await client.put_object(
+                    Bucket=settings.INFRA_RAW_BUCKET,
+                    Key=key,
+                    Body=gzip.compress(_dumps(raw), compresslevel=1),
+                    ContentType='application/json',
+                    ContentEncoding='gzip'
+                )
+                incident['raw_uri'] = f"s3://{settings.INFRA_RAW_BUCKET}/{key}"
+            except Exception as e:
+                logger.warning(f"Failed to archive raw {incident['platform']} payload: {e}")
+        
+        session = aioboto3.Session()
+        async with session.client('s3', endpoint_url=settings.S3_ENDPOINT_URL) as client:
+            await asyncio.gather(*(_put(client, incident) for incident in pending))
+    
+    async def run_collection_cycle(self, refresh_cache: bool = False) -> Dict[str, Any]:
         """Run a complete infrastructure monitoring cycle."""
         start_time = datetime.now()
         logger.info("Starting infrastructure monitoring cycle")
         
-        results = {
-            'start_time': start_time.isoformat(),
-            'platforms_checked': 0,
-            'incidents_detected': 0,
-            'incidents_stored': 0,
-            'alerts_generated': 0,
-            'errors': [],
-            'success': True
-        }
+        results = self._new_cycle_results(start_time)
         
         try:
             all_incidents = []
             
-            # Check Coinbase status
-            try:
-                coinbase_incident = self.check_coinbase_status()
-                all_incidents.append(coinbase_incident)
-                results['platforms_checked'] += 1
-            except Exception as e:
-                results['errors'].append(f"Coinbase check failed: {str(e)}")
-                logger.error(f"Coinbase status check failed: {e}")
+            # Check exchanges and Solana concurrently
+            checks = await asyncio.gather(
+                self.async_check_coinbase_status(refresh_cache, ts=start_time),
+                self.async_check_binance_status(refresh_cache, ts=start_time),
+                self.async_check_solana_network_health(refresh_cache, ts=start_time),
+                return_exceptions=True
+            )
+            for name, outcome in zip(('Coinbase', 'Binance', 'Solana'), checks):
+                if isinstance(outcome, Exception):
+                    results['errors'].append(f"{name} check failed: {str(outcome)}")
+                    logger.error(f"{name} check failed: {outcome}")
+                else:
+                    all_incidents.append(outcome)
+                    results['platforms_checked'] += 1
             
-            # Check Binance status
-            try:
-                binance_incident = self.check_binance_status()
-                all_incidents.append(binance_incident)
-                results['platforms_checked'] += 1
-            except Exception as e:
-                results['errors'].append(f"Binance check failed: {str(e)}")
-                logger.error(f"Binance status check failed: {e}")
+            if settings.PERSIST_RAW_INFRA:
+                await self.archive_raw_payloads(all_incidents)
             
-            # Check Solana network
-            try:
-                solana_incident = self.check_solana_network_health()
-                all_incidents.append(solana_incident)
-                results['platforms_checked'] += 1
-            except Exception as e:
-                results['errors'].append(f"Solana check failed: {str(e)}")
-                logger.error(f"Solana network check failed: {e}")
+            self._complete_cycle(results, all_incidents, start_time)
             
-            # Check general infrastructure
-            try:
-                general_incidents = self.check_general_outages()
-                all_incidents.extend(general_incidents)
-                results['platforms_checked'] += len(general_incidents)
-            except Exception as e:
-                results['errors'].append(f"General infrastructure check failed: {str(e)}")
-                logger.error(f"General infrastructure check failed: {e}")
-            
-            # Store incidents
-            if all_incidents:
-                stored_count = self.store_infrastructure_incidents(all_incidents)
-                results['incidents_detected'] = len(all_incidents)
-                results['incidents_stored'] = stored_count
-                
-                # Generate alerts for critical issues
-                alert = self.generate_infrastructure_alert(all_incidents)
-                if alert:
-                    # Store alert in database
+        except Exception as e:
+            logger.error(f"Infrastructure monitoring cycle failed: {e}")
+            results['success'] = False
+            results['errors'].append(str(e))
+        
+        return results
+    
+    def run_sync_cycle(self, refresh_cache: bool = False) -> Dict[str, Any]:
+        """Run a monitoring cycle without an event loop, checking platforms on a thread pool."""
+        start_time = datetime.now()
+        logger.info("Starting infrastructure monitoring cycle")
+        
+        results = self._new_cycle_results(start_time)
+        
+        try:
+            all_incidents = []
+            
+            # requests releases the GIL on socket I/O, so the checks overlap
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {
+                    executor.submit(self.check_coinbase_status, refresh_cache, ts=start_time): 'Coinbase',
+                    executor.submit(self.check_binance_status, refresh_cache, ts=start_time): 'Binance',
+                    executor.submit(self.check_solana_network_health, refresh_cache, ts=start_time): 'Solana',
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
                     try:
-                        from ..db.postgres_handler import insert_alert
-                        alert_id = insert_alert(
-                            ticker=alert['ticker'] or '',
-                            risk_type=alert['risk_type'],
-                            severity=alert['severity'],
-                            message=alert['message']
-                        )
-                        if alert_id:
-                            results['alerts_generated'] = 1
+                        all_incidents.append(future.result())
+                        results['platforms_checked'] += 1
                     except Exception as e:
-                        logger.error(f"Failed to store infrastructure alert: {e}")
-            
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+                        results['errors'].append(f"{name} check failed: {str(e)}")
+                        logger.error(f"{name} check failed: {e}")
             
-            logger.info(f"Infrastructure monitoring completed in {duration:.2f}s: "
-                       f"{results['platforms_checked']} platforms, "
-                       f"{results['incidents_detected']} incidents, "
-                       f"{results['alerts_generated']} alerts")
+            if settings.PERSIST_RAW_INFRA:
+                self.run_on_loop(self.archive_raw_payloads(all_incidents))
             
-            results['end_time'] = end_time.isoformat()
-            results['duration_seconds'] = duration
+            self._complete_cycle(results, all_incidents, start_time)
             
         except Exception as e:
             logger.error(f"Infrastructure monitoring cycle failed: {e}")
@@ -411,23 +865,95 @@ class InfrastructureCollector:
             results['errors'].append(str(e))
         
         return results
+    
+    @staticmethod
+    def _new_cycle_results(start_time: datetime) -> Dict[str, Any]:
+        return {
+            'start_time': start_time.isoformat(),
+            'platforms_checked': 0,
+            'incidents_detected': 0,
+            'incidents_stored': 0,
+            'alerts_generated': 0,
+            'errors': [],
+            'success': True
+        }
+    
+    def _complete_cycle(self, results: Dict[str, Any], all_incidents: List[Dict[str, Any]],
+                        start_time: datetime):
+        """Add general outages, store incidents, raise alerts and stamp timings on results."""
+        # Check general infrastructure
+        try:
+            general_incidents = self.check_general_outages(start_time)
+            all_incidents.extend(general_incidents)
+            results['platforms_checked'] += len(general_incidents)
+        except Exception as e:
+            results['errors'].append(f"General infrastructure check failed: {str(e)}")
+            logger.error(f"General infrastructure check failed: {e}")
+        
+        # Store incidents
+        if all_incidents:
+            stored_count = self.store_infrastructure_incidents(all_incidents)
+            results['incidents_detected'] = len(all_incidents)
+            results['incidents_stored'] = stored_count
+            
+            # Generate alerts for critical issues
+            alert = self.generate_infrastructure_alert(all_incidents)
+            if alert:
+                # Store alert in database
+                try:
+                    from ..db.postgres_handler import insert_alert
+                    alert_id = insert_alert(
+                        ticker=alert['ticker'] or '',
+                        risk_type=alert['risk_type'],
+                        severity=alert['severity'],
+                        message=alert['message']
+                    )
+                    if alert_id:
+                        results['alerts_generated'] = 1
+                except Exception as e:
+                    logger.error(f"Failed to store infrastructure alert: {e}")
+        
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        logger.info(f"Infrastructure monitoring completed in {duration:.2f}s: "
+                   f"{results['platforms_checked']} platforms, "
+                   f"{results['incidents_detected']} incidents, "
+                   f"{results['alerts_generated']} alerts")
+        
+        results['end_time'] = end_time.isoformat()
+        results['duration_seconds'] = duration
 
 # Global collector instance
 infra_collector = InfrastructureCollector()
 
 # Convenience functions for external use
-def collect_infrastructure_status() -> Dict[str, Any]:
-    """Synchronous wrapper for infrastructure monitoring."""
-    return asyncio.run(infra_collector.run_collection_cycle())
+def collect_infrastructure_status(refresh_cache: bool = False, use_threads: bool = False) -> Dict[str, Any]:
+    """
+    Synchronous wrapper for infrastructure monitoring.
+    
+    Runs the async cycle by default, on the collector's reusable event loop so its
+    aiohttp session keeps connections alive across cycles; use_threads=True opts
+    into run_sync_cycle, which makes the requests-based checks on a thread pool
+    instead. Callers already inside an event loop should await
+    async_collect_infrastructure_status.
+    """
+    if use_threads:
+        return infra_collector.run_sync_cycle(refresh_cache)
+    return infra_collector.run_on_loop(infra_collector.run_collection_cycle(refresh_cache))
+
+async def async_collect_infrastructure_status(refresh_cache: bool = False) -> Dict[str, Any]:
+    """Run infrastructure monitoring on the caller's event loop."""
+    return await infra_collector.run_collection_cycle(refresh_cache)
 
-def check_coinbase_only() -> Dict[str, Any]:
+def check_coinbase_only(refresh_cache: bool = False) -> Dict[str, Any]:
     """Check only Coinbase status."""
-    return infra_collector.check_coinbase_status()
+    return infra_collector.check_coinbase_status(refresh_cache)
 
-def check_binance_only() -> Dict[str, Any]:
+def check_binance_only(refresh_cache: bool = False) -> Dict[str, Any]:
     """Check only Binance status."""
-    return infra_collector.check_binance_status()
+    return infra_collector.check_binance_status(refresh_cache)
 
-def check_solana_only() -> Dict[str, Any]:
+def check_solana_only(refresh_cache: bool = False) -> Dict[str, Any]:
     """Check only Solana network health."""
-    return infra_collector.check_solana_network_health()
\ No newline at end of file
+    return infra_collector.check_solana_network_health(refresh_cache)
\ No newline at end of file
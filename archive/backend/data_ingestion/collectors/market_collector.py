@@ -6,10 +6,17 @@ Enhanced with professional error handling and failover mechanisms.
 
 import logging
 import asyncio
+import atexit
+import json
+import threading
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import List, Dict, Any, Optional, Tuple
+from itertools import repeat
+import numpy as np
 import yfinance as yf
 import pandas as pd
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -17,12 +24,142 @@ import time
 import random
 
 from ..config.settings import settings, TRACKED_ASSETS
-from ..db.postgres_handler import db, insert_market_price
+from ..db.postgres_handler import insert_market_price, bulk_insert_market_prices, copy_market_prices
 from ..utils.logging_utils import setup_logger
-from .alpha_vantage_collector import alpha_vantage_collector
 
 logger = setup_logger(__name__)
 
+# C-accelerated JSON for API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON response body, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Length of each rate-limit window, keyed like MarketDataCollector.rate_limits
+RATE_WINDOW_SECONDS = {
+    'calls_per_second': 1,
+    'calls_per_minute': 60,
+    'calls_per_hour': 3600
+}
+# Index symbol mapping (for proper Yahoo Finance symbols)
+INDEX_SYMBOLS = {
+    'DJI': '^DJI',
+    'NASDAQ': '^IXIC',
+    'SPX': '^GSPC',
+    'RUT': '^RUT',
+    'VIX': '^VIX',
+    'NIFTY': '^NSEI',
+    '^BSESN': '^BSESN',
+    '^FTSE': '^FTSE',
+    '^GDAXI': '^GDAXI',
+    '^GSPC': '^GSPC',
+    '^IXIC': '^IXIC',
+    '^N225': '^N225',
+    '^NSEI': '^NSEI',
+    '^RUT': '^RUT',
+    '^VIX': '^VIX'
+}
+
+# Crypto symbols quoted against USD on Yahoo Finance (SYMBOL-USD)
+CRYPTO_SYMBOLS = frozenset({
+    'BTC', 'ETH', 'SOL', 'ADA', 'DOT', 'ALGO', 'ATOM', 'AVAX',
+    'BCH', 'BNB', 'DOGE', 'UNI', 'VET', 'LINK', 'MATIC', 'XRP', 'LTC',
+    'FIL', 'SHIB', 'THETA'
+})
+
+# FX pairs quoted as SYMBOL=X on Yahoo Finance
+FX_SYMBOLS = frozenset({'EURUSD', 'GBPUSD', 'USDJPY'})
+
+
+def _resolve_yf_ticker(ticker: str) -> str:
+    """Map a tracked ticker to its Yahoo Finance symbol (slow path)."""
+    if ticker in INDEX_SYMBOLS:
+        return INDEX_SYMBOLS[ticker]
+    if ticker.endswith('-USD'):
+        return ticker  # Already in correct format
+    if ticker.upper() in CRYPTO_SYMBOLS:
+        return f"{ticker.upper()}-USD"
+    if ticker in FX_SYMBOLS:
+        return f"{ticker}=X"
+    return ticker
+
+# Yahoo Finance symbols for every tracked asset, resolved once at import
+TICKER_TO_YF = {
+    ticker: _resolve_yf_ticker(ticker)
+    for tickers in TRACKED_ASSETS.values()
+    for ticker in tickers
+}
+
+# Source column names -> market_prices schema
+TIINGO_COLMAP = {
+    'date': 'timestamp',
+    'adjOpen': 'adj_open',
+    'adjHigh': 'adj_high',
+    'adjLow': 'adj_low',
+    'adjClose': 'adj_close',
+    'adjVolume': 'adj_volume',
+    'divCash': 'dividend',
+    'splitFactor': 'split_factor'
+}
+YF_COLMAP = {
+    'Date': 'timestamp',
+    'Datetime': 'timestamp',
+    'Open': 'open',
+    'High': 'high',
+    'Low': 'low',
+    'Close': 'close',
+    'Volume': 'volume',
+    'Adj Close': 'adj_close'
+}
+
+# Decorrelated-jitter retry backoff bounds (seconds)
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 300.0
+
+# Retrying HTTP adapter shared by every collector's requests session
+_ADAPTER = HTTPAdapter(max_retries=Retry(
+    total=5,  # Increased retries
+    backoff_factor=2,  # Exponential backoff
+    status_forcelist=[429, 500, 502, 503, 504, 520, 521, 522, 523, 524]
+))
+
+# Tiingo requests in flight at once during a collection cycle
+TIINGO_CONCURRENCY = 5
+
+# Tickers per batched yf.download call
+YF_BATCH_SIZE = 50
+
+# DataFrame.attrs key marking a frame that already passed _validate_market_data
+VALIDATED_ATTR = 'qv_validated'
+
+# Numeric Tiingo price fields, cast in one pass after the frame is built
+TIINGO_NUMERIC_FIELDS = (
+    'open', 'high', 'low', 'close', 'volume',
+    'adjOpen', 'adjHigh', 'adjLow', 'adjClose', 'adjVolume',
+    'divCash', 'splitFactor'
+)
+
+
+def _tiingo_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Pivot Tiingo JSON records into columns and build the DataFrame from them."""
+    columns = {key: [] for key in records[0]}
+    for record in records:
+        for key, values in columns.items():
+            values.append(record.get(key))
+    
+    df = pd.DataFrame(columns)
+    numeric = {field: 'float64' for field in TIINGO_NUMERIC_FIELDS if field in df.columns}
+    return df.astype(numeric) if numeric else df
+
 class MarketDataCollector:
     """
     Enhanced market data collector with professional error handling.
@@ -42,78 +179,102 @@ class MarketDataCollector:
         
         # Setup session with enhanced retry strategy
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=5,  # Increased retries
-            backoff_factor=2,  # Exponential backoff
-            status_forcelist=[429, 500, 502, 503, 504, 520, 521, 522, 523, 524]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Rate limiting tracking
-        self.api_call_times = {
-            'tiingo': [],
-            'yfinance': [],
-            'alpha_vantage': []
-        }
+        self.session.mount("http://", _ADAPTER)
+        self.session.mount("https://", _ADAPTER)
+        
+        # Pooled aiohttp session for the async collectors, created lazily per event loop
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Rate limiting
         self.rate_limits = {
-            'tiingo': {'calls_per_hour': 500, 'calls_per_minute': 50},
+            'tiingo': {'calls_per_hour': 500, 'calls_per_minute': 50, 'calls_per_second': 5},
             'yfinance': {'calls_per_hour': 2000, 'calls_per_minute': 100},
             'alpha_vantage': {'calls_per_minute': 5}
         }
+        
+        # Token buckets per API and window: [tokens, last_refill], starting full
+        now = time.monotonic()
+        self._buckets = {
+            api_name: {window: [float(capacity), now] for window, capacity in limits.items()}
+            for api_name, limits in self.rate_limits.items()
+        }
+    
+    @cached_property
+    def tracked_tickers(self) -> tuple:
+        """All tracked tickers, flattened once; del the attribute if TRACKED_ASSETS changes."""
+        return tuple(ticker for tickers in TRACKED_ASSETS.values() for ticker in tickers)
+    
+    def get_all_tracked_tickers(self) -> List[str]:
+        """Get all tracked tickers across asset types."""
+        return list(self.tracked_tickers)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled aiohttp session, recreating it if closed or bound to another loop."""
+        loop = asyncio.get_running_loop()
+        if (self._async_session is None or self._async_session.closed
+                or self._async_session_loop is not loop):
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, enable_cleanup_closed=True)
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._async_session_loop = loop
+        return self._async_session
+    
+    async def close(self):
+        """Close the pooled aiohttp session."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_session_loop = None
     
-    def _can_make_api_call(self, api_name: str) -> Tuple[bool, Optional[float]]:
+    def _allow(self, api_name: str, tokens: int = 1) -> Tuple[bool, Optional[float]]:
         """
-        Check if we can make an API call based on rate limits
+        Admit an API call against every rate-limit window, consuming `tokens` from each
         
         Returns:
             (can_call, wait_time_seconds)
         """
-        now = time.time()
-        call_times = self.api_call_times[api_name]
+        now = time.monotonic()
         limits = self.rate_limits[api_name]
+        buckets = self._buckets[api_name]
         
-        # Clean old calls (older than 1 hour)
-        call_times[:] = [t for t in call_times if now - t < 3600]
+        wait_time = 0.0
+        for window, bucket in buckets.items():
+            capacity = limits[window]
+            rate = capacity / RATE_WINDOW_SECONDS[window]
+            cost = min(tokens, capacity)
+            bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if bucket[0] < cost:
+                wait_time = max(wait_time, (cost - bucket[0]) / rate)
         
-        # Check minute limit
-        if 'calls_per_minute' in limits:
-            recent_calls = [t for t in call_times if now - t < 60]
-            if len(recent_calls) >= limits['calls_per_minute']:
-                wait_time = 60 - (now - min(recent_calls))
-                return False, wait_time
-        
-        # Check hour limit
-        if 'calls_per_hour' in limits:
-            if len(call_times) >= limits['calls_per_hour']:
-                wait_time = 3600 - (now - min(call_times))
-                return False, wait_time
+        if wait_time:
+            return False, wait_time
         
+        for window, bucket in buckets.items():
+            bucket[0] -= min(tokens, limits[window])
         return True, None
     
-    def _record_api_call(self, api_name: str):
-        """Record an API call for rate limiting"""
-        self.api_call_times[api_name].append(time.time())
-    
-    async def _wait_for_rate_limit(self, api_name: str) -> bool:
+    async def _wait_for_rate_limit(self, api_name: str, tokens: int = 1) -> bool:
         """
-        Wait for rate limit to reset if necessary
+        Wait for rate-limit tokens if necessary; admission consumes the tokens
         
         Returns:
             True if we can proceed, False if we should skip
         """
-        can_call, wait_time = self._can_make_api_call(api_name)
-        
-        if not can_call and wait_time:
+        while True:
+            can_call, wait_time = self._allow(api_name, tokens)
+            if can_call:
+                return True
+            
             if wait_time > 300:  # Don't wait more than 5 minutes
                 logger.warning(f"Rate limit wait too long for {api_name}: {wait_time:.1f}s - skipping")
                 return False
             
             logger.info(f"Rate limit reached for {api_name}, waiting {wait_time:.1f}s")
             await asyncio.sleep(wait_time)
-        
-        return True
     
     def _validate_market_data(self, df: pd.DataFrame, ticker: str) -> bool:
         """
@@ -129,29 +290,45 @@ class MarketDataCollector:
         if df is None or df.empty:
             return False
         
+        # Skip frames already validated in this shape; attrs can carry over to derived
+        # frames, so the row count and columns must still match
+        signature = (len(df), tuple(df.columns))
+        if df.attrs.get(VALIDATED_ATTR) == signature:
+            return True
+        
         required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
         missing_columns = [col for col in required_columns if col not in df.columns]
         if missing_columns:
             logger.warning(f"Missing columns for {ticker}: {missing_columns}")
             return False
         
-        # Check for reasonable price ranges (basic sanity check)
+        # Check for reasonable price ranges (basic sanity check), all columns in one pass
         price_columns = ['open', 'high', 'low', 'close']
-        for col in price_columns:
-            if df[col].isnull().all():
+        prices = df[price_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        all_null = np.isnan(prices).all(axis=0)
+        non_positive = (prices <= 0).any(axis=0)
+        
+        for i, col in enumerate(price_columns):
+            if all_null[i]:
                 logger.warning(f"All {col} prices are null for {ticker}")
                 return False
             
-            if (df[col] <= 0).any():
+            if non_positive[i]:
                 logger.warning(f"Non-positive prices found in {col} for {ticker}")
                 # Clean the data instead of rejecting
-                df[col] = df[col].replace(0, pd.NA)
+                df[col] = np.where(prices[:, i] <= 0, np.nan, prices[:, i])
         
-        # Check for duplicate timestamps
-        if df['timestamp'].duplicated().any():
+        # Check for duplicate timestamps in a single pass; unique over the reversed
+        # column gives the last occurrence of each timestamp
+        ts = df['timestamp'].values
+        if ts.dtype.kind == 'M':
+            ts = ts.view('i8')
+        last_idx = len(ts) - 1 - np.unique(ts[::-1], return_index=True)[1]
+        if len(last_idx) != len(ts):
             logger.warning(f"Duplicate timestamps found for {ticker}")
-            df = df.drop_duplicates(subset=['timestamp'], keep='last')
+            df = df.iloc[np.sort(last_idx)]
         
+        df.attrs[VALIDATED_ATTR] = signature
         return True
     
     async def collect_tiingo_data_enhanced(self, ticker: str, start_date: Optional[str] = None, 
@@ -171,10 +348,6 @@ class MarketDataCollector:
             logger.warning("Tiingo API key not configured")
             return None
         
-        # Check rate limits
-        if not await self._wait_for_rate_limit('tiingo'):
-            return None
-        
         # Default to last 30 days if no start date provided
         if not start_date:
             start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
@@ -186,62 +359,45 @@ class MarketDataCollector:
             'format': 'json'
         }
         
+        prev_sleep = BACKOFF_BASE_SECONDS
         for attempt in range(max_retries):
             try:
-                self._record_api_call('tiingo')
+                # Every attempt, including retries, spends a rate-limit token
+                if not await self._wait_for_rate_limit('tiingo'):
+                    return None
                 
-                # Add jitter to prevent thundering herd
+                # Decorrelated jitter backoff to prevent thundering herd
                 if attempt > 0:
-                    jitter = random.uniform(1, 3)
-                    await asyncio.sleep((2 ** attempt) + jitter)
-                
-                response = self.session.get(
-                    url, 
-                    headers=self.tiingo_headers, 
-                    params=params, 
-                    timeout=30
-                )
+                    prev_sleep = min(BACKOFF_CAP_SECONDS, random.uniform(BACKOFF_BASE_SECONDS, prev_sleep * 3))
+                    await asyncio.sleep(prev_sleep)
                 
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = response.headers.get('Retry-After', '60')
-                    wait_time = min(int(retry_after), 300)  # Max 5 minutes
-                    logger.warning(f"Tiingo rate limited for {ticker}, waiting {wait_time}s")
-                    await asyncio.sleep(wait_time)
-                    continue
-                
-                response.raise_for_status()
-                data = response.json()
+                session = await self._get_session()
+                async with session.get(url, headers=self.tiingo_headers, params=params) as response:
+                    # Handle rate limiting
+                    if response.status == 429:
+                        retry_after = response.headers.get('Retry-After', '60')
+                        wait_time = min(int(retry_after), 300)  # Max 5 minutes
+                        logger.warning(f"Tiingo rate limited for {ticker}, waiting {wait_time}s")
+                        await asyncio.sleep(wait_time)
+                        continue
+                    
+                    response.raise_for_status()
+                    data = _loads(await response.read())
                 
                 if not data:
                     logger.warning(f"No Tiingo data returned for {ticker}")
                     return None
                 
-                # Convert to DataFrame
-                df = pd.DataFrame(data)
+                # Convert to DataFrame column-wise rather than record-by-record
+                df = _tiingo_frame(data)
                 df['ticker'] = ticker
                 df['source'] = 'tiingo'
                 
                 # Rename columns to match our schema
-                column_mapping = {
-                    'date': 'timestamp',
-                    'open': 'open',
-                    'high': 'high',
-                    'low': 'low',
-                    'close': 'close',
-                    'volume': 'volume',
-                    'adjOpen': 'adj_open',
-                    'adjHigh': 'adj_high',
-                    'adjLow': 'adj_low',
-                    'adjClose': 'adj_close',
-                    'adjVolume': 'adj_volume',
-                    'divCash': 'dividend',
-                    'splitFactor': 'split_factor'
-                }
-                df = df.rename(columns=column_mapping)
+                df = df.rename(columns=TIINGO_COLMAP, copy=False)
                 
-                # Convert timestamp
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
+                # Convert timestamp (Tiingo dates are ISO 8601 in UTC)
+                df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', utc=True, cache=True)
                 
                 # Validate data quality
                 if not self._validate_market_data(df, ticker):
@@ -251,7 +407,7 @@ class MarketDataCollector:
                 logger.info(f"Successfully collected Tiingo data for {ticker}: {len(df)} records")
                 return df
                 
-            except requests.exceptions.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.warning(f"Tiingo API error for {ticker} (attempt {attempt + 1}): {e}")
                 if attempt == max_retries - 1:
                     logger.error(f"All Tiingo attempts failed for {ticker}")
@@ -267,6 +423,9 @@ class MarketDataCollector:
         """
         Enhanced yfinance data collection with better error handling
         
+        Tickers are fetched in batched yf.download calls; only tickers missing from
+        a batch fall back to per-ticker history lookups with exchange-suffix variations.
+        
         Args:
             tickers: List of ticker symbols
             period: Data period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
@@ -276,119 +435,145 @@ class MarketDataCollector:
         """
         result = {}
         
-        # Check rate limits
-        if not await self._wait_for_rate_limit('yfinance'):
-            return result
-        
-        for ticker in tickers:
+        for start in range(0, len(tickers), YF_BATCH_SIZE):
+            batch = tickers[start:start + YF_BATCH_SIZE]
+            
+            # Admit the whole batch at once; yfinance still issues one request per ticker internally
+            if not await self._wait_for_rate_limit('yfinance', len(batch)):
+                break
+            
+            yf_tickers = {ticker: self._to_yf_ticker(ticker) for ticker in batch}
+            
             try:
-                self._record_api_call('yfinance')
-                
-                # Convert tickers to yfinance format
-                yf_ticker = ticker
-                
-                # Index symbol mapping (for proper Yahoo Finance symbols)
-                index_symbols = {
-                    'DJI': '^DJI',
-                    'NASDAQ': '^IXIC', 
-                    'SPX': '^GSPC',
-                    'RUT': '^RUT',
-                    'VIX': '^VIX',
-                    'NIFTY': '^NSEI',
-                    '^BSESN': '^BSESN',
-                    '^FTSE': '^FTSE',
-                    '^GDAXI': '^GDAXI',
-                    '^GSPC': '^GSPC',
-                    '^IXIC': '^IXIC',
-                    '^N225': '^N225',
-                    '^NSEI': '^NSEI',
-                    '^RUT': '^RUT',
-                    '^VIX': '^VIX'
-                }
-                
-                # Crypto symbol mapping
-                crypto_symbols = [
-                    'BTC', 'ETH', 'SOL', 'ADA', 'DOT', 'ALGO', 'ATOM', 'AVAX', 
-                    'BCH', 'BNB', 'DOGE', 'UNI', 'VET', 'LINK', 'MATIC', 'XRP', 'LTC',
-                    'FIL', 'SHIB', 'THETA'
-                ]
-                
-                # Apply appropriate mapping
-                if ticker in index_symbols:
-                    yf_ticker = index_symbols[ticker]
-                elif ticker.endswith('-USD'):
-                    yf_ticker = ticker  # Already in correct format
-                elif ticker.upper() in crypto_symbols:
-                    yf_ticker = f"{ticker.upper()}-USD"
-                
-                # Try different ticker variations for robustness
-                ticker_variations = [yf_ticker]
-                if '.' not in yf_ticker and '-' not in yf_ticker:
-                    ticker_variations.extend([f"{yf_ticker}.TO", f"{yf_ticker}.L"])
-                
+                data = await asyncio.to_thread(
+                    yf.download,
+                    tickers=' '.join(yf_tickers.values()),
+                    period=period,
+                    group_by='ticker',
+                    threads=True,
+                    auto_adjust=False,
+                    prepost=False,
+                    progress=False
+                )
+            except Exception as e:
+                logger.warning(f"Batched yfinance download failed for {len(batch)} tickers: {e}")
                 data = None
-                for variation in ticker_variations:
-                    try:
-                        stock = yf.Ticker(variation)
-                        data = stock.history(period=period, auto_adjust=False, prepost=False)
-                        
-                        if data is not None and not data.empty:
-                            logger.debug(f"Successfully fetched {variation} for {ticker}")
-                            break
-                            
-                    except Exception as attempt_error:
-                        logger.debug(f"yfinance attempt failed for {variation}: {attempt_error}")
+            
+            for ticker, yf_ticker in yf_tickers.items():
+                try:
+                    ticker_data = self._split_download(data, yf_ticker, len(yf_tickers))
+                    if ticker_data is None or ticker_data.empty:
+                        ticker_data = await asyncio.to_thread(self._history_with_variations, ticker, yf_ticker, period)
+                    
+                    if ticker_data is None or ticker_data.empty:
+                        logger.warning(f"No yfinance data returned for {ticker}")
                         continue
-                
-                if data is None or data.empty:
-                    logger.warning(f"No yfinance data returned for {ticker}")
-                    continue
-                
-                # Process the data
-                df = data.reset_index()
-                
-                # Rename columns to match our schema
-                column_mapping = {
-                    'Date': 'timestamp',
-                    'Datetime': 'timestamp',
-                    'Open': 'open',
-                    'High': 'high',
-                    'Low': 'low',
-                    'Close': 'close',
-                    'Volume': 'volume',
-                    'Adj Close': 'adj_close'
-                }
-                df = df.rename(columns=column_mapping)
-                
-                # Add metadata
-                df['ticker'] = ticker
-                df['source'] = 'yfinance'
-                
-                # Ensure timestamp is datetime
-                if 'timestamp' in df.columns:
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
-                else:
-                    logger.warning(f"No timestamp column found for {ticker}")
-                    continue
-                
-                # Validate data quality
-                if not self._validate_market_data(df, ticker):
-                    logger.warning(f"yfinance data validation failed for {ticker}")
+                    
+                    df = self._prepare_yf_frame(ticker, ticker_data)
+                    if df is None:
+                        continue
+                    
+                    result[ticker] = df
+                    logger.info(f"Successfully collected yfinance data for {ticker}: {len(df)} records")
+                    
+                except Exception as e:
+                    logger.error(f"Failed to collect yfinance data for {ticker}: {e}")
                     continue
-                
-                result[ticker] = df
-                logger.info(f"Successfully collected yfinance data for {ticker}: {len(df)} records")
-                
-                # Small delay to be respectful to the API
-                await asyncio.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"Failed to collect yfinance data for {ticker}: {e}")
-                continue
         
         logger.info(f"Successfully collected yfinance data for {len(result)}/{len(tickers)} tickers")
         return result
     
+    async def _collect_yfinance_single(self, ticker: str, period: str = "1mo") -> Optional[pd.DataFrame]:
+        """
+        Collect yfinance data for one ticker without the batching and result dict
+        
+        Returns:
+            Validated DataFrame or None
+        """
+        if not await self._wait_for_rate_limit('yfinance'):
+            return None
+        
+        try:
+            ticker_data = await asyncio.to_thread(
+                self._history_with_variations, ticker, self._to_yf_ticker(ticker), period
+            )
+            if ticker_data is None or ticker_data.empty:
+                logger.warning(f"No yfinance data returned for {ticker}")
+                return None
+            return self._prepare_yf_frame(ticker, ticker_data)
+        except Exception as e:
+            logger.error(f"Failed to collect yfinance data for {ticker}: {e}")
+            return None
+    
+    def _prepare_yf_frame(self, ticker: str, ticker_data: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Normalize a raw yfinance frame to our schema; None if it fails validation."""
+        # Process the data
+        df = ticker_data.reset_index()
+        
+        # Rename columns to match our schema
+        df.rename(columns=YF_COLMAP, inplace=True)
+        
+        # Add metadata
+        df['ticker'] = ticker
+        df['source'] = 'yfinance'
+        
+        # Ensure timestamp is datetime
+        if 'timestamp' in df.columns:
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        else:
+            logger.warning(f"No timestamp column found for {ticker}")
+            return None
+        
+        # Validate data quality
+        if not self._validate_market_data(df, ticker):
+            logger.warning(f"yfinance data validation failed for {ticker}")
+            return None
+        
+        return df
+    
+    @staticmethod
+    def _to_yf_ticker(ticker: str) -> str:
+        """Convert a tracked ticker to its Yahoo Finance symbol."""
+        yf_ticker = TICKER_TO_YF.get(ticker)
+        return yf_ticker if yf_ticker is not None else _resolve_yf_ticker(ticker)
+    
+    @staticmethod
+    def _split_download(data: Optional[pd.DataFrame], yf_ticker: str, batch_size: int) -> Optional[pd.DataFrame]:
+        """Pull one ticker's OHLCV frame out of a grouped yf.download result."""
+        if data is None or data.empty:
+            return None
+        if isinstance(data.columns, pd.MultiIndex):
+            if yf_ticker not in data.columns.get_level_values(0):
+                return None
+            frame = data[yf_ticker]
+        elif batch_size == 1:
+            frame = data
+        else:
+            return None
+        # Batched frames share one date index, so drop dates this ticker didn't trade
+        return frame.dropna(how='all')
+    
+    def _history_with_variations(self, ticker: str, yf_ticker: str, period: str) -> Optional[pd.DataFrame]:
+        """Fetch one ticker's history, trying exchange-suffix variations for robustness."""
+        ticker_variations = [yf_ticker]
+        if '.' not in yf_ticker and '-' not in yf_ticker:
+            ticker_variations.extend([f"{yf_ticker}.TO", f"{yf_ticker}.L"])
+        
+        for variation in ticker_variations:
+            try:
+                stock = yf.Ticker(variation)
+                data = stock.history(period=period, auto_adjust=False, prepost=False)
+                
+                if data is not None and not data.empty:
+                    logger.debug(f"Successfully fetched {variation} for {ticker}")
+                    return data
+                    
+            except Exception as attempt_error:
+                logger.debug(f"yfinance attempt failed for {variation}: {attempt_error}")
+                continue
+        
+        return None
+    
     async def collect_with_failover(self, ticker: str, start_date: Optional[str] = None) -> Optional[pd.DataFrame]:
         """
         Collect market data with automatic failover between sources
@@ -413,10 +598,10 @@ class MarketDataCollector:
         logger.warning(f"⚠️ {ticker}: Tiingo failed, trying yfinance fallback")
         
         # Fallback to yfinance
-        yfinance_data = await self.collect_yfinance_data_enhanced([ticker])
-        if ticker in yfinance_data and not yfinance_data[ticker].empty:
-            logger.info(f"✅ {ticker}: Collected from yfinance fallback ({len(yfinance_data[ticker])} records)")
-            return yfinance_data[ticker]
+        yfinance_data = await self._collect_yfinance_single(ticker)
+        if yfinance_data is not None and not yfinance_data.empty:
+            logger.info(f"✅ {ticker}: Collected from yfinance fallback ({len(yfinance_data)} records)")
+            return yfinance_data
         
         logger.warning(f"⚠️ {ticker}: yfinance failed, trying Alpha Vantage fallback")
         
@@ -428,6 +613,37 @@ class MarketDataCollector:
         
         logger.error(f"❌ {ticker}: All data sources failed")
         return None
+    
+    async def collect_many(self, tickers: List[str], start_date: Optional[str] = None,
+                           max_concurrency: int = 16) -> Dict[str, pd.DataFrame]:
+        """
+        Collect market data for many tickers concurrently with failover
+        
+        Args:
+            tickers: List of ticker symbols
+            start_date: Start date for data collection
+            max_concurrency: Maximum tickers in flight at once
+            
+        Returns:
+            Dictionary mapping tickers to DataFrames for tickers that succeeded
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        async def _one(ticker: str) -> Tuple[str, Optional[pd.DataFrame]]:
+            async with sem:
+                return ticker, await self.collect_with_failover(ticker, start_date)
+        
+        outcomes = await asyncio.gather(*map(_one, tickers), return_exceptions=True)
+        
+        result = {}
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"❌ {ticker}: Failover collection raised: {outcome}")
+            elif outcome[1] is not None:
+                result[ticker] = outcome[1]
+        
+        logger.info(f"Collected market data for {len(result)}/{len(tickers)} tickers")
+        return result
 
     def collect_yfinance_data(self, tickers: List[str], period: str = "1d", interval: str = "1d") -> Dict[str, pd.DataFrame]:
         """
@@ -439,76 +655,39 @@ class MarketDataCollector:
             interval: Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)
         """
         result = {}
-        import time
+        yf_tickers = {ticker: self._to_yf_ticker(ticker) for ticker in tickers}
         
-        # Process tickers individually to avoid rate limits and API issues
-        for original_ticker in tickers:
+        # One threaded multi-ticker download per batch; tickers it misses fall back to
+        # individual history calls
+        batches = {}
+        ticker_list = list(yf_tickers)
+        for start in range(0, len(ticker_list), YF_BATCH_SIZE):
+            batch = ticker_list[start:start + YF_BATCH_SIZE]
             try:
-                logger.info(f"Collecting yfinance data for {original_ticker}")
-                
-                # Convert ticker to yfinance-compatible format
-                yf_ticker = original_ticker
-                
-                # Index symbol mapping (for proper Yahoo Finance symbols)
-                index_symbols = {
-                    'DJI': '^DJI',
-                    'NASDAQ': '^IXIC', 
-                    'SPX': '^GSPC',
-                    'RUT': '^RUT',
-                    'VIX': '^VIX',
-                    'NIFTY': '^NSEI',
-                    '^BSESN': '^BSESN',
-                    '^FTSE': '^FTSE',
-                    '^GDAXI': '^GDAXI',
-                    '^GSPC': '^GSPC',
-                    '^IXIC': '^IXIC',
-                    '^N225': '^N225',
-                    '^NSEI': '^NSEI',
-                    '^RUT': '^RUT',
-                    '^VIX': '^VIX'
-                }
-                
-                # Crypto symbol mapping
-                crypto_symbols = [
-                    'BTC', 'ETH', 'SOL', 'ADA', 'DOT', 'ALGO', 'ATOM', 'AVAX', 
-                    'BCH', 'BNB', 'DOGE', 'UNI', 'VET', 'LINK', 'MATIC', 'XRP', 'LTC',
-                    'FIL', 'SHIB', 'THETA'
-                ]
-                
-                # Apply appropriate mapping
-                if original_ticker in index_symbols:
-                    yf_ticker = index_symbols[original_ticker]
-                elif original_ticker in crypto_symbols:
-                    yf_ticker = f"{original_ticker}-USD"
-                elif original_ticker in ['EURUSD', 'GBPUSD', 'USDJPY']:
-                    yf_ticker = f"{original_ticker}=X"
-                
-                # Create ticker object and download data with retry logic
-                ticker_obj = yf.Ticker(yf_ticker)
-                
-                # Try different approaches for different asset types
-                attempts = [
-                    {'period': period, 'interval': interval},
-                    {'period': '5d', 'interval': '1d'},  # Fallback to smaller period
-                    {'period': '1d', 'interval': '1h'},   # Fallback to hourly
-                ]
-                
+                data = yf.download(
+                    tickers=' '.join(yf_tickers[ticker] for ticker in batch),
+                    period=period,
+                    interval=interval,
+                    group_by='ticker',
+                    threads=True,
+                    auto_adjust=True,
+                    prepost=False,
+                    repair=True,  # Fix currency mismatches
+                    progress=False
+                )
+            except Exception as e:
+                logger.warning(f"Batched yfinance download failed for {len(batch)} tickers: {e}")
                 data = None
-                for attempt in attempts:
-                    try:
-                        data = ticker_obj.history(
-                            period=attempt['period'],
-                            interval=attempt['interval'],
-                            auto_adjust=True,
-                            prepost=False,
-                            timeout=30,
-                            repair=True  # Fix currency mismatches
-                        )
-                        if not data.empty:
-                            break
-                    except Exception as attempt_error:
-                        logger.debug(f"Attempt failed for {original_ticker}: {attempt_error}")
-                        continue
+            for ticker in batch:
+                batches[ticker] = (data, len(batch))
+        
+        for original_ticker, yf_ticker in yf_tickers.items():
+            try:
+                data, batch_size = batches[original_ticker]
+                data = self._split_download(data, yf_ticker, batch_size)
+                if data is None or data.empty:
+                    logger.info(f"Collecting yfinance data for {original_ticker} individually")
+                    data = self._history_with_attempts(original_ticker, yf_ticker, period, interval)
                 
                 if data is None or data.empty:
                     logger.warning(f"No data returned from yfinance for {original_ticker} ({yf_ticker})")
@@ -518,16 +697,7 @@ class MarketDataCollector:
                 df = data.reset_index()
                 
                 # Rename columns to match our schema
-                column_mapping = {
-                    'Date': 'timestamp',
-                    'Datetime': 'timestamp',
-                    'Open': 'open',
-                    'High': 'high',
-                    'Low': 'low',
-                    'Close': 'close',
-                    'Volume': 'volume'
-                }
-                df = df.rename(columns=column_mapping)
+                df.rename(columns=YF_COLMAP, inplace=True)
                 
                 # Add metadata
                 df['ticker'] = original_ticker
@@ -556,6 +726,36 @@ class MarketDataCollector:
         logger.info(f"Successfully collected yfinance data for {len(result)}/{len(tickers)} tickers")
         return result
     
+    def _history_with_attempts(self, ticker: str, yf_ticker: str, period: str,
+                               interval: str) -> Optional[pd.DataFrame]:
+        """Fetch one ticker's history, falling back to shorter periods and coarser intervals."""
+        ticker_obj = yf.Ticker(yf_ticker)
+        
+        # Try different approaches for different asset types
+        attempts = [
+            {'period': period, 'interval': interval},
+            {'period': '5d', 'interval': '1d'},  # Fallback to smaller period
+            {'period': '1d', 'interval': '1h'},   # Fallback to hourly
+        ]
+        
+        for attempt in attempts:
+            try:
+                data = ticker_obj.history(
+                    period=attempt['period'],
+                    interval=attempt['interval'],
+                    auto_adjust=True,
+                    prepost=False,
+                    timeout=30,
+                    repair=True  # Fix currency mismatches
+                )
+                if not data.empty:
+                    return data
+            except Exception as attempt_error:
+                logger.debug(f"Attempt failed for {ticker}: {attempt_error}")
+                continue
+        
+        return None
+    
     def collect_tiingo_data(self, ticker: str, start_date: Optional[str] = None) -> Optional[pd.DataFrame]:
         """
         Collect data from Tiingo API for a single ticker.
@@ -594,18 +794,10 @@ class MarketDataCollector:
             df['source'] = 'tiingo'
             
             # Rename columns to match our schema
-            column_mapping = {
-                'date': 'timestamp',
-                'open': 'open',
-                'high': 'high', 
-                'low': 'low',
-                'close': 'close',
-                'volume': 'volume'
-            }
-            df = df.rename(columns=column_mapping)
+            df = df.rename(columns=TIINGO_COLMAP, copy=False)
             
-            # Convert timestamp
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # Convert timestamp (Tiingo dates are ISO 8601 in UTC)
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', utc=True, cache=True)
             
             logger.info(f"Successfully collected Tiingo data for {ticker}: {len(df)} records")
             return df
@@ -614,7 +806,7 @@ class MarketDataCollector:
             logger.error(f"Failed to collect Tiingo data for {ticker}: {e}")
             return None
     
-    def collect_crypto_data(self, crypto_symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    async def collect_crypto_data(self, crypto_symbols: List[str]) -> Dict[str, pd.DataFrame]:
         """
         Collect cryptocurrency data from CoinGecko API (free, no API key required).
         
@@ -648,6 +840,7 @@ class MarketDataCollector:
         }
         
         try:
+            session = await self._get_session()
             for symbol in crypto_symbols:
                 if symbol not in crypto_mapping:
                     continue
@@ -665,10 +858,9 @@ class MarketDataCollector:
                     'include_last_updated_at': 'true'
                 }
                 
-                response = self.session.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
+                async with session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    data = _loads(await response.read())
                 
                 if coingecko_id in data:
                     price_data = data[coingecko_id]
@@ -689,8 +881,7 @@ class MarketDataCollector:
                     logger.info(f"Successfully collected crypto data for {symbol}: ${price_data['usd']:.2f}")
                 
                 # Rate limiting
-                import time
-                time.sleep(0.2)
+                await asyncio.sleep(0.2)
                 
         except Exception as e:
             logger.error(f"Failed to collect crypto data: {e}")
@@ -699,64 +890,125 @@ class MarketDataCollector:
 
     def calculate_bid_ask_spread(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate bid-ask spread approximation from OHLC data."""
-        try:
-            # Simple approximation: spread = (high - low) / close
-            df['bid_ask_spread'] = ((df['high'] - df['low']) / df['close']) * 100
-            return df
-        except Exception as e:
-            logger.warning(f"Failed to calculate bid-ask spread: {e}")
-            df['bid_ask_spread'] = None
-            return df
+        # Simple approximation: spread = (high - low) / close; non-positive closes yield NaN
+        high = df['high'].to_numpy(dtype=np.float64, copy=False)
+        low = df['low'].to_numpy(dtype=np.float64, copy=False)
+        close = df['close'].to_numpy(dtype=np.float64, copy=False)
+        
+        spread = np.full_like(close, np.nan)
+        np.divide(high - low, close, out=spread, where=close > 0)
+        spread *= 100.0
+        df['bid_ask_spread'] = spread
+        return df
+    
+    def _build_price_records(self, ticker: Optional[str], df: pd.DataFrame) -> List[tuple]:
+        """
+        Build market_prices rows column-wise instead of walking the frame row by row.
+        
+        With ticker=None the frame's own 'ticker' column is used, so a long frame
+        holding many tickers converts in one pass. Timestamps are written as naive
+        UTC: market_prices.timestamp has no time zone, so an offset left on the
+        value would be dropped rather than applied.
+        """
+        timestamps = pd.to_datetime(df['timestamp'], utc=True).dt.tz_localize(None)
+        cols = pd.DataFrame({'timestamp': timestamps})
+        for col in ('open', 'high', 'low', 'close', 'volume', 'bid_ask_spread'):
+            cols[col] = pd.to_numeric(df[col], errors='coerce') if col in df.columns else np.nan
+        
+        # Skip rows missing the required fields
+        cols = cols.dropna(subset=['close', 'volume'])
+        if cols.empty:
+            return []
+        
+        # Optional prices become None so they bind as NULL; tolist() yields native Python scalars
+        def _nullable(col: str) -> List[Optional[float]]:
+            return cols[col].astype(object).where(cols[col].notna(), None).tolist()
+        
+        if 'source' in df.columns:
+            sources = df.loc[cols.index, 'source'].fillna('unknown').tolist()
+        else:
+            sources = repeat('unknown')
+        
+        tickers = repeat(ticker) if ticker is not None else df.loc[cols.index, 'ticker'].tolist()
+        
+        return list(zip(
+            tickers,
+            cols['timestamp'].tolist(),
+            _nullable('open'),
+            _nullable('high'),
+            _nullable('low'),
+            cols['close'].to_numpy(dtype=np.float64).tolist(),
+            cols['volume'].to_numpy().astype(np.int64).tolist(),
+            _nullable('bid_ask_spread'),
+            sources
+        ))
+    
+    @staticmethod
+    def _combine_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Stack per-ticker frames into one long frame, later sources winning on (ticker, timestamp)."""
+        # Sources report in different zones (yfinance in exchange time, Tiingo in UTC);
+        # put each on UTC first so the stacked column stays datetime64 and duplicates line up
+        frames = [
+            df.assign(timestamp=pd.to_datetime(df['timestamp'], utc=True))
+            for df in frames if df is not None and not df.empty
+        ]
+        if not frames:
+            return pd.DataFrame()
+        frame = pd.concat(frames, ignore_index=True)
+        return frame.drop_duplicates(subset=['ticker', 'timestamp'], keep='last', ignore_index=True)
     
     def store_market_data(self, data_dict: Dict[str, pd.DataFrame]) -> int:
         """Store market data in PostgreSQL database."""
-        total_inserted = 0
+        frames = [df.assign(ticker=ticker) for ticker, df in data_dict.items() if not df.empty]
+        return self.store_market_frame(self._combine_frames(frames))
+    
+    def store_market_frame(self, frame: pd.DataFrame) -> int:
+        """
+        Store a long-format market data frame (one 'ticker' column) in PostgreSQL.
         
-        for ticker, df in data_dict.items():
-            if df.empty:
-                continue
-            
+        All rows are loaded in a single COPY through a staging table; if that fails,
+        tickers fall back to individual multi-row upserts so one bad ticker does not
+        drop the rest. Likewise, if the combined frame can't be prepared, each
+        ticker is prepared on its own and only the failing ones are skipped.
+        """
+        if frame.empty:
+            return 0
+        
+        try:
+            # Calculate bid-ask spread
+            frame = self.calculate_bid_ask_spread(frame)
+            records = self._build_price_records(None, frame)
+        except Exception as e:
+            logger.warning(f"Failed to prepare combined market data, preparing tickers individually: {e}")
+            records = []
+            for ticker, ticker_frame in frame.groupby('ticker', sort=False):
+                try:
+                    ticker_frame = self.calculate_bid_ask_spread(ticker_frame.copy())
+                    records.extend(self._build_price_records(ticker, ticker_frame))
+                except Exception as ticker_error:
+                    logger.error(f"Failed to prepare market data for {ticker}: {ticker_error}")
+        
+        if not records:
+            return 0
+        
+        try:
+            total_inserted = copy_market_prices(records)
+            logger.info(f"Upserted {total_inserted} market price records for {frame['ticker'].nunique()} tickers")
+            return total_inserted
+        except Exception as e:
+            logger.warning(f"COPY load of market data failed, falling back to per-ticker upserts: {e}")
+        
+        records_by_ticker: Dict[str, List[tuple]] = {}
+        for record in records:
+            records_by_ticker.setdefault(record[0], []).append(record)
+        
+        total_inserted = 0
+        for ticker, ticker_records in records_by_ticker.items():
             try:
-                # Calculate bid-ask spread
-                df = self.calculate_bid_ask_spread(df)
-                
-                # Prepare data for bulk insert
-                records_to_insert = []
-                
-                for _, row in df.iterrows():
-                    try:
-                        # Skip if required fields are missing
-                        if pd.isna(row['close']) or pd.isna(row['volume']):
-                            continue
-                        
-                        record = (
-                            ticker,
-                            row['timestamp'],
-                            float(row.get('open', 0)) if not pd.isna(row.get('open')) else None,
-                            float(row.get('high', 0)) if not pd.isna(row.get('high')) else None,
-                            float(row.get('low', 0)) if not pd.isna(row.get('low')) else None,
-                            float(row['close']),
-                            int(row['volume']) if not pd.isna(row['volume']) else 0,
-                            float(row.get('bid_ask_spread', 0)) if not pd.isna(row.get('bid_ask_spread')) else None,
-                            row.get('source', 'unknown')
-                        )
-                        records_to_insert.append(record)
-                        
-                    except Exception as e:
-                        logger.warning(f"Skipping invalid record for {ticker}: {e}")
-                        continue
-                
-                if records_to_insert:
-                    # Bulk upsert to handle duplicates
-                    columns = ['ticker', 'timestamp', 'open', 'high', 'low', 'close', 'volume', 'bid_ask_spread', 'source']
-                    conflict_columns = ['ticker', 'timestamp']
-                    update_columns = ['open', 'high', 'low', 'close', 'volume', 'bid_ask_spread', 'source']
-                    
-                    inserted_count = db.bulk_upsert('market_prices', columns, records_to_insert, 
-                                                   conflict_columns, update_columns)
-                    total_inserted += inserted_count
-                    logger.info(f"Upserted {inserted_count} market price records for {ticker}")
-                
+                # Multi-row upsert to handle duplicates in a handful of round-trips
+                inserted_count = bulk_insert_market_prices(ticker_records)
+                total_inserted += inserted_count
+                logger.info(f"Upserted {inserted_count} market price records for {ticker}")
             except Exception as e:
                 logger.error(f"Failed to store market data for {ticker}: {e}")
         
@@ -792,28 +1044,37 @@ class MarketDataCollector:
                 etf_tickers = TRACKED_ASSETS.get('etfs', [])
                 all_supported = stock_tickers + etf_tickers
                 
-                for ticker in all_supported:
-                    ticker_data = self.collect_tiingo_data(ticker)
-                    if ticker_data is not None:
+                # Fetch concurrently; the tiingo token bucket paces the requests
+                start_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+                sem = asyncio.Semaphore(TIINGO_CONCURRENCY)
+                
+                async def _fetch(ticker: str) -> Optional[pd.DataFrame]:
+                    async with sem:
+                        return await self.collect_tiingo_data_enhanced(ticker, start_date)
+                
+                outcomes = await asyncio.gather(*map(_fetch, all_supported), return_exceptions=True)
+                for ticker, ticker_data in zip(all_supported, outcomes):
+                    if isinstance(ticker_data, Exception):
+                        logger.error(f"Failed to collect Tiingo data for {ticker}: {ticker_data}")
+                    elif ticker_data is not None:
                         tiingo_data[ticker] = ticker_data
-                    # Small delay to avoid rate limits
-                    import time
-                    time.sleep(0.1)
             
             # Collect crypto data as fallback
             crypto_data = {}
             crypto_tickers = TRACKED_ASSETS.get('crypto', [])
             if crypto_tickers:
-                crypto_data = self.collect_crypto_data(crypto_tickers)
+                crypto_data = await self.collect_crypto_data(crypto_tickers)
             
-            # Combine data sources
-            all_data = {**yfinance_data, **tiingo_data, **crypto_data}
+            # Combine data sources into one long frame; Tiingo then crypto rows win on overlap
+            frame = self._combine_frames([
+                *yfinance_data.values(), *tiingo_data.values(), *crypto_data.values()
+            ])
             
             # Store in database
-            if all_data:
-                records_inserted = self.store_market_data(all_data)
+            if not frame.empty:
+                records_inserted = self.store_market_frame(frame)
                 results['records_inserted'] = records_inserted
-                results['tickers_processed'] = len(all_data)
+                results['tickers_processed'] = frame['ticker'].nunique()
             
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
@@ -834,10 +1095,45 @@ class MarketDataCollector:
 # Global collector instance
 market_collector = MarketDataCollector()
 
+# Long-lived event loop the sync wrapper submits to, so the pooled aiohttp session
+# and its warm connections survive across cycles; started on first use
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the background event loop."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="market-loop", daemon=True).start()
+            atexit.register(_shutdown_background_loop)
+            _background_loop = loop
+        return _background_loop
+
+
+def _run_in_background(coro):
+    """Run a coroutine on the background loop and block for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+def _shutdown_background_loop():
+    """Close the pooled session and stop the background loop at interpreter exit."""
+    loop = _background_loop
+    if loop is None or not loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(market_collector.close(), loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"Failed to close market session on shutdown: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+
+
 # Convenience functions for external use
 def collect_market_data() -> Dict[str, Any]:
     """Synchronous wrapper for market data collection."""
-    return asyncio.run(market_collector.run_collection_cycle())
+    return _run_in_background(market_collector.run_collection_cycle())
 
 def collect_single_ticker(ticker: str, source: str = "yfinance") -> bool:
     """Collect data for a single ticker."""
@@ -5,21 +5,154 @@ Collects real-time headlines, trade halts, and earnings alerts.
 
 import logging
 import asyncio
+import atexit
+import hashlib
 import json
-import websockets
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cached_property
+from itertools import islice
 from typing import List, Dict, Any, Optional
+import aiohttp
+import pandas as pd
 import requests
-import feedparser
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from dateutil.tz import tzlocal
 
 from ..config.settings import settings, TRACKED_ASSETS
-from ..db.postgres_handler import db, insert_news_headline
+from ..db.postgres_handler import db, insert_news_headline, bulk_insert_news_headlines
 from ..utils.logging_utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# C-accelerated JSON for WebSocket frames
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _loads(message: Any) -> Any:
+    """Decode a JSON message (str or bytes), preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+def _dumps(value: Any) -> str:
+    """Encode a JSON text message, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+# Incremental JSON parsing so limited news requests only decode the items they keep
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
+# Bodies smaller than this are cheaper to decode whole than to stream
+STREAM_JSON_MIN_BYTES = 64 * 1024
+
+
+def _should_stream(content_length: Optional[int], limit: Optional[int]) -> bool:
+    """Stream-parse only when a prefix is wanted and the body is not known to be small."""
+    return (IJSON_AVAILABLE and limit is not None
+            and (content_length is None or content_length >= STREAM_JSON_MIN_BYTES))
+
+# C-accelerated multi-pattern matching for headline ticker extraction
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Company names mentioned in headlines (basic mapping)
+COMPANY_TICKERS = {
+    'APPLE': 'AAPL',
+    'TESLA': 'TSLA', 
+    'MICROSOFT': 'MSFT',
+    'GOOGLE': 'GOOGL',
+    'AMAZON': 'AMZN',
+    'BITCOIN': 'BTC',
+    'ETHEREUM': 'ETH'
+}
+
+# Finnhub free-tier REST budget
+FINNHUB_CALLS_PER_MINUTE = 60
+
+# Finnhub REST requests in flight at once
+FINNHUB_CONCURRENCY = 5
+
+PERPLEXITY_DEFAULT_QUERY = "financial markets news"
+
+# Seconds a Perplexity summary is reused for the same (normalized) query
+PERPLEXITY_CACHE_TTL = 300
+
+# Seconds a processed Finnhub news list is reused before revalidating with a conditional GET
+FINNHUB_NEWS_TTL = 60
+
+# WebSocket articles are queued and written in batches: at most this many buffered,
+# flushed every WS_FLUSH_INTERVAL seconds or once WS_FLUSH_BATCH are waiting
+WS_QUEUE_MAX = 1000
+WS_FLUSH_INTERVAL = 0.5
+WS_FLUSH_BATCH = 500
+
+def _normalize_query(query: str) -> str:
+    """Cache key for a Perplexity query: case- and whitespace-insensitive."""
+    return ' '.join(query.lower().split())
+
+# Recently stored article URLs remembered (as 8-byte digests) to skip duplicate inserts
+SEEN_URLS_MAX = 50000
+
+
+def _url_key(url: str) -> bytes:
+    """Compact fixed-size key for an article URL."""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest()
+
+# Batches at least this large convert epoch timestamps in one vectorized pass
+VECTORIZE_MIN_ARTICLES = 50
+
+
+def _published_times(articles: List[Dict[str, Any]]) -> List[Optional[datetime]]:
+    """
+    Convert Finnhub epoch-second 'datetime' fields to naive local datetimes, matching
+    datetime.fromtimestamp; entries that cannot be converted come back as None.
+    """
+    if len(articles) < VECTORIZE_MIN_ARTICLES:
+        published = []
+        for article in articles:
+            try:
+                published.append(datetime.fromtimestamp(article.get('datetime', 0)))
+            except (TypeError, ValueError, OverflowError, OSError):
+                published.append(None)
+        return published
+    
+    epochs = pd.to_numeric(pd.Series([article.get('datetime', 0) for article in articles]), errors='coerce')
+    stamps = pd.to_datetime(epochs, unit='s', utc=True, errors='coerce').dt.tz_convert(tzlocal()).dt.tz_localize(None)
+    return [None if pd.isna(ts) else ts.to_pydatetime() for ts in stamps]
+
+@dataclass(slots=True)
+class Article:
+    """A standardized news article as produced by the collectors."""
+    headline: str
+    url: str
+    source: str
+    published_at: datetime
+    ticker: Optional[str]
+    raw_data: Dict[str, Any]
+    content: Optional[str] = None
+
 class NewsCollector:
     """Collects news data from Finnhub and Perplexity APIs."""
     
@@ -38,21 +171,83 @@ class NewsCollector:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Pool sized for the threaded/backfill callers so connections are kept alive and reused
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
         self.websocket = None
         self.is_collecting = False
+        self._ws_queue: Optional[asyncio.Queue] = None
+        self._ws_flusher: Optional[asyncio.Task] = None
+        
+        # Pooled aiohttp session for the async REST fetches, created lazily per event loop
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Monotonic times of recent Finnhub REST calls, oldest first
+        self._finnhub_calls = deque()
+        self._finnhub_sem: Optional[asyncio.Semaphore] = None
+        
+        # Processed news per (category, limit): (fetched_at, articles), plus the
+        # ETag/Last-Modified validators that let a refetch come back as 304
+        self._news_cache: Dict[tuple, tuple] = {}
+        self._validators: Dict[tuple, Dict[str, str]] = {}
+        
+        # Perplexity summaries per normalized query: (fetched_at, articles)
+        self._perplexity_cache: Dict[str, tuple] = {}
+        
+        # Newest company-news publish time stored per ticker, for delta fetches
+        self._company_last_seen: Dict[str, datetime] = {}
+        
+        # URL digests of articles already in news_headlines, least recently seen first;
+        # seeded from the last day of headlines on first store
+        self._seen_urls: OrderedDict = OrderedDict()
+        self._seen_urls_seeded = False
+        
+        self._build_ticker_matcher()
+    
+    def _build_ticker_matcher(self):
+        """
+        Precompute headline match keys in priority order: explicit ticker mentions
+        first (in TRACKED_ASSETS order), then company names.
+        """
+        keys = []
+        for ticker in self.relevant_tickers:
+            # Ticker in parentheses like "Apple (AAPL)" or just "AAPL"
+            keys.append((f"({ticker})", ticker))
+            keys.append((f" {ticker} ", ticker))
+        keys.extend(COMPANY_TICKERS.items())
+        
+        # Highest-priority ticker per distinct key
+        self._ticker_keys = {}
+        for priority, (key, ticker) in enumerate(keys):
+            self._ticker_keys.setdefault(key, (priority, ticker))
+        
+        # Fallback: one compiled alternation, wrapped in a lookahead so overlapping
+        # mentions (e.g. " AAPL MSFT " sharing a space) are all seen
+        self._ticker_re = re.compile(
+            '(?=(' + '|'.join(map(re.escape, self._ticker_keys)) + '))'
+        )
+        
+        self._ticker_ac = None
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for key, value in self._ticker_keys.items():
+                automaton.add_word(key, value)
+            automaton.make_automaton()
+            self._ticker_ac = automaton
+    
+    @cached_property
+    def relevant_tickers(self) -> tuple:
+        """All tracked tickers, flattened once; del the attribute if TRACKED_ASSETS changes."""
+        return tuple(ticker for tickers in TRACKED_ASSETS.values() for ticker in tickers)
     
     def get_relevant_tickers(self) -> List[str]:
         """Get all tracked tickers for news collection."""
-        all_tickers = []
-        for asset_type, tickers in TRACKED_ASSETS.items():
-            all_tickers.extend(tickers)
-        return all_tickers
+        return list(self.relevant_tickers)
     
-    def collect_finnhub_news(self, category: str = "general", limit: int = 50) -> List[Dict[str, Any]]:
+    def collect_finnhub_news(self, category: str = "general", limit: int = 50) -> List[Article]:
         """
         Collect news from Finnhub REST API.
         
@@ -71,43 +266,28 @@ class NewsCollector:
                 'token': settings.FINNHUB_API_KEY
             }
             
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            news_data = response.json()
+            with self.session.get(url, params=params, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                content_length = response.headers.get('Content-Length')
+                if _should_stream(int(content_length) if content_length else None, limit):
+                    # Only the first `limit` articles are used; stop parsing there
+                    response.raw.decode_content = True
+                    news_data = list(islice(ijson.items(response.raw, 'item', use_float=True), limit))
+                else:
+                    news_data = _loads(response.content)
             
             if not news_data:
                 logger.warning(f"No Finnhub news data returned for category: {category}")
                 return []
             
-            # Limit results
-            news_data = news_data[:limit]
-            
-            # Process and standardize the data
-            processed_news = []
-            for article in news_data:
-                try:
-                    processed_article = {
-                        'headline': article.get('headline', ''),
-                        'url': article.get('url', ''),
-                        'source': f"finnhub_{category}",
-                        'published_at': datetime.fromtimestamp(article.get('datetime', 0)),
-                        'ticker': self.extract_ticker_from_headline(article.get('headline', '')),
-                        'raw_data': article
-                    }
-                    processed_news.append(processed_article)
-                except Exception as e:
-                    logger.warning(f"Failed to process Finnhub article: {e}")
-                    continue
-            
-            logger.info(f"Collected {len(processed_news)} Finnhub news articles")
-            return processed_news
+            return self._process_finnhub_news(news_data, category, limit)
             
         except Exception as e:
             logger.error(f"Failed to collect Finnhub news: {e}")
             return []
     
-    def collect_company_news(self, ticker: str, days_back: int = 1) -> List[Dict[str, Any]]:
+    def collect_company_news(self, ticker: str, days_back: int = 1) -> List[Article]:
         """
         Collect company-specific news from Finnhub.
         
@@ -139,31 +319,239 @@ class NewsCollector:
             if not news_data:
                 return []
             
-            # Process articles
-            processed_news = []
-            for article in news_data:
-                try:
-                    processed_article = {
-                        'headline': article.get('headline', ''),
-                        'url': article.get('url', ''),
-                        'source': 'finnhub_company',
-                        'published_at': datetime.fromtimestamp(article.get('datetime', 0)),
-                        'ticker': ticker,
-                        'raw_data': article
-                    }
-                    processed_news.append(processed_article)
-                except Exception as e:
-                    logger.warning(f"Failed to process company news for {ticker}: {e}")
-                    continue
+            return self._process_company_news(news_data, ticker)
+            
+        except Exception as e:
+            logger.error(f"Failed to collect company news for {ticker}: {e}")
+            return []
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled aiohttp session, recreating it if closed or bound to another loop."""
+        loop = asyncio.get_running_loop()
+        if (self._async_session is None or self._async_session.closed
+                or self._async_session_loop is not loop):
+            connector = aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=20,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._async_session_loop = loop
+            self._finnhub_sem = asyncio.Semaphore(FINNHUB_CONCURRENCY)
+        return self._async_session
+    
+    async def close(self):
+        """Close the pooled aiohttp session."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_session_loop = None
+    
+    async def _wait_for_finnhub_slot(self):
+        """Wait until another Finnhub call fits in the per-minute budget, then claim it."""
+        calls = self._finnhub_calls
+        while True:
+            now = time.monotonic()
+            while calls and now - calls[0] >= 60:
+                calls.popleft()
+            if len(calls) < FINNHUB_CALLS_PER_MINUTE:
+                calls.append(now)
+                return
+            await asyncio.sleep(60 - (now - calls[0]))
+    
+    async def _fetch_json(self, url: str, params: Dict[str, Any], cache_key: Optional[tuple] = None,
+                          limit: Optional[int] = None, conditional: bool = True) -> Any:
+        """
+        GET a Finnhub endpoint within the rate budget and decode the JSON body.
+        
+        With a cache_key the response's validators are stored under it and, if
+        conditional, the request carries the ones stored last time; None is returned
+        when the server answers 304 Not Modified. With a limit on a top-level array,
+        parsing stops after that many items.
+        """
+        session = await self._get_session()
+        async with self._finnhub_sem:
+            await self._wait_for_finnhub_slot()
+            return await self._get_json(session, url, params, cache_key, limit, conditional)
+    
+    async def _get_json(self, session: aiohttp.ClientSession, url: str, params: Dict[str, Any],
+                        cache_key: Optional[tuple], limit: Optional[int], conditional: bool = True) -> Any:
+        """Issue the GET for _fetch_json and decode the body."""
+        headers = self._validators.get(cache_key) if cache_key is not None and conditional else None
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status == 304:
+                return None
+            response.raise_for_status()
+            if _should_stream(response.content_length, limit):
+                data = []
+                async for item in ijson.items(response.content, 'item', use_float=True):
+                    data.append(item)
+                    if len(data) >= limit:
+                        break
+            else:
+                data = _loads(await response.read())
+            
+            if cache_key is not None:
+                validators = {}
+                if 'ETag' in response.headers:
+                    validators['If-None-Match'] = response.headers['ETag']
+                if 'Last-Modified' in response.headers:
+                    validators['If-Modified-Since'] = response.headers['Last-Modified']
+                self._validators[cache_key] = validators
+            return data
+    
+    async def async_collect_finnhub_news(self, category: str = "general", limit: int = 50) -> List[Article]:
+        """
+        Async counterpart of collect_finnhub_news.
+        
+        Results are reused for FINNHUB_NEWS_TTL seconds, then revalidated with a
+        conditional GET so an unchanged feed costs a 304 and no reprocessing.
+        """
+        if not settings.FINNHUB_API_KEY:
+            logger.warning("Finnhub API key not configured")
+            return []
+        
+        key = (category, limit)
+        cached = self._news_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < FINNHUB_NEWS_TTL:
+            return cached[1]
+        
+        try:
+            news_data = await self._fetch_json(
+                f"{settings.FINNHUB_BASE_URL}/news",
+                {'category': category, 'token': settings.FINNHUB_API_KEY},
+                cache_key=key,
+                conditional=cached is not None,
+                limit=limit
+            )
+            
+            if news_data is None:
+                logger.debug(f"Finnhub {category} news not modified")
+                self._news_cache[key] = (time.monotonic(), cached[1])
+                return cached[1]
+            
+            if not news_data:
+                logger.warning(f"No Finnhub news data returned for category: {category}")
+                return []
             
-            logger.info(f"Collected {len(processed_news)} company news articles for {ticker}")
+            processed_news = self._process_finnhub_news(news_data, category, limit)
+            self._news_cache[key] = (time.monotonic(), processed_news)
             return processed_news
             
+        except Exception as e:
+            logger.error(f"Failed to collect Finnhub news: {e}")
+            return []
+    
+    async def async_collect_company_news(self, ticker: str, days_back: int = 1) -> List[Article]:
+        """
+        Async counterpart of collect_company_news that only returns articles no older
+        than the last ones stored for the ticker.
+        
+        The window starts at the newest article already stored (Finnhub filters by
+        date), and the request is conditional on the ticker's last ETag/Last-Modified,
+        so an unchanged feed costs a 304. Articles from that same second come back
+        again and are dropped by store_news_batch's seen-URL filter.
+        """
+        if not settings.FINNHUB_API_KEY:
+            return []
+        
+        try:
+            to_date = datetime.now()
+            from_date = to_date - timedelta(days=days_back)
+            last_seen = self._company_last_seen.get(ticker)
+            if last_seen is not None and last_seen > from_date:
+                from_date = last_seen
+            
+            news_data = await self._fetch_json(
+                f"{settings.FINNHUB_BASE_URL}/company-news",
+                {
+                    'symbol': ticker,
+                    'from': from_date.strftime('%Y-%m-%d'),
+                    'to': to_date.strftime('%Y-%m-%d'),
+                    'token': settings.FINNHUB_API_KEY
+                },
+                cache_key=('company', ticker)
+            )
+            
+            if not news_data:
+                if news_data is None:
+                    logger.debug(f"Finnhub company news for {ticker} not modified")
+                return []
+            
+            articles = self._process_company_news(news_data, ticker)
+            if last_seen is not None:
+                articles = [article for article in articles if article.published_at >= last_seen]
+            return articles
+            
         except Exception as e:
             logger.error(f"Failed to collect company news for {ticker}: {e}")
             return []
     
-    def collect_perplexity_finance_news(self, query: str = "financial markets news") -> List[Dict[str, Any]]:
+    def _process_finnhub_news(self, news_data: List[Dict[str, Any]], category: str,
+                              limit: int) -> List[Article]:
+        """Standardize a Finnhub /news response."""
+        # Limit results
+        news_data = news_data[:limit]
+        
+        # Process and standardize the data
+        processed_news = []
+        for article, published_at in zip(news_data, _published_times(news_data)):
+            try:
+                if published_at is None:
+                    raise ValueError(f"invalid datetime {article.get('datetime')!r}")
+                processed_article = Article(
+                    headline=article.get('headline', ''),
+                    url=article.get('url', ''),
+                    source=f"finnhub_{category}",
+                    published_at=published_at,
+                    ticker=self.extract_ticker_from_headline(article.get('headline', '')),
+                    raw_data=article
+                )
+                processed_news.append(processed_article)
+            except Exception as e:
+                logger.warning(f"Failed to process Finnhub article: {e}")
+                continue
+        
+        logger.info(f"Collected {len(processed_news)} Finnhub news articles")
+        return processed_news
+    
+    def _process_company_news(self, news_data: List[Dict[str, Any]], ticker: str) -> List[Article]:
+        """Standardize a Finnhub /company-news response."""
+        # Process articles
+        processed_news = []
+        for article, published_at in zip(news_data, _published_times(news_data)):
+            try:
+                if published_at is None:
+                    raise ValueError(f"invalid datetime {article.get('datetime')!r}")
+                processed_article = Article(
+                    headline=article.get('headline', ''),
+                    url=article.get('url', ''),
+                    source='finnhub_company',
+                    published_at=published_at,
+                    ticker=ticker,
+                    raw_data=article
+                )
+                processed_news.append(processed_article)
+            except Exception as e:
+                logger.warning(f"Failed to process company news for {ticker}: {e}")
+                continue
+        
+        logger.info(f"Collected {len(processed_news)} company news articles for {ticker}")
+        return processed_news
+    
+    def _cached_perplexity(self, query: str) -> Optional[List[Article]]:
+        """Summary articles for this query if fetched within PERPLEXITY_CACHE_TTL, else None."""
+        entry = self._perplexity_cache.get(_normalize_query(query))
+        if entry is not None and time.monotonic() - entry[0] < PERPLEXITY_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def collect_perplexity_finance_news(self, query: str = PERPLEXITY_DEFAULT_QUERY) -> List[Article]:
         """
         Collect summarized financial news from Perplexity.
         
@@ -174,6 +562,11 @@ class NewsCollector:
             logger.warning("Perplexity API key not configured")
             return []
         
+        cached = self._cached_perplexity(query)
+        if cached is not None:
+            logger.debug(f"Using cached Perplexity summary for: {query}")
+            return cached
+        
         try:
             url = f"{settings.PERPLEXITY_BASE_URL}/chat/completions"
             
@@ -210,17 +603,18 @@ class NewsCollector:
             content = result['choices'][0]['message']['content']
             
             # Create a single news entry with the summary
-            processed_article = {
-                'headline': f"Financial Market Summary: {query}",
-                'url': '',
-                'source': 'perplexity_finance',
-                'published_at': datetime.now(),
-                'ticker': None,  # General market news
-                'content': content,
-                'raw_data': result
-            }
+            processed_article = Article(
+                headline=f"Financial Market Summary: {query}",
+                url='',
+                source='perplexity_finance',
+                published_at=datetime.now(),
+                ticker=None,  # General market news
+                content=content,
+                raw_data=result
+            )
             
             logger.info("Collected Perplexity finance summary")
+            self._perplexity_cache[_normalize_query(query)] = (time.monotonic(), [processed_article])
             return [processed_article]
             
         except Exception as e:
@@ -237,29 +631,19 @@ class NewsCollector:
         
         headline_upper = headline.upper()
         
-        # Check for explicit ticker mentions
-        all_tickers = self.get_relevant_tickers()
-        for ticker in all_tickers:
-            # Look for ticker in parentheses like "Apple (AAPL)" or just "AAPL"
-            if f"({ticker})" in headline_upper or f" {ticker} " in headline_upper:
-                return ticker
-        
-        # Check for company name mentions (basic mapping)
-        company_mappings = {
-            'APPLE': 'AAPL',
-            'TESLA': 'TSLA', 
-            'MICROSOFT': 'MSFT',
-            'GOOGLE': 'GOOGL',
-            'AMAZON': 'AMZN',
-            'BITCOIN': 'BTC',
-            'ETHEREUM': 'ETH'
-        }
-        
-        for company, ticker in company_mappings.items():
-            if company in headline_upper:
-                return ticker
+        # One pass over the headline; keep the highest-priority match
+        if self._ticker_ac is not None:
+            matches = (value for _, value in self._ticker_ac.iter(headline_upper))
+        else:
+            matches = (self._ticker_keys[m.group(1)] for m in self._ticker_re.finditer(headline_upper))
         
-        return None
+        best = None
+        for priority, ticker in matches:
+            if best is None or priority < best[0]:
+                best = (priority, ticker)
+                if priority == 0:
+                    break
+        return best[1] if best else None
     
     async def start_finnhub_websocket(self, symbols: Optional[List[str]] = None):
         """
@@ -273,15 +657,22 @@ class NewsCollector:
             return
         
         if symbols is None:
-            symbols = self.get_relevant_tickers()[:10]  # Limit to avoid rate limits
+            symbols = list(self.relevant_tickers[:10])  # Limit to avoid rate limits
+        
+        # Imported here so processes that never stream don't pay for it
+        import websockets
         
         try:
             self.websocket = await websockets.connect(self.finnhub_ws_url)
             self.is_collecting = True
             
+            # Batch article inserts off the receive path
+            self._ws_queue = asyncio.Queue(maxsize=WS_QUEUE_MAX)
+            self._ws_flusher = asyncio.create_task(self._flush_websocket_articles())
+            
             # Subscribe to news for each symbol
             for symbol in symbols:
-                subscribe_msg = json.dumps({"type": "subscribe", "symbol": symbol})
+                subscribe_msg = _dumps({"type": "subscribe", "symbol": symbol})
                 await self.websocket.send(subscribe_msg)
                 logger.info(f"Subscribed to Finnhub news for {symbol}")
             
@@ -292,16 +683,64 @@ class NewsCollector:
         except Exception as e:
             logger.error(f"Finnhub WebSocket connection failed: {e}")
             self.is_collecting = False
+        finally:
+            await self._stop_websocket_flusher()
+    
+    async def _flush_websocket_articles(self):
+        """Drain queued WebSocket articles into batched inserts, off the event loop, until cancelled."""
+        loop = asyncio.get_running_loop()
+        queue = self._ws_queue
+        batch = []
+        try:
+            while True:
+                batch.append(await queue.get())
+                deadline = loop.time() + WS_FLUSH_INTERVAL
+                while len(batch) < WS_FLUSH_BATCH:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                
+                pending, batch = batch, []
+                await asyncio.to_thread(self.store_news_batch, pending)
+        except asyncio.CancelledError:
+            # Keep whatever was still being gathered when the stream stopped
+            if batch:
+                await asyncio.to_thread(self.store_news_batch, batch)
+            raise
+    
+    async def _stop_websocket_flusher(self):
+        """Stop the batch flusher and write out anything left in the queue."""
+        flusher, queue = self._ws_flusher, self._ws_queue
+        self._ws_flusher = None
+        self._ws_queue = None
+        if flusher is not None:
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        if queue is not None:
+            remaining = []
+            while not queue.empty():
+                remaining.append(queue.get_nowait())
+            if remaining:
+                await asyncio.to_thread(self.store_news_batch, remaining)
     
     async def listen_to_websocket(self):
         """Listen to WebSocket messages and process news."""
+        from websockets.exceptions import ConnectionClosed
+        
         try:
             async for message in self.websocket:
                 if not self.is_collecting:
                     break
                 
                 try:
-                    data = json.loads(message)
+                    data = _loads(message)
                     
                     # Process different message types
                     if data.get('type') == 'news':
@@ -315,7 +754,7 @@ class NewsCollector:
                 except Exception as e:
                     logger.error(f"Error processing WebSocket message: {e}")
                     
-        except websockets.exceptions.ConnectionClosed:
+        except ConnectionClosed:
             logger.info("Finnhub WebSocket connection closed")
         except Exception as e:
             logger.error(f"WebSocket listening error: {e}")
@@ -330,17 +769,20 @@ class NewsCollector:
                 if not headline:
                     continue
                 
-                processed_article = {
-                    'headline': headline,
-                    'url': news_item.get('url', ''),
-                    'source': 'finnhub_websocket',
-                    'published_at': datetime.fromtimestamp(news_item.get('datetime', 0)),
-                    'ticker': news_item.get('symbol') or self.extract_ticker_from_headline(headline),
-                    'raw_data': news_item
-                }
+                processed_article = Article(
+                    headline=headline,
+                    url=news_item.get('url', ''),
+                    source='finnhub_websocket',
+                    published_at=datetime.fromtimestamp(news_item.get('datetime', 0)),
+                    ticker=news_item.get('symbol') or self.extract_ticker_from_headline(headline),
+                    raw_data=news_item
+                )
                 
-                # Store in database
-                await self.store_news_article(processed_article)
+                # Queue for the batch flusher; store directly when no stream is running
+                if self._ws_queue is not None:
+                    await self._ws_queue.put(processed_article)
+                else:
+                    await self.store_news_article(processed_article)
                 
         except Exception as e:
             logger.error(f"Failed to process WebSocket news: {e}")
@@ -352,14 +794,14 @@ class NewsCollector:
             symbol = trade_data.get('s', '')
             if symbol:
                 headline = f"Trade halt notification for {symbol}"
-                processed_article = {
-                    'headline': headline,
-                    'url': '',
-                    'source': 'finnhub_trade_halt',
-                    'published_at': datetime.now(),
-                    'ticker': symbol,
-                    'raw_data': trade_data
-                }
+                processed_article = Article(
+                    headline=headline,
+                    url='',
+                    source='finnhub_trade_halt',
+                    published_at=datetime.now(),
+                    ticker=symbol,
+                    raw_data=trade_data
+                )
                 
                 await self.store_news_article(processed_article)
                 logger.info(f"Processed trade halt for {symbol}")
@@ -367,53 +809,107 @@ class NewsCollector:
         except Exception as e:
             logger.error(f"Failed to process trade halt: {e}")
     
-    async def store_news_article(self, article: Dict[str, Any]):
+    def _seed_seen_urls(self):
+        """Load the last day's stored URLs so a restart does not re-insert them."""
+        self._seen_urls_seeded = True
+        try:
+            rows = db.execute_query(
+                "SELECT url FROM news_headlines "
+                "WHERE published_at > NOW() - INTERVAL '1 day' AND url <> ''"
+            )
+        except Exception as e:
+            logger.warning(f"Could not seed seen news URLs: {e}")
+            return
+        self._remember_urls(_url_key(row['url']) for row in rows if row.get('url'))
+    
+    def _remember_urls(self, keys):
+        """Mark URL digests as stored, evicting the least recently seen past SEEN_URLS_MAX."""
+        seen = self._seen_urls
+        for key in keys:
+            seen[key] = None
+            seen.move_to_end(key)
+        while len(seen) > SEEN_URLS_MAX:
+            seen.popitem(last=False)
+    
+    def _is_seen(self, url: Optional[str]) -> bool:
+        """True if this URL was already stored; articles without a URL are never skipped."""
+        if not self._seen_urls_seeded:
+            self._seed_seen_urls()
+        return bool(url) and _url_key(url) in self._seen_urls
+    
+    async def store_news_article(self, article: Article):
         """Store a news article in the database."""
+        url = article.url
+        if self._is_seen(url):
+            logger.debug(f"Skipping already stored news article: {url}")
+            return
+        
         try:
             headline_id = insert_news_headline(
-                ticker=article.get('ticker') or '',
-                headline=article['headline'],
-                url=article.get('url', ''),
-                source=article['source'],
-                published_at=article['published_at'].isoformat()
+                ticker=article.ticker or '',
+                headline=article.headline,
+                url=url,
+                source=article.source,
+                published_at=article.published_at
             )
             
             if headline_id:
-                logger.debug(f"Stored news article: {article['headline'][:50]}...")
+                if url:
+                    self._remember_urls((_url_key(url),))
+                logger.debug(f"Stored news article: {article.headline[:50]}...")
                 
         except Exception as e:
             logger.error(f"Failed to store news article: {e}")
     
-    def store_news_batch(self, articles: List[Dict[str, Any]]) -> int:
+    def store_news_batch(self, articles: List[Article]) -> int:
         """Store multiple news articles in batch."""
-        stored_count = 0
+        # Skip articles missing required fields up front so the insert can go in one batch
+        rows = [
+            (article.ticker or '', article.headline, article.url, article.source, article.published_at)
+            for article in articles
+            if article.headline is not None and article.source
+            and isinstance(article.published_at, datetime)
+        ]
+        if len(rows) != len(articles):
+            logger.warning(f"Skipped {len(articles) - len(rows)} articles missing required fields")
         
-        for article in articles:
-            try:
-                headline_id = insert_news_headline(
-                    ticker=article.get('ticker') or '',
-                    headline=article['headline'],
-                    url=article.get('url', ''), 
-                    source=article['source'],
-                    published_at=article['published_at'].isoformat()
-                )
-                
-                if headline_id:
-                    stored_count += 1
-                    
-            except Exception as e:
-                logger.warning(f"Failed to store article: {e}")
-                continue
+        # Drop articles already stored by an earlier cycle or the websocket feed
+        fresh_rows = [row for row in rows if not self._is_seen(row[2])]
+        if len(fresh_rows) != len(rows):
+            logger.debug(f"Skipped {len(rows) - len(fresh_rows)} already stored news articles")
+        
+        try:
+            stored_count = bulk_insert_news_headlines(fresh_rows)
+        except Exception as e:
+            logger.warning(f"Failed to store news batch: {e}")
+            # Refetch these company feeds in full next cycle instead of accepting a 304
+            for article in articles:
+                if article.source == 'finnhub_company':
+                    self._validators.pop(('company', article.ticker), None)
+            return 0
         
+        self._remember_urls(_url_key(row[2]) for row in fresh_rows if row[2])
+        self._advance_company_cursors(articles)
         logger.info(f"Stored {stored_count} news articles in database")
         return stored_count
     
+    def _advance_company_cursors(self, articles: List[Article]):
+        """Move each ticker's company-news cursor up to the newest stored article."""
+        for article in articles:
+            if article.source != 'finnhub_company' or not isinstance(article.published_at, datetime):
+                continue
+            last_seen = self._company_last_seen.get(article.ticker)
+            if last_seen is None or article.published_at > last_seen:
+                self._company_last_seen[article.ticker] = article.published_at
+    
     async def stop_websocket(self):
         """Stop WebSocket connection."""
         self.is_collecting = False
         if self.websocket:
             await self.websocket.close()
             logger.info("Finnhub WebSocket connection stopped")
+        await self._stop_websocket_flusher()
+        await self.close()
     
     async def run_collection_cycle(self) -> Dict[str, Any]:
         """Run a complete news collection cycle."""
@@ -432,30 +928,43 @@ class NewsCollector:
         try:
             all_articles = []
             
-            # Collect general Finnhub news
+            # Fire every REST fetch at once; the Finnhub budget is enforced per call
+            fetches = []
             if settings.FINNHUB_API_KEY:
-                general_news = self.collect_finnhub_news(category="general", limit=20)
-                all_articles.extend(general_news)
-                results['sources_processed'].append("finnhub_general")
-                
-                # Collect crypto news
-                crypto_news = self.collect_finnhub_news(category="crypto", limit=15)
-                all_articles.extend(crypto_news)
-                results['sources_processed'].append("finnhub_crypto")
-                
-                # Collect company-specific news for top tickers
                 top_tickers = TRACKED_ASSETS.get('stocks', [])[:5]
-                for ticker in top_tickers:
-                    company_news = self.collect_company_news(ticker, days_back=1)
-                    all_articles.extend(company_news)
-                
-                results['sources_processed'].append("finnhub_company")
+                fetches.append(("finnhub_general", self.async_collect_finnhub_news(category="general", limit=20)))
+                fetches.append(("finnhub_crypto", self.async_collect_finnhub_news(category="crypto", limit=15)))
+                fetches.extend(
+                    ("finnhub_company", self.async_collect_company_news(ticker, days_back=1))
+                    for ticker in top_tickers
+                )
+            
+            # Perplexity summary still goes through the blocking requests session
+            # (skipped while the last summary is still fresh; it was stored when fetched)
+            if settings.PERPLEXITY_API_KEY and self._cached_perplexity(PERPLEXITY_DEFAULT_QUERY) is None:
+                fetches.append(("perplexity_finance", asyncio.to_thread(self.collect_perplexity_finance_news)))
+            
+            outcomes = await asyncio.gather(*(coro for _, coro in fetches), return_exceptions=True)
+            for (source_name, _), outcome in zip(fetches, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"News fetch for {source_name} failed: {outcome}")
+                    results['errors'].append(str(outcome))
+                    continue
+                all_articles.extend(outcome)
+                if source_name not in results['sources_processed']:
+                    results['sources_processed'].append(source_name)
             
-            # Collect Perplexity finance summary
-            if settings.PERPLEXITY_API_KEY:
-                perplexity_news = self.collect_perplexity_finance_news()
-                all_articles.extend(perplexity_news)
-                results['sources_processed'].append("perplexity_finance")
+            # Feeds overlap (and cached lists repeat), so keep one article per URL
+            seen_urls = set()
+            unique_articles = []
+            for article in all_articles:
+                url = article.url
+                if url:
+                    if url in seen_urls:
+                        continue
+                    seen_urls.add(url)
+                unique_articles.append(article)
+            all_articles = unique_articles
             
             # Store articles in database
             if all_articles:
@@ -482,15 +991,49 @@ class NewsCollector:
 # Global collector instance
 news_collector = NewsCollector()
 
+# Long-lived event loop the sync wrappers submit to, so sessions and the WebSocket
+# survive across calls; started on first use
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the background event loop."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="news-loop", daemon=True).start()
+            atexit.register(_shutdown_background_loop)
+            _background_loop = loop
+        return _background_loop
+
+
+def _run_in_background(coro):
+    """Run a coroutine on the background loop and block for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+def _shutdown_background_loop():
+    """Close the pooled session and stop the background loop at interpreter exit."""
+    loop = _background_loop
+    if loop is None or not loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(news_collector.close(), loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"Failed to close news session on shutdown: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+
 # Convenience functions for external use
 def collect_news() -> Dict[str, Any]:
     """Synchronous wrapper for news collection."""
-    return asyncio.run(news_collector.run_collection_cycle())
+    return _run_in_background(news_collector.run_collection_cycle())
 
 def start_realtime_news_collection(symbols: Optional[List[str]] = None):
     """Start real-time news collection via WebSocket."""
-    return asyncio.run(news_collector.start_finnhub_websocket(symbols))
+    return _run_in_background(news_collector.start_finnhub_websocket(symbols))
 
 def stop_realtime_news_collection():
     """Stop real-time news collection."""
-    return asyncio.run(news_collector.stop_websocket())
\ No newline at end of file
+    return _run_in_background(news_collector.stop_websocket())
@@ -6,20 +6,203 @@ Enhanced for 200+ asset universe with intelligent anomaly detection.
 
 import logging
 import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-import requests
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Mapping
+import aiohttp
+import numpy as np
 import pandas as pd
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import json
+from dateutil.tz import tzlocal
+
+# Faster JSON decoding for large options chains
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# libuv-based event loop for the background collection loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
 
 from ..config.settings import settings
-from ..db.postgres_handler import db, insert_anomaly
+from ..db.postgres_handler import db, bulk_insert_anomalies
 from ..utils.logging_utils import setup_logger
 
 logger = setup_logger(__name__)
 
+def _loads(body: bytes) -> Any:
+    """Decode a JSON response body, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+# Retry policy for Polygon/Tradier GETs (same shape as the old urllib3 Retry)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 1.0
+
+# Polygon options chain snapshot: contracts per page, and pages followed per ticker
+POLYGON_SNAPSHOT_URL = "https://api.polygon.io/v3/snapshot/options/{ticker}"
+POLYGON_SNAPSHOT_PAGE_SIZE = 250
+POLYGON_SNAPSHOT_MAX_PAGES = 10
+# Shared, read-only query string for the first snapshot page (auth goes in the header)
+POLYGON_SNAPSHOT_PARAMS = MappingProxyType({'limit': POLYGON_SNAPSHOT_PAGE_SIZE})
+
+# Polygon snapshot fields (flattened by json_normalize) -> option record keys
+POLYGON_FIELDS = {
+    'details.ticker': 'contract_ticker',
+    'details.contract_type': 'contract_type',
+    'details.strike_price': 'strike_price',
+    'details.expiration_date': 'expiration_date',
+    'day.volume': 'volume',
+    'day.open': 'open',
+    'day.close': 'close',
+    'day.high': 'high',
+    'day.low': 'low',
+    'open_interest': 'open_interest',
+    'implied_volatility': 'implied_volatility',
+    'greeks.delta': 'delta',
+    'greeks.gamma': 'gamma',
+    'greeks.theta': 'theta',
+    'greeks.vega': 'vega',
+    'day.last_updated': 'timestamp'
+}
+POLYGON_DAY_FIELDS = ('volume', 'open', 'close', 'high', 'low', 'timestamp')
+POLYGON_ZERO_FILLED_FIELDS = ('volume', 'open_interest', 'implied_volatility', 'delta', 'gamma', 'theta', 'vega')
+
+# Tradier chain fields (greeks flattened by json_normalize) -> option record keys
+TRADIER_FIELDS = {
+    'symbol': 'contract_ticker',
+    'option_type': 'contract_type',
+    'strike': 'strike_price',
+    'expiration_date': 'expiration_date',
+    'volume': 'volume',
+    'open_interest': 'open_interest',
+    'bid': 'bid',
+    'ask': 'ask',
+    'last': 'last',
+    'greeks.iv': 'implied_volatility',
+    'greeks.delta': 'delta',
+    'greeks.gamma': 'gamma',
+    'greeks.theta': 'theta',
+    'greeks.vega': 'vega'
+}
+TRADIER_NUMERIC_FIELDS = ('strike_price', 'volume', 'open_interest', 'bid', 'ask', 'last',
+                          'implied_volatility', 'delta', 'gamma', 'theta', 'vega')
+
+# Contract volume/IV above this historical quantile for the ticker counts as a spike
+SPIKE_QUANTILE = 0.99
+# Observations needed before the historical quantile replaces the in-chain mean + 2 std
+SPIKE_HISTORY_MIN_OBSERVATIONS = 200
+
+# Major liquid stocks/ETFs to focus options collection on, in priority order
+MAJOR_OPTION_TICKERS = (
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'META', 'NFLX',
+    'JPM', 'BAC', 'V', 'MA', 'JNJ', 'PFE', 'UNH', 'XOM', 'CVX',
+    'SPY', 'QQQ', 'IWM', 'VIX', 'AMD', 'INTC', 'CRM', 'ORCL'
+)
+
+# Chains up to this many contracts are checked with plain NumPy instead of a DataFrame
+SMALL_CHAIN_ROWS = 256
+
+# Cycles covering at least this many tickers run detection in worker processes
+DETECTION_POOL_MIN_TICKERS = 16
+DETECTION_WORKERS = os.cpu_count() or 1
+# Workers start from a fresh interpreter: a fork would copy the running event loop,
+# the aiohttp session and pooled DB connections into every child
+DETECTION_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Seconds the optionable-asset list is reused before re-querying the database
+OPTIONABLE_ASSETS_TTL = 86400
+
+# Tickers collected concurrently per cycle, and how many may start per second
+TICKER_CONCURRENCY = 8
+TICKER_STARTS_PER_SECOND = 2
+
+class P2Quantile:
+    """
+    Streaming quantile estimate (Jain & Chlamtac's P-square algorithm).
+    
+    Tracks one quantile in constant memory by adjusting five marker heights
+    as observations arrive, so no history has to be kept or re-read.
+    """
+    
+    __slots__ = ('p', 'count', '_heights', '_positions', '_desired', '_increments')
+    
+    def __init__(self, p: float):
+        self.p = p
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+    
+    def update(self, x: float):
+        """Add one observation."""
+        self.count += 1
+        q = self._heights
+        
+        if self.count <= 5:
+            q.append(x)
+            q.sort()
+            return
+        
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+        
+        # Nudge the three middle markers toward their desired positions
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] += d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+    
+    @property
+    def value(self) -> float:
+        """Current estimate of the quantile (NaN before any observation)."""
+        q = self._heights
+        if not q:
+            return float('nan')
+        if self.count <= 5:
+            return q[min(int(self.p * len(q)), len(q) - 1)]
+        return q[2]
+
 class OptionsFlowCollector:
     """Professional-grade options flow collector for 200+ assets with anomaly detection."""
     
@@ -32,129 +215,151 @@ class OptionsFlowCollector:
             'Authorization': f'Bearer {self.tradier_api_key}',
             'Accept': 'application/json'
         } if self.tradier_api_key else {}
+        self.tradier_chains_url = f"{settings.TRADIER_BASE_URL}/markets/options/chains"
         
         # Professional thresholds for anomaly detection
         self.volume_spike_threshold = 3.0      # 3x normal volume
         self.iv_spike_threshold = 0.20         # 20% IV increase
         self.whale_trade_threshold = 10000     # Minimum contracts for whale trade
+        self.whale_top_k = 10                  # Largest contracts checked for concentration
+        self.whale_concentration_threshold = 0.5  # Share of chain volume in the top k
         self.call_put_ratio_threshold = 3.0    # Unusual call/put ratio
         
-        # Setup session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Pooled aiohttp session, created lazily per event loop
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Start times of recent ticker collections (sliding one-second window)
+        self._ticker_starts = deque()
+        
+        # (monotonic time, tickers) from the last optionable-asset query
+        self._optionable_assets_cache: Optional[tuple] = None
+        # (date, next Friday string) for the date it was computed on
+        self._expiration_cache: Optional[tuple] = None
+        
+        # Streaming SPIKE_QUANTILE estimates per (ticker, metric) across cycles
+        self._quantiles: Dict[Tuple[str, str], P2Quantile] = {}
+        
+        # Worker processes for detection over large universes, started on first use
+        self._detection_pool: Optional[ProcessPoolExecutor] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled aiohttp session, recreating it if closed or bound to another loop."""
+        loop = asyncio.get_running_loop()
+        if (self._async_session is None or self._async_session.closed
+                or self._async_session_loop is not loop):
+            # Keep warm TLS connections to Polygon/Tradier across tickers and cycles
+            connector = aiohttp.TCPConnector(
+                limit=128,
+                limit_per_host=64,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            )
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._async_session_loop = loop
+        return self._async_session
+    
+    async def _wait_for_ticker_slot(self):
+        """Wait until another ticker collection fits in the per-second budget, then claim it."""
+        starts = self._ticker_starts
+        while True:
+            now = time.monotonic()
+            while starts and now - starts[0] >= 1:
+                starts.popleft()
+            if len(starts) < TICKER_STARTS_PER_SECOND:
+                starts.append(now)
+                return
+            await asyncio.sleep(1 - (now - starts[0]))
+    
+    async def close(self):
+        """Close the pooled aiohttp session and stop any detection workers."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_session_loop = None
+        
+        if self._detection_pool is not None:
+            self._detection_pool.shutdown(wait=False, cancel_futures=True)
+            self._detection_pool = None
+    
+    async def _get_json(self, url: str, params: Optional[Mapping[str, Any]] = None,
+                        headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> Any:
+        """GET a JSON endpoint, retrying throttled and 5xx responses with exponential backoff."""
+        session = await self._get_session()
+        for attempt in range(MAX_RETRIES + 1):
+            async with session.get(url, params=params, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
+                    continue
+                response.raise_for_status()
+                return _loads(await response.read())
     
     async def get_optionable_assets(self) -> List[str]:
-        """Get all optionable assets from database (US stocks primarily)."""
+        """Get all optionable assets from database (US stocks primarily), cached for a day."""
+        cached = self._optionable_assets_cache
+        if cached and time.monotonic() - cached[0] < OPTIONABLE_ASSETS_TTL:
+            return list(cached[1])
+        
+        # Only the major liquid tickers can qualify, so let Postgres filter to them
         query = """
-            SELECT ticker, name FROM assets 
+            SELECT ticker FROM assets 
             WHERE asset_type = 'stock' 
               AND country = 'US'
-              AND ticker NOT LIKE '%-USD'
-              AND ticker NOT LIKE '%=X'
-              AND ticker NOT LIKE '%.NS'
-            ORDER BY ticker
+              AND ticker = ANY($1::text[])
         """
         
-        assets = await db.fetch_all(query)
+        assets = await db.fetch_all(query, (list(MAJOR_OPTION_TICKERS),))
         
-        # Focus on major liquid stocks for options
-        major_tickers = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'META', 'NFLX',
-            'JPM', 'BAC', 'V', 'MA', 'JNJ', 'PFE', 'UNH', 'XOM', 'CVX',
-            'SPY', 'QQQ', 'IWM', 'VIX', 'AMD', 'INTC', 'CRM', 'ORCL'
-        ]
+        # Return intersection of database assets and major liquid tickers, in priority order
+        db_tickers = {asset['ticker'] for asset in assets}
+        tickers = [ticker for ticker in MAJOR_OPTION_TICKERS if ticker in db_tickers]
         
-        # Return intersection of database assets and major liquid tickers
-        db_tickers = [asset['ticker'] for asset in assets]
-        return [ticker for ticker in major_tickers if ticker in db_tickers]
+        self._optionable_assets_cache = (time.monotonic(), tickers)
+        return list(tickers)
     
-    def collect_polygon_options_data(self, ticker: str, date: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def collect_polygon_options_data(self, ticker: str) -> List[Dict[str, Any]]:
         """
         Collect options data from Polygon.io.
         
+        Uses the options chain snapshot, which returns the day bar, open interest,
+        IV and Greeks for every contract in one paginated response.
+        
         Args:
             ticker: Stock ticker symbol
-            date: Date in YYYY-MM-DD format (defaults to today)
         """
         if not settings.POLYGON_API_KEY:
             logger.warning("Polygon API key not configured")
             return []
         
         try:
-            if not date:
-                date = datetime.now().strftime('%Y-%m-%d')
+            logger.info(f"Collecting Polygon options snapshot for {ticker}")
             
-            logger.info(f"Collecting Polygon options data for {ticker} on {date}")
+            url = POLYGON_SNAPSHOT_URL.format(ticker=ticker)
+            params = POLYGON_SNAPSHOT_PARAMS
             
-            # Get options contracts for the ticker
-            url = f"https://api.polygon.io/v3/reference/options/contracts"
-            params = {
-                'underlying_ticker': ticker,
-                'contract_type': 'option',
-                'expired': 'false',
-                'limit': 1000,
-                'apikey': settings.POLYGON_API_KEY
-            }
-            
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
+            results = []
+            for _ in range(POLYGON_SNAPSHOT_MAX_PAGES):
+                snapshot = await self._get_json(url, params=params, headers=self.polygon_headers)
+                results.extend(snapshot.get('results') or [])
+                
+                # next_url already carries the cursor and page size
+                url = snapshot.get('next_url')
+                if not url:
+                    break
+                params = None
             
-            contracts_data = response.json()
+            options_data = self._polygon_snapshot_records(ticker, results)
             
-            if not contracts_data.get('results'):
+            if not options_data:
                 logger.warning(f"No options contracts found for {ticker}")
                 return []
             
-            contracts = contracts_data['results']
-            options_data = []
-            
-            # Process options contracts and look for unusual activity
-            for contract in contracts[:50]:  # Limit to avoid rate limits
-                try:
-                    contract_ticker = contract.get('ticker')
-                    if not contract_ticker:
-                        continue
-                    
-                    # Get daily bars for this option
-                    bars_url = f"https://api.polygon.io/v2/aggs/ticker/{contract_ticker}/range/1/day/{date}/{date}"
-                    bars_params = {'apikey': settings.POLYGON_API_KEY}
-                    
-                    bars_response = self.session.get(bars_url, params=bars_params, timeout=15)
-                    bars_response.raise_for_status()
-                    
-                    bars_data = bars_response.json()
-                    
-                    if bars_data.get('results'):
-                        bar = bars_data['results'][0]
-                        
-                        option_info = {
-                            'ticker': ticker,
-                            'contract_ticker': contract_ticker,
-                            'contract_type': contract.get('contract_type'),
-                            'strike_price': contract.get('strike_price'),
-                            'expiration_date': contract.get('expiration_date'),
-                            'volume': bar.get('v', 0),
-                            'open': bar.get('o'),
-                            'close': bar.get('c'),
-                            'high': bar.get('h'),
-                            'low': bar.get('l'),
-                            'timestamp': datetime.fromtimestamp(bar.get('t', 0) / 1000),
-                            'source': 'polygon'
-                        }
-                        
-                        options_data.append(option_info)
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to process contract {contract.get('ticker', 'unknown')}: {e}")
-                    continue
-            
             logger.info(f"Collected {len(options_data)} options records for {ticker}")
             return options_data
             
@@ -162,7 +367,29 @@ class OptionsFlowCollector:
             logger.error(f"Failed to collect Polygon options data for {ticker}: {e}")
             return []
     
-    def collect_tradier_options_data(self, ticker: str) -> List[Dict[str, Any]]:
+    def _polygon_snapshot_records(self, ticker: str, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build option records from snapshot results, skipping contracts without a day bar."""
+        if not results:
+            return []
+        
+        # Extract the whole chain column by column instead of per contract
+        frame = pd.json_normalize(results).reindex(columns=list(POLYGON_FIELDS)).rename(columns=POLYGON_FIELDS)
+        frame = frame[frame['contract_ticker'].notna() & frame[list(POLYGON_DAY_FIELDS)].notna().any(axis=1)].copy()
+        if frame.empty:
+            return []
+        
+        frame[list(POLYGON_ZERO_FILLED_FIELDS)] = frame[list(POLYGON_ZERO_FILLED_FIELDS)].fillna(0)
+        
+        # last_updated is epoch nanoseconds; bars without one are stamped now
+        timestamps = pd.to_datetime(frame['timestamp'], unit='ns', utc=True)
+        frame['timestamp'] = timestamps.dt.tz_convert(tzlocal()).dt.tz_localize(None).fillna(datetime.now())
+        
+        frame.insert(0, 'ticker', ticker)
+        frame['source'] = 'polygon'
+        
+        return frame.to_dict('records')
+    
+    async def collect_tradier_options_data(self, ticker: str) -> List[Dict[str, Any]]:
         """
         Collect options data from Tradier API.
         
@@ -177,21 +404,13 @@ class OptionsFlowCollector:
             logger.info(f"Collecting Tradier options data for {ticker}")
             
             # Get options chain
-            url = f"{settings.TRADIER_BASE_URL}/markets/options/chains"
+            url = self.tradier_chains_url
             params = {
                 'symbol': ticker,
                 'expiration': self.get_next_expiration_date()
             }
             
-            response = self.session.get(
-                url, 
-                headers=self.tradier_headers,
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            chain_data = response.json()
+            chain_data = await self._get_json(url, params=params, headers=self.tradier_headers)
             
             if not chain_data.get('options'):
                 logger.warning(f"No options chain found for {ticker}")
@@ -201,35 +420,17 @@ class OptionsFlowCollector:
             if not isinstance(options, list):
                 options = [options]
             
-            options_data = []
-            
-            for option in options:
-                try:
-                    option_info = {
-                        'ticker': ticker,
-                        'contract_ticker': option.get('symbol'),
-                        'contract_type': option.get('option_type'),
-                        'strike_price': float(option.get('strike', 0)),
-                        'expiration_date': option.get('expiration_date'),
-                        'volume': int(option.get('volume', 0)),
-                        'open_interest': int(option.get('open_interest', 0)),
-                        'bid': float(option.get('bid', 0)),
-                        'ask': float(option.get('ask', 0)),
-                        'last': float(option.get('last', 0)),
-                        'implied_volatility': float(option.get('greeks', {}).get('iv', 0)),
-                        'delta': float(option.get('greeks', {}).get('delta', 0)),
-                        'gamma': float(option.get('greeks', {}).get('gamma', 0)),
-                        'theta': float(option.get('greeks', {}).get('theta', 0)),
-                        'vega': float(option.get('greeks', {}).get('vega', 0)),
-                        'timestamp': datetime.now(),
-                        'source': 'tradier'
-                    }
-                    
-                    options_data.append(option_info)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to process Tradier option: {e}")
-                    continue
+            # Coerce the whole chain column by column instead of per option
+            frame = pd.json_normalize(options).reindex(columns=list(TRADIER_FIELDS)).rename(columns=TRADIER_FIELDS)
+            for column in TRADIER_NUMERIC_FIELDS:
+                frame[column] = pd.to_numeric(frame[column], errors='coerce').fillna(0)
+            frame[['volume', 'open_interest']] = frame[['volume', 'open_interest']].astype(int)
+            
+            frame.insert(0, 'ticker', ticker)
+            frame['timestamp'] = datetime.now()
+            frame['source'] = 'tradier'
+            
+            options_data = frame.to_dict('records')
             
             logger.info(f"Collected {len(options_data)} Tradier options records for {ticker}")
             return options_data
@@ -239,14 +440,19 @@ class OptionsFlowCollector:
             return []
     
     def get_next_expiration_date(self) -> str:
-        """Get the next Friday (typical options expiration)."""
+        """Get the next Friday (typical options expiration), computed once per day."""
         today = datetime.now()
+        cached = self._expiration_cache
+        if cached and cached[0] == today.date():
+            return cached[1]
+        
         days_ahead = 4 - today.weekday()  # Friday is weekday 4
         if days_ahead <= 0:  # Today is Friday or later
             days_ahead += 7
         
-        next_friday = today + timedelta(days=days_ahead)
-        return next_friday.strftime('%Y-%m-%d')
+        next_friday = (today + timedelta(days=days_ahead)).strftime('%Y-%m-%d')
+        self._expiration_cache = (today.date(), next_friday)
+        return next_friday
     
     def detect_unusual_options_activity(self, options_data: List[Dict[str, Any]], ticker: str) -> List[Dict[str, Any]]:
         """
@@ -259,155 +465,465 @@ class OptionsFlowCollector:
         Returns:
             List of detected anomalies
         """
-        anomalies = []
-        
         if not options_data:
+            return []
+        
+        # A DataFrame costs more to build than the whole check on a short chain
+        if len(options_data) <= SMALL_CHAIN_ROWS:
+            try:
+                return self._detect_small_chain(options_data, ticker)
+            except Exception as e:
+                logger.error(f"Failed to detect options anomalies for {ticker}: {e}")
+                return []
+        
+        df = pd.DataFrame(options_data)
+        df['ticker'] = ticker
+        return self.detect_options_anomalies_frame(df)
+    
+    def detect_options_anomalies_frame(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Detect unusual options activity for every ticker in one frame.
+        
+        Per-ticker statistics come from groupby aggregations over the whole frame
+        rather than from filtering a separate DataFrame for each ticker.
+        
+        Args:
+            df: Options records with a 'ticker' column
+        
+        Returns:
+            List of detected anomalies
+        """
+        if df.empty or 'volume' not in df.columns:
+            return []
+        
+        try:
+            tickers = df['ticker'].unique()
+            anomalies, active = self._detect_frame(
+                df,
+                self._history_thresholds('volume', tickers),
+                self._history_thresholds('implied_volatility', tickers),
+                self._whale_rules(),
+                datetime.now()
+            )
+            
+            # Fold this cycle into the history only after it has been judged against it
+            self._fold_history(df, active)
+            
+            logger.info(f"Detected {len(anomalies)} options anomalies across {len(active)} tickers")
             return anomalies
+            
+        except Exception as e:
+            logger.error(f"Failed to detect options anomalies: {e}")
+            return []
+    
+    async def async_detect_options_anomalies(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Detect unusual options activity for a cycle's frame without blocking the event loop.
+        
+        Universes of DETECTION_POOL_MIN_TICKERS or more are split by ticker across
+        worker processes, since detection is CPU-bound pandas/NumPy work that threads
+        cannot parallelize under the GIL. Smaller ones run inline.
+        """
+        if df.empty or 'volume' not in df.columns:
+            return []
+        
+        tickers = df['ticker'].unique()
+        if len(tickers) < DETECTION_POOL_MIN_TICKERS:
+            return self.detect_options_anomalies_frame(df)
         
         try:
-            # Convert to DataFrame for analysis
-            df = pd.DataFrame(options_data)
+            volume_history = self._history_thresholds('volume', tickers)
+            iv_history = self._history_thresholds('implied_volatility', tickers)
+            whale_rules = self._whale_rules()
+            now = datetime.now()
             
-            # Separate calls and puts
-            calls = df[df['contract_type'] == 'call'] if 'contract_type' in df.columns else df
-            puts = df[df['contract_type'] == 'put'] if 'contract_type' in df.columns else pd.DataFrame()
+            loop = asyncio.get_running_loop()
+            pool = self._get_detection_pool()
+            outcomes = await asyncio.gather(*(
+                loop.run_in_executor(
+                    pool, self._detect_frame, df[df['ticker'].isin(chunk)],
+                    volume_history, iv_history, whale_rules, now
+                )
+                for chunk in np.array_split(tickers, min(DETECTION_WORKERS, len(tickers)))
+            ))
             
-            # Calculate total volumes
-            total_call_volume = calls['volume'].sum() if not calls.empty and 'volume' in calls.columns else 0
-            total_put_volume = puts['volume'].sum() if not puts.empty and 'volume' in puts.columns else 0
-            total_volume = total_call_volume + total_put_volume
+            anomalies = [anomaly for chunk_anomalies, _ in outcomes for anomaly in chunk_anomalies]
+            active = [ticker for _, chunk_active in outcomes for ticker in chunk_active]
             
-            if total_volume == 0:
-                return anomalies
+            # Fold this cycle into the history only after it has been judged against it
+            self._fold_history(df, active)
             
-            # 1. Call/Put Volume Imbalance
-            if total_volume > 0:
-                call_put_ratio = total_call_volume / total_put_volume if total_put_volume > 0 else float('inf')
-                
-                if call_put_ratio > 3.0:  # Heavy call bias
-                    anomalies.append({
-                        'ticker': ticker,
-                        'metric': 'call_skew',
-                        'anomaly_score': min(call_put_ratio / 10.0, 1.0),
-                        'severity': 'high' if call_put_ratio > 5.0 else 'medium',
-                        'explanation': f'Unusual call volume detected. Call/Put ratio: {call_put_ratio:.2f}',
-                        'timestamp': datetime.now(),
-                        'details': {
-                            'call_volume': total_call_volume,
-                            'put_volume': total_put_volume,
-                            'ratio': call_put_ratio
-                        }
-                    })
-                
-                elif call_put_ratio < 0.33:  # Heavy put bias
-                    anomalies.append({
-                        'ticker': ticker,
-                        'metric': 'put_skew',
-                        'anomaly_score': min(3.0 / call_put_ratio / 10.0, 1.0),
-                        'severity': 'high' if call_put_ratio < 0.2 else 'medium',
-                        'explanation': f'Unusual put volume detected. Call/Put ratio: {call_put_ratio:.2f}',
-                        'timestamp': datetime.now(),
-                        'details': {
-                            'call_volume': total_call_volume,
-                            'put_volume': total_put_volume,
-                            'ratio': call_put_ratio
-                        }
-                    })
-            
-            # 2. High Volume Spikes
-            if 'volume' in df.columns:
-                volume_mean = df['volume'].mean()
-                volume_std = df['volume'].std()
-                
-                if volume_std > 0:
-                    high_volume_contracts = df[df['volume'] > (volume_mean + 2 * volume_std)]
-                    
-                    if len(high_volume_contracts) > 0:
-                        max_volume = high_volume_contracts['volume'].max()
-                        anomaly_score = min((max_volume - volume_mean) / (volume_std * 3), 1.0)
-                        
-                        anomalies.append({
-                            'ticker': ticker,
-                            'metric': 'volume_spike',
-                            'anomaly_score': anomaly_score,
-                            'severity': 'high' if anomaly_score > 0.7 else 'medium',
-                            'explanation': f'High volume spike detected. Max volume: {max_volume}, Mean: {volume_mean:.0f}',
-                            'timestamp': datetime.now(),
-                            'details': {
-                                'max_volume': max_volume,
-                                'mean_volume': volume_mean,
-                                'contracts_affected': len(high_volume_contracts)
-                            }
-                        })
-            
-            # 3. Implied Volatility Spikes
-            if 'implied_volatility' in df.columns:
-                iv_data = df[df['implied_volatility'] > 0]['implied_volatility']
-                
-                if len(iv_data) > 0:
-                    iv_mean = iv_data.mean()
-                    iv_std = iv_data.std()
-                    
-                    if iv_std > 0:
-                        high_iv_threshold = iv_mean + 2 * iv_std
-                        high_iv_contracts = df[df['implied_volatility'] > high_iv_threshold]
-                        
-                        if len(high_iv_contracts) > 0:
-                            max_iv = high_iv_contracts['implied_volatility'].max()
-                            anomaly_score = min((max_iv - iv_mean) / (iv_std * 3), 1.0)
-                            
-                            anomalies.append({
-                                'ticker': ticker,
-                                'metric': 'iv_spike',
-                                'anomaly_score': anomaly_score,
-                                'severity': 'high' if anomaly_score > 0.7 else 'medium',
-                                'explanation': f'Implied volatility spike detected. Max IV: {max_iv:.2f}, Mean: {iv_mean:.2f}',
-                                'timestamp': datetime.now(),
-                                'details': {
-                                    'max_iv': max_iv,
-                                    'mean_iv': iv_mean,
-                                    'contracts_affected': len(high_iv_contracts)
-                                }
-                            })
-            
-            logger.info(f"Detected {len(anomalies)} options anomalies for {ticker}")
+            logger.info(f"Detected {len(anomalies)} options anomalies across {len(active)} tickers "
+                        f"in {len(outcomes)} worker processes")
             return anomalies
             
         except Exception as e:
-            logger.error(f"Failed to detect options anomalies for {ticker}: {e}")
+            logger.error(f"Failed to detect options anomalies: {e}")
             return []
     
+    def _get_detection_pool(self) -> ProcessPoolExecutor:
+        """Get the detection worker pool, starting it on first use."""
+        if self._detection_pool is None:
+            self._detection_pool = ProcessPoolExecutor(
+                max_workers=DETECTION_WORKERS,
+                mp_context=multiprocessing.get_context(DETECTION_START_METHOD)
+            )
+        return self._detection_pool
+    
+    def _whale_rules(self) -> Tuple[int, float, float]:
+        """(top k, minimum top-k volume, concentration threshold) for _whale_anomaly."""
+        return self.whale_top_k, self.whale_trade_threshold, self.whale_concentration_threshold
+    
+    @staticmethod
+    def _detect_frame(df: pd.DataFrame, volume_history: pd.Series, iv_history: pd.Series,
+                      whale_rules: Tuple[int, float, float], now: datetime) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Run every check over a frame of one or more tickers.
+        
+        Touches no collector state, so it can run in a worker process; history
+        thresholds come in as arguments and the caller folds the data into the
+        history afterwards.
+        
+        Returns:
+            (anomalies, tickers with non-zero call + put volume)
+        """
+        anomalies = []
+        volume = pd.to_numeric(df['volume'], errors='coerce')
+        
+        # Separate calls and puts (untyped records all count as calls)
+        if 'contract_type' in df.columns:
+            is_call = df['contract_type'].eq('call')
+            is_put = df['contract_type'].eq('put')
+        else:
+            is_call = pd.Series(True, index=df.index)
+            is_put = pd.Series(False, index=df.index)
+        
+        # Calculate total volumes
+        volumes = pd.DataFrame({
+            'call_volume': volume.where(is_call).groupby(df['ticker'], sort=False).sum(),
+            'put_volume': volume.where(is_put).groupby(df['ticker'], sort=False).sum()
+        })
+        volumes = volumes[(volumes['call_volume'] + volumes['put_volume']) != 0]
+        
+        if volumes.empty:
+            return anomalies, []
+        
+        active = df['ticker'].isin(volumes.index)
+        df = df[active]
+        volume = volume[active]
+        tickers = df['ticker']
+        
+        # 1. Call/Put Volume Imbalance
+        for row in volumes.itertuples():
+            anomaly = OptionsFlowCollector._skew_anomaly(row.Index, row.call_volume, row.put_volume, now)
+            if anomaly:
+                anomalies.append(anomaly)
+        
+        # 2. High Volume Spikes
+        for spike in OptionsFlowCollector._spike_stats(volume, volume, tickers, volume_history).itertuples():
+            anomalies.append(OptionsFlowCollector._spike_anomaly(
+                spike.Index, 'volume', spike.peak, spike.mean, spike.std, spike.contracts, now
+            ))
+        
+        # 3. Implied Volatility Spikes (baseline from contracts that report an IV)
+        if 'implied_volatility' in df.columns:
+            iv = pd.to_numeric(df['implied_volatility'], errors='coerce')
+            
+            for spike in OptionsFlowCollector._spike_stats(iv, iv[iv > 0], tickers, iv_history).itertuples():
+                anomalies.append(OptionsFlowCollector._spike_anomaly(
+                    spike.Index, 'implied_volatility', spike.peak, spike.mean, spike.std, spike.contracts, now
+                ))
+        
+        # 4. Whale Concentration (volume piled into a handful of contracts)
+        chain_volumes = volume.fillna(0).to_numpy()
+        contract_tickers = df['contract_ticker'].to_numpy() if 'contract_ticker' in df.columns else None
+        for ticker, positions in tickers.groupby(tickers, sort=False).indices.items():
+            anomaly = OptionsFlowCollector._whale_anomaly(
+                ticker, chain_volumes[positions],
+                contract_tickers[positions] if contract_tickers is not None else None,
+                whale_rules, now
+            )
+            if anomaly:
+                anomalies.append(anomaly)
+        
+        return anomalies, volumes.index.tolist()
+    
+    def _fold_history(self, df: pd.DataFrame, active: List[str]):
+        """Feed the volume and reported IV of the active tickers in df into their streaming quantiles."""
+        df = df[df['ticker'].isin(active)]
+        tickers = df['ticker']
+        
+        volume = pd.to_numeric(df['volume'], errors='coerce').dropna()
+        for ticker, group in volume.groupby(tickers[volume.index], sort=False):
+            self._update_history(ticker, 'volume', group.tolist())
+        
+        if 'implied_volatility' in df.columns:
+            iv = pd.to_numeric(df['implied_volatility'], errors='coerce')
+            reported_iv = iv[iv > 0]
+            for ticker, group in reported_iv.groupby(tickers[reported_iv.index], sort=False):
+                self._update_history(ticker, 'implied_volatility', group.tolist())
+    
+    def _detect_small_chain(self, options_data: List[Dict[str, Any]], ticker: str) -> List[Dict[str, Any]]:
+        """Run the same checks as detect_options_anomalies_frame on one short chain with plain NumPy arrays."""
+        anomalies = []
+        now = datetime.now()
+        
+        volume = np.array([option.get('volume') for option in options_data], dtype=float)
+        
+        # Separate calls and puts (untyped records all count as calls)
+        if any('contract_type' in option for option in options_data):
+            contract_types = [option.get('contract_type') for option in options_data]
+            is_call = np.array([contract_type == 'call' for contract_type in contract_types], dtype=bool)
+            is_put = np.array([contract_type == 'put' for contract_type in contract_types], dtype=bool)
+        else:
+            is_call = np.ones(len(options_data), dtype=bool)
+            is_put = np.zeros(len(options_data), dtype=bool)
+        
+        call_volume = np.nansum(volume[is_call])
+        put_volume = np.nansum(volume[is_put])
+        
+        if call_volume + put_volume == 0:
+            return anomalies
+        
+        # 1. Call/Put Volume Imbalance
+        anomaly = self._skew_anomaly(ticker, call_volume, put_volume, now)
+        if anomaly:
+            anomalies.append(anomaly)
+        
+        # 2. High Volume Spikes
+        observed_volume = volume[~np.isnan(volume)]
+        anomaly = self._array_spike(ticker, 'volume', volume, observed_volume, now)
+        if anomaly:
+            anomalies.append(anomaly)
+        
+        # 3. Implied Volatility Spikes (baseline from contracts that report an IV)
+        reported_iv = None
+        if any('implied_volatility' in option for option in options_data):
+            iv = np.array([option.get('implied_volatility') for option in options_data], dtype=float)
+            reported_iv = iv[iv > 0]
+            anomaly = self._array_spike(ticker, 'implied_volatility', iv, reported_iv, now)
+            if anomaly:
+                anomalies.append(anomaly)
+        
+        # 4. Whale Concentration (volume piled into a handful of contracts)
+        contract_tickers = np.array([option.get('contract_ticker') for option in options_data], dtype=object)
+        anomaly = self._whale_anomaly(ticker, np.nan_to_num(volume), contract_tickers, self._whale_rules(), now)
+        if anomaly:
+            anomalies.append(anomaly)
+        
+        # Fold this chain into the history only after it has been judged against it
+        self._update_history(ticker, 'volume', observed_volume.tolist())
+        if reported_iv is not None:
+            self._update_history(ticker, 'implied_volatility', reported_iv.tolist())
+        
+        logger.info(f"Detected {len(anomalies)} options anomalies for {ticker}")
+        return anomalies
+    
+    def _array_spike(self, ticker: str, metric: str, values: np.ndarray, baseline: np.ndarray,
+                     now: datetime) -> Optional[Dict[str, Any]]:
+        """Spike check for one ticker's arrays, with the same threshold rules as _spike_stats."""
+        if len(baseline) < 2:
+            return None
+        
+        mean = baseline.mean()
+        std = baseline.std(ddof=1)
+        if not std > 0:
+            return None
+        
+        threshold = self._history_threshold(ticker, metric)
+        if threshold is None:
+            threshold = mean + 2 * std
+        
+        above = values[values > threshold]
+        if not len(above):
+            return None
+        
+        return self._spike_anomaly(ticker, metric, above.max(), mean, std, len(above), now)
+    
+    @staticmethod
+    def _skew_anomaly(ticker: str, call_volume: float, put_volume: float, now: datetime) -> Optional[Dict[str, Any]]:
+        """Call or put skew anomaly for one ticker's volume totals, or None if balanced."""
+        call_put_ratio = call_volume / put_volume if put_volume > 0 else float('inf')
+        details = {
+            'call_volume': call_volume,
+            'put_volume': put_volume,
+            'ratio': call_put_ratio
+        }
+        
+        if call_put_ratio > 3.0:  # Heavy call bias
+            return {
+                'ticker': ticker,
+                'metric': 'call_skew',
+                'anomaly_score': min(call_put_ratio / 10.0, 1.0),
+                'severity': 'high' if call_put_ratio > 5.0 else 'medium',
+                'explanation': f'Unusual call volume detected. Call/Put ratio: {call_put_ratio:.2f}',
+                'timestamp': now,
+                'details': details
+            }
+        
+        if call_put_ratio < 0.33:  # Heavy put bias
+            return {
+                'ticker': ticker,
+                'metric': 'put_skew',
+                'anomaly_score': min(3.0 / call_put_ratio / 10.0, 1.0) if call_put_ratio > 0 else 1.0,
+                'severity': 'high' if call_put_ratio < 0.2 else 'medium',
+                'explanation': f'Unusual put volume detected. Call/Put ratio: {call_put_ratio:.2f}',
+                'timestamp': now,
+                'details': details
+            }
+        
+        return None
+    
+    @staticmethod
+    def _spike_anomaly(ticker: str, metric: str, peak: float, mean: float, std: float,
+                       contracts: int, now: datetime) -> Dict[str, Any]:
+        """Volume or IV spike anomaly from a ticker's spike statistics."""
+        anomaly_score = min((peak - mean) / (std * 3), 1.0)
+        
+        if metric == 'volume':
+            explanation = f'High volume spike detected. Max volume: {peak}, Mean: {mean:.0f}'
+            details = {'max_volume': peak, 'mean_volume': mean, 'contracts_affected': contracts}
+        else:
+            explanation = f'Implied volatility spike detected. Max IV: {peak:.2f}, Mean: {mean:.2f}'
+            details = {'max_iv': peak, 'mean_iv': mean, 'contracts_affected': contracts}
+        
+        return {
+            'ticker': ticker,
+            'metric': 'volume_spike' if metric == 'volume' else 'iv_spike',
+            'anomaly_score': anomaly_score,
+            'severity': 'high' if anomaly_score > 0.7 else 'medium',
+            'explanation': explanation,
+            'timestamp': now,
+            'details': details
+        }
+    
+    @staticmethod
+    def _spike_stats(values: pd.Series, baseline: pd.Series, tickers: pd.Series,
+                     history: Optional[pd.Series] = None) -> pd.DataFrame:
+        """
+        Per-ticker mean/std of baseline, plus the peak and count of values above the spike threshold.
+        
+        The threshold is the ticker's historical quantile from history when one is
+        available, and mean + 2 std of the baseline otherwise. Only tickers with a
+        positive std and at least one value above the threshold are returned.
+        """
+        stats = baseline.groupby(tickers[baseline.index], sort=False).agg(['mean', 'std'])
+        stats = stats[stats['std'] > 0]
+        
+        threshold = stats['mean'] + 2 * stats['std']
+        if history is not None and not history.empty:
+            threshold = history.reindex(threshold.index).fillna(threshold)
+        
+        above = values[values > tickers.map(threshold)]
+        
+        return stats.join(above.groupby(tickers[above.index], sort=False).agg(peak='max', contracts='count'), how='inner')
+    
+    @staticmethod
+    def _whale_anomaly(ticker: str, chain_volume: np.ndarray, contract_tickers: Optional[np.ndarray],
+                       whale_rules: Tuple[int, float, float], now: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Flag a ticker whose top-k contracts carry most of the chain's volume.
+        
+        The top k are found with np.argpartition, which is linear in the chain
+        length and never sorts it.
+        """
+        k, min_top_volume, concentration_threshold = whale_rules
+        if len(chain_volume) <= k:
+            return None
+        
+        total_volume = chain_volume.sum()
+        top = np.argpartition(chain_volume, -k)[-k:]
+        top_volume = chain_volume[top].sum()
+        
+        if total_volume <= 0 or top_volume < min_top_volume:
+            return None
+        
+        concentration = top_volume / total_volume
+        if concentration <= concentration_threshold:
+            return None
+        
+        return {
+            'ticker': ticker,
+            'metric': 'whale_concentration',
+            'anomaly_score': float(concentration),
+            'severity': 'high' if concentration > 0.75 else 'medium',
+            'explanation': f'Options volume concentrated in {k} contracts: {concentration:.0%} of {total_volume:.0f}',
+            'timestamp': now,
+            'details': {
+                'top_volume': top_volume,
+                'total_volume': total_volume,
+                'top_contracts': contract_tickers[top].tolist() if contract_tickers is not None else []
+            }
+        }
+    
+    def _history_threshold(self, ticker: str, metric: str) -> Optional[float]:
+        """Historical SPIKE_QUANTILE of metric for ticker, or None until enough has been observed."""
+        estimate = self._quantiles.get((ticker, metric))
+        if estimate is not None and estimate.count >= SPIKE_HISTORY_MIN_OBSERVATIONS:
+            return estimate.value
+        return None
+    
+    def _history_thresholds(self, metric: str, tickers: np.ndarray) -> pd.Series:
+        """Historical SPIKE_QUANTILE per ticker, for tickers with enough observations of metric."""
+        thresholds = {}
+        for ticker in tickers:
+            threshold = self._history_threshold(ticker, metric)
+            if threshold is not None:
+                thresholds[ticker] = threshold
+        return pd.Series(thresholds, dtype=float)
+    
+    def _update_history(self, ticker: str, metric: str, values: List[float]):
+        """Feed a ticker's observed values of metric into its streaming quantile."""
+        estimate = self._quantiles.get((ticker, metric))
+        if estimate is None:
+            estimate = self._quantiles[(ticker, metric)] = P2Quantile(SPIKE_QUANTILE)
+        for value in values:
+            estimate.update(value)
+    
     def store_options_anomalies(self, anomalies: List[Dict[str, Any]]) -> int:
         """Store options anomalies in the database."""
         if not anomalies:
             return 0
         
-        stored_count = 0
+        records = [
+            (
+                anomaly['ticker'],
+                anomaly['metric'],
+                anomaly['anomaly_score'],
+                anomaly['severity'],
+                anomaly['explanation'],
+                anomaly['timestamp']
+            )
+            for anomaly in anomalies
+        ]
+        
+        try:
+            stored_count = bulk_insert_anomalies(records)
+        except Exception as e:
+            logger.warning(f"Failed to store options anomalies: {e}")
+            return 0
         
         for anomaly in anomalies:
-            try:
-                anomaly_id = insert_anomaly(
-                    ticker=anomaly['ticker'],
-                    metric=anomaly['metric'],
-                    anomaly_score=anomaly['anomaly_score'],
-                    severity=anomaly['severity'],
-                    explanation=anomaly['explanation'],
-                    timestamp=anomaly['timestamp'].isoformat()
-                )
-                
-                if anomaly_id:
-                    stored_count += 1
-                    
-                    if anomaly['severity'] == 'high':
-                        logger.warning(f"High severity options anomaly detected: {anomaly['explanation']}")
-                    
-            except Exception as e:
-                logger.warning(f"Failed to store options anomaly: {e}")
-                continue
+            if anomaly['severity'] == 'high':
+                logger.warning(f"High severity options anomaly detected: {anomaly['explanation']}")
         
         logger.info(f"Stored {stored_count} options anomalies in database")
         return stored_count
     
+    async def _collect_ticker_options(self, ticker: str) -> List[Dict[str, Any]]:
+        """Collect options data for a single ticker from every configured source."""
+        all_data = []
+        
+        if settings.POLYGON_API_KEY:
+            polygon_data = await self.collect_polygon_options_data(ticker)
+            all_data.extend(polygon_data)
+        
+        if settings.TRADIER_API_KEY:
+            tradier_data = await self.collect_tradier_options_data(ticker)
+            all_data.extend(tradier_data)
+        
+        return all_data
+    
     async def run_collection_cycle(self) -> Dict[str, Any]:
         """Run a complete options flow collection cycle."""
         start_time = datetime.now()
@@ -425,43 +941,38 @@ class OptionsFlowCollector:
         
         try:
             # Get options-enabled tickers
-            options_tickers = self.get_options_tickers()[:5]  # Limit to avoid rate limits
+            options_tickers = (await self.get_optionable_assets())[:5]  # Limit to avoid rate limits
             
-            all_anomalies = []
-            total_contracts = 0
+            sem = asyncio.Semaphore(TICKER_CONCURRENCY)
             
-            for ticker in options_tickers:
-                try:
+            async def _one(ticker: str):
+                async with sem:
+                    await self._wait_for_ticker_slot()
                     logger.info(f"Processing options data for {ticker}")
-                    
-                    # Collect from both sources if available
-                    all_options_data = []
-                    
-                    # Polygon data
-                    if settings.POLYGON_API_KEY:
-                        polygon_data = self.collect_polygon_options_data(ticker)
-                        all_options_data.extend(polygon_data)
-                    
-                    # Tradier data
-                    if settings.TRADIER_API_KEY:
-                        tradier_data = self.collect_tradier_options_data(ticker)
-                        all_options_data.extend(tradier_data)
-                    
-                    if all_options_data:
-                        total_contracts += len(all_options_data)
-                        
-                        # Detect anomalies
-                        ticker_anomalies = self.detect_unusual_options_activity(all_options_data, ticker)
-                        all_anomalies.extend(ticker_anomalies)
-                        
-                        results['tickers_processed'] += 1
-                    
-                    # Small delay to respect rate limits
-                    await asyncio.sleep(1)
-                    
-                except Exception as e:
-                    results['errors'].append(f"Failed to process {ticker}: {str(e)}")
-                    logger.error(f"Failed to process options for {ticker}: {e}")
+                    return await self._collect_ticker_options(ticker)
+            
+            ticker_results = await asyncio.gather(
+                *(_one(ticker) for ticker in options_tickers), return_exceptions=True
+            )
+            
+            all_options_data = []
+            
+            for ticker, outcome in zip(options_tickers, ticker_results):
+                if isinstance(outcome, Exception):
+                    results['errors'].append(f"Failed to process {ticker}: {str(outcome)}")
+                    logger.error(f"Failed to process options for {ticker}: {outcome}")
+                    continue
+                
+                if outcome:
+                    all_options_data.extend(outcome)
+                    results['tickers_processed'] += 1
+            
+            total_contracts = len(all_options_data)
+            
+            # Detect anomalies for every ticker in one pass (in worker processes for large universes)
+            all_anomalies = []
+            if all_options_data:
+                all_anomalies = await self.async_detect_options_anomalies(pd.DataFrame(all_options_data))
             
             # Store anomalies
             if all_anomalies:
@@ -492,24 +1003,53 @@ class OptionsFlowCollector:
 # Global collector instance
 options_flow_collector = OptionsFlowCollector()
 
+# Long-lived event loop (uvloop when available) shared by the sync wrappers, so the
+# pooled aiohttp session and asyncpg pool survive across calls
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the background event loop."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="options-flow-loop", daemon=True).start()
+            atexit.register(_shutdown_background_loop)
+            _background_loop = loop
+        return _background_loop
+
+
+def _run_in_background(coro):
+    """Run a coroutine on the background loop and block for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+def _shutdown_background_loop():
+    """Close the pooled session and stop the background loop at interpreter exit."""
+    loop = _background_loop
+    if loop is None or not loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(options_flow_collector.close(), loop).result(timeout=5)
+    except Exception as e:
+        logger.warning(f"Failed to close options flow session on shutdown: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+
+
 # Convenience functions for external use
+async def collect_options_flow_async() -> Dict[str, Any]:
+    """Run an options flow collection cycle on the caller's event loop."""
+    return await options_flow_collector.run_collection_cycle()
+
 def collect_options_flow() -> Dict[str, Any]:
     """Synchronous wrapper for options flow collection."""
-    return asyncio.run(options_flow_collector.run_collection_cycle())
+    return _run_in_background(options_flow_collector.run_collection_cycle())
 
 def collect_single_ticker_options(ticker: str) -> List[Dict[str, Any]]:
     """Collect options data for a single ticker."""
-    all_data = []
-    
-    if settings.POLYGON_API_KEY:
-        polygon_data = options_flow_collector.collect_polygon_options_data(ticker)
-        all_data.extend(polygon_data)
-    
-    if settings.TRADIER_API_KEY:
-        tradier_data = options_flow_collector.collect_tradier_options_data(ticker)
-        all_data.extend(tradier_data)
-    
-    return all_data
+    return _run_in_background(options_flow_collector._collect_ticker_options(ticker))
 
 def detect_options_anomalies_for_ticker(ticker: str) -> List[Dict[str, Any]]:
     """Detect options anomalies for a specific ticker."""
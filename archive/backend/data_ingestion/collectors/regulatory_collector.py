@@ -7,18 +7,64 @@ import logging
 import asyncio
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
+import aiohttp
 import requests
 import feedparser
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# lxml-backed feed parser, much faster than feedparser on large feeds
+try:
+    import fastfeedparser
+    FASTFEEDPARSER_AVAILABLE = True
+except ImportError:
+    FASTFEEDPARSER_AVAILABLE = False
+    fastfeedparser = None
+
 from ..config.settings import settings
 from ..db.postgres_handler import db
 from ..utils.logging_utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# SEC EDGAR feed of the latest filings
+SEC_RSS_URL = "https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&type=&company=&dateb=&owner=include&start=0&count=100&output=atom"
+
+# Retry policy for async feed downloads (same shape as the session's urllib3 Retry)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 2.0
+
+def _parse_feed(content: bytes) -> List[Any]:
+    """
+    Parse an RSS/Atom feed body into feedparser-style entries.
+    
+    Uses fastfeedparser when installed, filling in the summary and
+    published_parsed fields the parsers below read. Falls back to feedparser
+    when it is missing or rejects the document, since feedparser tolerates
+    malformed feeds.
+    """
+    if FASTFEEDPARSER_AVAILABLE:
+        try:
+            feed = fastfeedparser.parse(content, include_tags=False, include_media=False,
+                                        include_enclosures=False)
+        except Exception as e:
+            logger.debug(f"fastfeedparser rejected feed, falling back to feedparser: {e}")
+        else:
+            for entry in feed.entries:
+                entry.setdefault('summary', entry.get('description', ''))
+                published = entry.get('published')
+                if published:
+                    # fastfeedparser normalizes dates to ISO 8601 UTC; leave odd ones unparsed
+                    try:
+                        entry['published_parsed'] = datetime.fromisoformat(published).utctimetuple()
+                    except (TypeError, ValueError):
+                        logger.debug(f"Unparseable feed date {published!r}")
+            return feed.entries
+    
+    return feedparser.parse(content).entries
+
 class RegulatoryCollector:
     """Collects regulatory data from SEC, RBI, and Fed sources."""
     
@@ -37,6 +83,40 @@ class RegulatoryCollector:
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        
+        # aiohttp session for concurrent feed downloads, created lazily per event loop
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session, recreating it if closed or bound to another loop."""
+        loop = asyncio.get_running_loop()
+        if (self._async_session is None or self._async_session.closed
+                or self._async_session_loop is not loop):
+            self._async_session = aiohttp.ClientSession(
+                headers={'User-Agent': settings.SEC_EDGAR_USER_AGENT},
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._async_session_loop = loop
+        return self._async_session
+    
+    async def close(self):
+        """Close the aiohttp session."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_session_loop = None
+    
+    async def _fetch(self, url: str) -> bytes:
+        """Download a feed, retrying throttled and 5xx responses with exponential backoff."""
+        session = await self._get_session()
+        for attempt in range(MAX_RETRIES + 1):
+            async with session.get(url) as response:
+                if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
+                    continue
+                response.raise_for_status()
+                return await response.read()
     
     def collect_sec_filings(self, days_back: int = 1) -> List[Dict[str, Any]]:
         """
@@ -48,23 +128,35 @@ class RegulatoryCollector:
         try:
             logger.info(f"Collecting SEC filings from last {days_back} days")
             
-            # SEC RSS feed for recent filings
-            sec_rss_url = "https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&type=&company=&dateb=&owner=include&start=0&count=100&output=atom"
-            
-            response = self.session.get(sec_rss_url, timeout=30)
+            response = self.session.get(SEC_RSS_URL, timeout=30)
             response.raise_for_status()
             
+            return self.parse_sec_filings(response.content, days_back)
+            
+        except Exception as e:
+            logger.error(f"Failed to collect SEC filings: {e}")
+            return []
+    
+    def parse_sec_filings(self, content: bytes, days_back: int = 1) -> List[Dict[str, Any]]:
+        """
+        Parse SEC filings from the EDGAR feed body.
+        
+        Args:
+            content: Raw feed bytes
+            days_back: Number of days to look back for filings
+        """
+        try:
             # Parse RSS feed
-            feed = feedparser.parse(response.content)
+            entries = _parse_feed(content)
             
-            if not feed.entries:
+            if not entries:
                 logger.warning("No SEC filings found in RSS feed")
                 return []
             
             filings = []
             cutoff_date = datetime.now() - timedelta(days=days_back)
             
-            for entry in feed.entries:
+            for entry in entries:
                 try:
                     # Parse publication date with better error handling
                     pub_date = None
@@ -114,7 +206,7 @@ class RegulatoryCollector:
             return filings
             
         except Exception as e:
-            logger.error(f"Failed to collect SEC filings: {e}")
+            logger.error(f"Failed to parse SEC filings: {e}")
             return []
     
     def collect_rbi_announcements(self, days_back: int = 7) -> List[Dict[str, Any]]:
@@ -130,17 +222,32 @@ class RegulatoryCollector:
             response = self.session.get(settings.RBI_RSS_URL, timeout=30)
             response.raise_for_status()
             
+            return self.parse_rbi_announcements(response.content, days_back)
+            
+        except Exception as e:
+            logger.error(f"Failed to collect RBI announcements: {e}")
+            return []
+    
+    def parse_rbi_announcements(self, content: bytes, days_back: int = 7) -> List[Dict[str, Any]]:
+        """
+        Parse RBI press releases and policy announcements from the RSS feed body.
+        
+        Args:
+            content: Raw feed bytes
+            days_back: Number of days to look back
+        """
+        try:
             # Parse RSS feed
-            feed = feedparser.parse(response.content)
+            entries = _parse_feed(content)
             
-            if not feed.entries:
+            if not entries:
                 logger.warning("No RBI announcements found")
                 return []
             
             announcements = []
             cutoff_date = datetime.now() - timedelta(days=days_back)
             
-            for entry in feed.entries:
+            for entry in entries:
                 try:
                     # Parse publication date
                     pub_date = datetime(*entry.published_parsed[:6])
@@ -181,7 +288,7 @@ class RegulatoryCollector:
             return announcements
             
         except Exception as e:
-            logger.error(f"Failed to collect RBI announcements: {e}")
+            logger.error(f"Failed to parse RBI announcements: {e}")
             return []
     
     def collect_fed_releases(self, days_back: int = 7) -> List[Dict[str, Any]]:
@@ -197,17 +304,32 @@ class RegulatoryCollector:
             response = self.session.get(settings.FED_RSS_URL, timeout=30)
             response.raise_for_status()
             
+            return self.parse_fed_releases(response.content, days_back)
+            
+        except Exception as e:
+            logger.error(f"Failed to collect Fed releases: {e}")
+            return []
+    
+    def parse_fed_releases(self, content: bytes, days_back: int = 7) -> List[Dict[str, Any]]:
+        """
+        Parse Federal Reserve press releases and policy statements from the RSS feed body.
+        
+        Args:
+            content: Raw feed bytes
+            days_back: Number of days to look back
+        """
+        try:
             # Parse RSS feed
-            feed = feedparser.parse(response.content)
+            entries = _parse_feed(content)
             
-            if not feed.entries:
+            if not entries:
                 logger.warning("No Fed releases found")
                 return []
             
             releases = []
             cutoff_date = datetime.now() - timedelta(days=days_back)
             
-            for entry in feed.entries:
+            for entry in entries:
                 try:
                     # Parse publication date
                     pub_date = datetime(*entry.published_parsed[:6])
@@ -248,7 +370,7 @@ class RegulatoryCollector:
             return releases
             
         except Exception as e:
-            logger.error(f"Failed to collect Fed releases: {e}")
+            logger.error(f"Failed to parse Fed releases: {e}")
             return []
     
     def classify_sec_filing_severity(self, title: str) -> str:
@@ -449,35 +571,27 @@ class RegulatoryCollector:
         try:
             all_events = []
             
-            # Collect SEC filings
-            try:
-                sec_events = self.collect_sec_filings(days_back=1)
-                all_events.extend(sec_events)
-                results['sources_processed'].append('sec')
-                logger.info(f"Collected {len(sec_events)} SEC events")
-            except Exception as e:
-                results['errors'].append(f"SEC collection failed: {str(e)}")
-                logger.error(f"SEC collection failed: {e}")
-            
-            # Collect RBI announcements
-            try:
-                rbi_events = self.collect_rbi_announcements(days_back=7)
-                all_events.extend(rbi_events)
-                results['sources_processed'].append('rbi')
-                logger.info(f"Collected {len(rbi_events)} RBI events")
-            except Exception as e:
-                results['errors'].append(f"RBI collection failed: {str(e)}")
-                logger.error(f"RBI collection failed: {e}")
+            # Download all three feeds concurrently, then parse each body
+            feeds = [
+                ('sec', 'SEC', SEC_RSS_URL, self.parse_sec_filings, 1),
+                ('rbi', 'RBI', settings.RBI_RSS_URL, self.parse_rbi_announcements, 7),
+                ('fed', 'Fed', settings.FED_RSS_URL, self.parse_fed_releases, 7)
+            ]
+            contents = await asyncio.gather(
+                *(self._fetch(url) for _, _, url, _, _ in feeds), return_exceptions=True
+            )
             
-            # Collect Fed releases
-            try:
-                fed_events = self.collect_fed_releases(days_back=7)
-                all_events.extend(fed_events)
-                results['sources_processed'].append('fed')
-                logger.info(f"Collected {len(fed_events)} Fed events")
-            except Exception as e:
-                results['errors'].append(f"Fed collection failed: {str(e)}")
-                logger.error(f"Fed collection failed: {e}")
+            for (source, label, _, parse, days_back), content in zip(feeds, contents):
+                try:
+                    if isinstance(content, Exception):
+                        raise content
+                    source_events = parse(content, days_back=days_back)
+                    all_events.extend(source_events)
+                    results['sources_processed'].append(source)
+                    logger.info(f"Collected {len(source_events)} {label} events")
+                except Exception as e:
+                    results['errors'].append(f"{label} collection failed: {str(e)}")
+                    logger.error(f"{label} collection failed: {e}")
             
             # Store events in database
             if all_events:
@@ -507,7 +621,13 @@ regulatory_collector = RegulatoryCollector()
 # Convenience functions for external use
 def collect_regulatory_data() -> Dict[str, Any]:
     """Synchronous wrapper for regulatory data collection."""
-    return asyncio.run(regulatory_collector.run_collection_cycle())
+    async def _cycle():
+        try:
+            return await regulatory_collector.run_collection_cycle()
+        finally:
+            # asyncio.run gives every call a fresh loop, so don't leak the session
+            await regulatory_collector.close()
+    return asyncio.run(_cycle())
 
 def collect_sec_only() -> List[Dict[str, Any]]:
     """Collect only SEC filings."""
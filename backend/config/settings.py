@@ -173,6 +173,11 @@ class Settings:
     BINANCE_STATUS_URL: str = os.getenv("BINANCE_STATUS_URL", "https://www.binance.com/bapi/system/v1/public/system/status")
     SOLANA_RPC_URL: str = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
     
+    # Raw infrastructure payload archiving (S3/MinIO); off by default
+    PERSIST_RAW_INFRA: bool = os.getenv("PERSIST_RAW_INFRA", "false").lower() == "true"
+    INFRA_RAW_BUCKET: str = os.getenv("INFRA_RAW_BUCKET", "urisk-infra-raw")
+    S3_ENDPOINT_URL: Optional[str] = os.getenv("S3_ENDPOINT_URL")
+    
     # ML Model Serving
     ANOMALY_MODEL_URL: str = os.getenv("ANOMALY_MODEL_URL", "http://localhost:8001")
     SENTIMENT_MODEL_URL: str = os.getenv("SENTIMENT_MODEL_URL", "http://localhost:8002")
@@ -0,0 +1,4 @@
+-- Raw infrastructure payloads are archived to object storage (PERSIST_RAW_INFRA);
+-- incidents keep only a pointer to the archived blob
+
+ALTER TABLE infra_incidents ADD COLUMN IF NOT EXISTS raw_uri TEXT;
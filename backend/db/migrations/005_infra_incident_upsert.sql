@@ -0,0 +1,37 @@
+-- Coalesce repeated infrastructure observations instead of appending a row per cycle.
+-- Open incidents (resolved_at IS NULL) are unique per platform/type/severity;
+-- resolved observations (healthy checks) are unique per platform/type/severity/day.
+
+ALTER TABLE infra_incidents ADD COLUMN IF NOT EXISTS last_seen_at TIMESTAMP DEFAULT NOW();
+
+-- Close all but the newest copy of each open incident so the unique index can be built
+UPDATE infra_incidents i
+SET resolved_at = i.started_at
+WHERE i.resolved_at IS NULL
+  AND EXISTS (
+      SELECT 1 FROM infra_incidents newer
+      WHERE newer.resolved_at IS NULL
+        AND newer.platform = i.platform
+        AND newer.incident_type = i.incident_type
+        AND newer.severity = i.severity
+        AND newer.id > i.id
+  );
+
+-- Keep only the newest resolved observation per platform/type/severity/day
+DELETE FROM infra_incidents i
+USING infra_incidents newer
+WHERE i.resolved_at IS NOT NULL
+  AND newer.resolved_at IS NOT NULL
+  AND newer.platform = i.platform
+  AND newer.incident_type = i.incident_type
+  AND newer.severity = i.severity
+  AND newer.started_at::date = i.started_at::date
+  AND newer.id > i.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_infra_incidents_open
+    ON infra_incidents(platform, incident_type, severity)
+    WHERE resolved_at IS NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_infra_incidents_resolved_day
+    ON infra_incidents(platform, incident_type, severity, (started_at::date))
+    WHERE resolved_at IS NOT NULL;
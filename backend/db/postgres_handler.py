@@ -4,12 +4,15 @@ Provides connection management and query execution utilities.
 """
 
 import asyncio
+import csv
+import io
 import logging
+from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
 from contextlib import asynccontextmanager
 import asyncpg
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from psycopg2.pool import ThreadedConnectionPool
 
 from ..config.settings import settings
@@ -318,8 +321,49 @@ def insert_market_price(ticker: str, timestamp: str, open_price: float, high: fl
     params = (ticker, timestamp, open_price, high, low, close, volume, bid_ask_spread, source)
     return db.execute_insert(query, params)
 
-def insert_news_headline(ticker: str, headline: str, url: str, source: str, published_at: str) -> Optional[int]:
-    """Insert a news headline record."""
+MARKET_PRICE_COLUMNS = ('ticker', 'timestamp', 'open', 'high', 'low', 'close', 'volume', 'bid_ask_spread', 'source')
+
+def bulk_insert_market_prices(records: List[tuple], page_size: int = 1000) -> int:
+    """Upsert market price rows in multi-row VALUES pages instead of one round-trip per row.
+    
+    Each record is a tuple ordered as MARKET_PRICE_COLUMNS. Rows must be unique on
+    (ticker, timestamp) within a call, as ON CONFLICT cannot touch the same row twice.
+    """
+    if not records:
+        return 0
+    
+    query = f"""
+        INSERT INTO market_prices ({', '.join(MARKET_PRICE_COLUMNS)})
+        VALUES %s
+        ON CONFLICT (ticker, timestamp) DO UPDATE SET
+            open = EXCLUDED.open,
+            high = EXCLUDED.high,
+            low = EXCLUDED.low,
+            close = EXCLUDED.close,
+            volume = EXCLUDED.volume,
+            bid_ask_spread = EXCLUDED.bid_ask_spread,
+            source = EXCLUDED.source
+    """
+    
+    conn = None
+    try:
+        conn = db.get_sync_connection()
+        with conn.cursor() as cursor:
+            execute_values(cursor, query, records, page_size=page_size)
+        conn.commit()
+        return len(records)
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        logger.error(f"Bulk market price insert failed: {e}")
+        raise
+    finally:
+        if conn:
+            db.return_sync_connection(conn)
+
+def insert_news_headline(ticker: str, headline: str, url: str, source: str,
+                         published_at: datetime) -> Optional[int]:
+    """Insert a news headline record; published_at is bound natively by psycopg2."""
     query = """
         INSERT INTO news_headlines (ticker, headline, url, source, published_at)
         VALUES (%s, %s, %s, %s, %s)
@@ -328,6 +372,98 @@ def insert_news_headline(ticker: str, headline: str, url: str, source: str, publ
     params = (ticker, headline, url, source, published_at)
     return db.execute_insert(query, params)
 
+MARKET_PRICE_STAGE_DDL = """
+    CREATE TEMP TABLE market_prices_stage (
+        ticker VARCHAR(20),
+        timestamp TIMESTAMP,
+        open FLOAT,
+        high FLOAT,
+        low FLOAT,
+        close FLOAT,
+        volume BIGINT,
+        bid_ask_spread FLOAT,
+        source VARCHAR(30),
+        ord BIGSERIAL
+    ) ON COMMIT DROP
+"""
+
+def copy_market_prices(records: List[tuple]) -> int:
+    """Load market price rows with COPY into a staging table and merge them in one statement.
+    
+    Each record is a tuple ordered as MARKET_PRICE_COLUMNS. Duplicate (ticker, timestamp)
+    rows in the load collapse to the last one loaded before the ON CONFLICT upsert.
+    """
+    if not records:
+        return 0
+    
+    # Empty unquoted CSV fields load as NULL; ord numbers the rows in load order
+    buf = io.StringIO()
+    csv.writer(buf).writerows(records)
+    buf.seek(0)
+    
+    columns = ', '.join(MARKET_PRICE_COLUMNS)
+    merge = f"""
+        INSERT INTO market_prices ({columns})
+        SELECT DISTINCT ON (ticker, timestamp) {columns}
+        FROM market_prices_stage
+        ORDER BY ticker, timestamp, ord DESC
+        ON CONFLICT (ticker, timestamp) DO UPDATE SET
+            open = EXCLUDED.open,
+            high = EXCLUDED.high,
+            low = EXCLUDED.low,
+            close = EXCLUDED.close,
+            volume = EXCLUDED.volume,
+            bid_ask_spread = EXCLUDED.bid_ask_spread,
+            source = EXCLUDED.source
+    """
+    
+    conn = None
+    try:
+        conn = db.get_sync_connection()
+        with conn.cursor() as cursor:
+            cursor.execute(MARKET_PRICE_STAGE_DDL)
+            cursor.copy_expert(f"COPY market_prices_stage ({columns}) FROM STDIN WITH (FORMAT csv)", buf)
+            cursor.execute(merge)
+            stored_count = cursor.rowcount
+        conn.commit()
+        return stored_count
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        logger.error(f"COPY load of {len(records)} market price rows failed: {e}")
+        raise
+    finally:
+        if conn:
+            db.return_sync_connection(conn)
+
+NEWS_HEADLINE_COLUMNS = ('ticker', 'headline', 'url', 'source', 'published_at')
+
+def bulk_insert_news_headlines(records: List[tuple], page_size: int = 1000) -> int:
+    """Insert news headline rows in multi-row VALUES pages instead of one round-trip per row.
+    
+    Each record is a tuple ordered as NEWS_HEADLINE_COLUMNS.
+    """
+    if not records:
+        return 0
+    
+    query = f"INSERT INTO news_headlines ({', '.join(NEWS_HEADLINE_COLUMNS)}) VALUES %s"
+    
+    conn = None
+    try:
+        conn = db.get_sync_connection()
+        with conn.cursor() as cursor:
+            execute_values(cursor, query, records, page_size=page_size)
+        conn.commit()
+        return len(records)
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        logger.error(f"Bulk news headline insert failed: {e}")
+        raise
+    finally:
+        if conn:
+            db.return_sync_connection(conn)
+
 def insert_sentiment(headline_id: int, sentiment_score: float, sentiment_label: str, 
                     confidence: float, model_version: str) -> Optional[int]:
     """Insert a sentiment analysis record."""
@@ -350,6 +486,34 @@ def insert_anomaly(ticker: str, metric: str, anomaly_score: float, severity: str
     params = (ticker, metric, anomaly_score, severity, explanation, timestamp)
     return db.execute_insert(query, params)
 
+ANOMALY_COLUMNS = ('ticker', 'metric', 'anomaly_score', 'severity', 'explanation', 'timestamp')
+
+def bulk_insert_anomalies(records: List[tuple], page_size: int = 1000) -> int:
+    """Insert anomaly rows in multi-row VALUES pages instead of one round-trip per row.
+    
+    Each record is a tuple ordered as ANOMALY_COLUMNS.
+    """
+    if not records:
+        return 0
+    
+    query = f"INSERT INTO anomalies ({', '.join(ANOMALY_COLUMNS)}) VALUES %s"
+    
+    conn = None
+    try:
+        conn = db.get_sync_connection()
+        with conn.cursor() as cursor:
+            execute_values(cursor, query, records, page_size=page_size)
+        conn.commit()
+        return len(records)
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        logger.error(f"Bulk anomaly insert failed: {e}")
+        raise
+    finally:
+        if conn:
+            db.return_sync_connection(conn)
+
 def insert_alert(ticker: str, risk_type: str, severity: str, message: str) -> Optional[int]:
     """Insert an alert record."""
     query = """
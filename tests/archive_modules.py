@@ -0,0 +1,62 @@
+"""
+Load archived collectors for unit tests.
+
+The collectors under archive/backend/data_ingestion/collectors import config,
+db and utils relatively from their original package; those now live in
+backend/. load_collector imports a collector under a synthetic package whose
+config/db/utils subpackages are the backend ones.
+"""
+
+import importlib
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+COLLECTORS_DIR = ROOT / 'archive' / 'backend' / 'data_ingestion' / 'collectors'
+PACKAGE = 'archived_ingestion'
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def _ensure_package():
+    """Register the synthetic package and alias its backend subpackages."""
+    if PACKAGE in sys.modules:
+        return
+
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = []
+    sys.modules[PACKAGE] = package
+
+    collectors = types.ModuleType(f'{PACKAGE}.collectors')
+    collectors.__path__ = [str(COLLECTORS_DIR)]
+    sys.modules[f'{PACKAGE}.collectors'] = collectors
+
+    for name in ('config.settings', 'db.postgres_handler', 'utils.logging_utils'):
+        parent, _ = name.split('.')
+        sys.modules[f'{PACKAGE}.{parent}'] = importlib.import_module(f'backend.{parent}')
+        sys.modules[f'{PACKAGE}.{name}'] = importlib.import_module(f'backend.{name}')
+
+
+# Registered on import too, so worker processes that preload this module can unpickle collector functions
+_ensure_package()
+
+
+def load_collector(name: str) -> types.ModuleType:
+    """Import archive/backend/data_ingestion/collectors/<name>.py."""
+    _ensure_package()
+    qualified = f'{PACKAGE}.collectors.{name}'
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+
+    spec = importlib.util.spec_from_file_location(qualified, COLLECTORS_DIR / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[qualified]
+        raise
+    return module
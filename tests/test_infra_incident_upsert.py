@@ -0,0 +1,141 @@
+"""
+Upsert semantics of migration 005 and the infra collector's prepared upserts.
+
+Needs a scratch PostgreSQL database: set TEST_DATABASE_URL to run. Everything
+happens in a throwaway schema that is dropped afterwards.
+"""
+
+import os
+import uuid
+from datetime import datetime
+
+import pytest
+
+from tests.archive_modules import ROOT, load_collector
+
+psycopg2 = pytest.importorskip('psycopg2')
+
+MIGRATIONS_DIR = ROOT / 'backend' / 'db' / 'migrations'
+
+INFRA_TABLE_DDL = """
+    CREATE TABLE infra_incidents (
+        id SERIAL PRIMARY KEY,
+        platform VARCHAR(50),
+        incident_type VARCHAR(50),
+        description TEXT,
+        severity VARCHAR(10),
+        started_at TIMESTAMP,
+        resolved_at TIMESTAMP,
+        source VARCHAR(30)
+    )
+"""
+
+
+@pytest.fixture
+def cursor():
+    dsn = os.getenv('TEST_DATABASE_URL')
+    if not dsn:
+        pytest.skip('TEST_DATABASE_URL not set')
+
+    conn = psycopg2.connect(dsn)
+    schema = f"test_infra_{uuid.uuid4().hex[:8]}"
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"CREATE SCHEMA {schema}")
+            cur.execute(f"SET search_path TO {schema}")
+            cur.execute(INFRA_TABLE_DDL)
+            cur.execute((MIGRATIONS_DIR / '004_infra_raw_uri.sql').read_text())
+            yield cur
+    finally:
+        conn.rollback()
+        with conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        conn.commit()
+        conn.close()
+
+
+def _insert(cur, platform, incident_type, severity, started_at, resolved_at=None, description='d'):
+    cur.execute(
+        "INSERT INTO infra_incidents (platform, incident_type, description, severity, started_at, resolved_at, source) "
+        "VALUES (%s, %s, %s, %s, %s, %s, 'test')",
+        (platform, incident_type, description, severity, started_at, resolved_at)
+    )
+
+
+def _upsert(cur, statement, *incidents):
+    """Run one of the collector's prepared upserts the way _insert_incident_rows does."""
+    infra = load_collector('infra_collector')
+    rows = [
+        (platform, incident_type, description, severity, started_at, resolved_at, 'test', None)
+        for platform, incident_type, description, severity, started_at, resolved_at in incidents
+    ]
+    cur.execute(infra.INFRA_UPSERT_EXECUTE.format(statement), [list(column) for column in zip(*rows)])
+    return cur.fetchall()
+
+
+def _prepare(cur):
+    infra = load_collector('infra_collector')
+    for name, sql in infra.INFRA_UPSERT_STATEMENTS.items():
+        cur.execute(f"PREPARE {name} AS {sql}")
+
+
+def test_migration_collapses_existing_duplicates(cursor):
+    day = datetime(2024, 5, 1, 9)
+    # Two open copies of one incident: only the newest stays open
+    _insert(cursor, 'binance', 'outage', 'high', day)
+    _insert(cursor, 'binance', 'outage', 'high', day.replace(hour=10))
+    # Three healthy checks on one day and one on the next: one row per day survives
+    for hour in (9, 10, 11):
+        _insert(cursor, 'binance', 'normal_operation', 'low', day.replace(hour=hour), day.replace(hour=hour))
+    _insert(cursor, 'binance', 'normal_operation', 'low', day.replace(day=2), day.replace(day=2))
+
+    cursor.execute((MIGRATIONS_DIR / '005_infra_incident_upsert.sql').read_text())
+
+    cursor.execute("SELECT started_at FROM infra_incidents WHERE incident_type = 'outage' AND resolved_at IS NULL")
+    assert cursor.fetchall() == [(day.replace(hour=10),)]
+    cursor.execute("SELECT count(*) FROM infra_incidents WHERE incident_type = 'outage'")
+    assert cursor.fetchone()[0] == 2
+
+    cursor.execute(
+        "SELECT started_at FROM infra_incidents WHERE incident_type = 'normal_operation' ORDER BY started_at"
+    )
+    assert cursor.fetchall() == [(day.replace(hour=11),), (day.replace(day=2),)]
+
+
+def test_open_incidents_coalesce_per_platform_type_and_severity(cursor):
+    cursor.execute((MIGRATIONS_DIR / '005_infra_incident_upsert.sql').read_text())
+    _prepare(cursor)
+    t0 = datetime(2024, 5, 1, 9)
+
+    first = _upsert(cursor, 'infra_ins', ('coinbase', 'outage', 'down', 'high', t0, None))
+    again = _upsert(cursor, 'infra_ins', ('coinbase', 'outage', 'still down', 'high', t0.replace(hour=10), None))
+    other = _upsert(cursor, 'infra_ins', ('coinbase', 'outage', 'degraded', 'medium', t0, None))
+
+    assert again == first
+    assert other != first
+    cursor.execute(
+        "SELECT description, started_at FROM infra_incidents WHERE severity = 'high'"
+    )
+    # The original start time is kept; the description follows the latest observation
+    assert cursor.fetchall() == [('still down', t0)]
+
+
+def test_resolved_observations_coalesce_per_day(cursor):
+    cursor.execute((MIGRATIONS_DIR / '005_infra_incident_upsert.sql').read_text())
+    _prepare(cursor)
+    t0 = datetime(2024, 5, 1, 9)
+
+    first = _upsert(cursor, 'infra_ins_resolved', ('solana', 'normal_operation', 'ok', 'low', t0, t0))
+    later = _upsert(cursor, 'infra_ins_resolved',
+                    ('solana', 'normal_operation', 'ok again', 'low', t0.replace(hour=15), t0.replace(hour=15)))
+    next_day = _upsert(cursor, 'infra_ins_resolved',
+                       ('solana', 'normal_operation', 'ok', 'low', t0.replace(day=2), t0.replace(day=2)))
+    # An open incident of the same kind is tracked separately from resolved ones
+    open_row = _upsert(cursor, 'infra_ins', ('solana', 'normal_operation', 'flapping', 'low', t0, None))
+
+    assert later == first
+    assert len({first[0], next_day[0], open_row[0]}) == 3
+    cursor.execute(
+        "SELECT description, resolved_at FROM infra_incidents WHERE id = %s", first[0]
+    )
+    assert cursor.fetchone() == ('ok again', t0.replace(hour=15))
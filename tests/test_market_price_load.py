@@ -0,0 +1,124 @@
+"""
+Market price frames and loads through COPY and execute_values land on one row per instant.
+
+The load tests need a scratch PostgreSQL database: set TEST_DATABASE_URL to
+run them. Everything happens in a throwaway schema that is dropped afterwards.
+"""
+
+import os
+import uuid
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from tests.archive_modules import load_collector
+
+psycopg2 = pytest.importorskip('psycopg2')
+from psycopg2.pool import ThreadedConnectionPool  # noqa: E402
+
+from backend.db import postgres_handler  # noqa: E402
+
+MARKET_PRICES_DDL = """
+    CREATE TABLE market_prices (
+        id SERIAL PRIMARY KEY,
+        ticker VARCHAR(20),
+        timestamp TIMESTAMP NOT NULL,
+        open FLOAT,
+        high FLOAT,
+        low FLOAT,
+        close FLOAT,
+        volume BIGINT,
+        bid_ask_spread FLOAT,
+        source VARCHAR(20),
+        UNIQUE (ticker, timestamp)
+    )
+"""
+
+INSTANT = pd.Timestamp('2024-05-01 13:30', tz='UTC')
+
+
+@pytest.fixture
+def cursor(monkeypatch):
+    dsn = os.getenv('TEST_DATABASE_URL')
+    if not dsn:
+        pytest.skip('TEST_DATABASE_URL not set')
+
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    schema = f"test_market_{uuid.uuid4().hex[:8]}"
+    pool = None
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"CREATE SCHEMA {schema}")
+            cur.execute(f"SET search_path TO {schema}")
+            cur.execute(MARKET_PRICES_DDL)
+            # The loaders take connections from the shared handler's pool
+            pool = ThreadedConnectionPool(1, 2, dsn, options=f'-c search_path={schema}')
+            monkeypatch.setattr(postgres_handler.db, 'pool', pool)
+            yield cur
+    finally:
+        if pool:
+            pool.closeall()
+        with conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        conn.close()
+
+
+def _bars(source, timestamp, close):
+    return pd.DataFrame({
+        'timestamp': [timestamp],
+        'open': [close - 1], 'high': [close + 1], 'low': [close - 2], 'close': [close],
+        'volume': [1000], 'source': [source],
+    })
+
+
+def _source_records():
+    """One bar for the same instant from yfinance (New York time) and Tiingo (UTC)."""
+    market = load_collector('market_collector')
+    collector = market.MarketDataCollector()
+    yfinance = collector._build_price_records('AAPL', _bars('yfinance', INSTANT.tz_convert('America/New_York'), 100.0))
+    tiingo = collector._build_price_records('AAPL', _bars('tiingo', INSTANT, 101.0))
+    return yfinance, tiingo
+
+
+def _stored(cur):
+    cur.execute("SELECT timestamp, close, source FROM market_prices ORDER BY timestamp")
+    return cur.fetchall()
+
+
+def test_combined_frames_share_one_utc_timestamp_column():
+    market = load_collector('market_collector')
+    frame = market.MarketDataCollector._combine_frames([
+        _bars('yfinance', INSTANT.tz_convert('America/New_York'), 100.0).assign(ticker='AAPL'),
+        _bars('tiingo', INSTANT, 101.0).assign(ticker='AAPL'),
+        _bars('tiingo', INSTANT, 50.0).assign(ticker='MSFT'),
+    ])
+
+    assert isinstance(frame['timestamp'].dtype, pd.DatetimeTZDtype)
+    assert str(frame['timestamp'].dt.tz) == 'UTC'
+    assert frame[['ticker', 'source']].values.tolist() == [['AAPL', 'tiingo'], ['MSFT', 'tiingo']]
+
+
+def test_records_carry_naive_utc_timestamps():
+    yfinance, tiingo = _source_records()
+    assert yfinance[0][1] == tiingo[0][1] == datetime(2024, 5, 1, 13, 30)
+    assert yfinance[0][1].tzinfo is None
+
+
+@pytest.mark.parametrize('later', ['yfinance', 'tiingo'])
+def test_copy_collapses_sources_to_the_later_row(cursor, later):
+    yfinance, tiingo = _source_records()
+    records = yfinance + tiingo if later == 'tiingo' else tiingo + yfinance
+
+    assert postgres_handler.copy_market_prices(records) == 1
+    assert [(ts, source) for ts, _, source in _stored(cursor)] == [(datetime(2024, 5, 1, 13, 30), later)]
+
+
+def test_copy_and_execute_values_paths_write_the_same_timestamp(cursor):
+    yfinance, tiingo = _source_records()
+
+    postgres_handler.copy_market_prices(yfinance)
+    postgres_handler.bulk_insert_market_prices(tiingo)
+
+    assert _stored(cursor) == [(datetime(2024, 5, 1, 13, 30), 101.0, 'tiingo')]
@@ -0,0 +1,68 @@
+"""Unit tests for the archived news collector's headline ticker matching."""
+
+import random
+
+import pytest
+
+from tests.archive_modules import load_collector
+
+news = load_collector('news_collector')
+
+
+def _reference_ticker(headline, tickers):
+    """The original matcher: explicit ticker mentions in tracked order, then company names."""
+    headline_upper = headline.upper()
+    for ticker in tickers:
+        if f"({ticker})" in headline_upper or f" {ticker} " in headline_upper:
+            return ticker
+    for company, ticker in news.COMPANY_TICKERS.items():
+        if company in headline_upper:
+            return ticker
+    return None
+
+
+def _headlines(tickers, count=500, seed=11):
+    """Random headlines mixing tickers, parenthesized tickers, company names and filler."""
+    rng = random.Random(seed)
+    tokens = (
+        list(tickers)
+        + [f"({ticker})" for ticker in tickers]
+        + [company.title() for company in news.COMPANY_TICKERS]
+        + ['shares', 'rally', 'after', 'earnings', 'Xapple', 'AAPLE', 'crypto', 'ETF']
+    )
+    return [' '.join(rng.choice(tokens) for _ in range(rng.randint(1, 8))) for _ in range(count)]
+
+
+@pytest.fixture(params=['automaton', 'regex'])
+def collector(request):
+    collector = news.NewsCollector()
+    if request.param == 'automaton':
+        if collector._ticker_ac is None:
+            pytest.skip('pyahocorasick not installed')
+    else:
+        collector._ticker_ac = None
+    return collector
+
+
+def test_higher_priority_ticker_wins_regardless_of_position(collector):
+    first, second = collector.relevant_tickers[:2]
+    assert collector.extract_ticker_from_headline(f"Shares of {second} and {first} rally today") == first
+    assert collector.extract_ticker_from_headline("Microsoft partners with Apple (AAPL)") == 'AAPL'
+
+
+def test_explicit_ticker_beats_company_name(collector):
+    ticker = next(t for t in collector.relevant_tickers if t not in news.COMPANY_TICKERS.values())
+    assert collector.extract_ticker_from_headline(f"Tesla supplier ({ticker}) jumps") == ticker
+
+
+def test_overlapping_mentions_sharing_a_space_are_all_seen(collector):
+    first, second = collector.relevant_tickers[:2]
+    # " {second} " and " {first} " overlap on the space between them
+    assert collector.extract_ticker_from_headline(f"Movers: {second} {first} lead") == first
+
+
+def test_matches_original_loop_on_random_headlines(collector):
+    for headline in _headlines(collector.relevant_tickers):
+        assert collector.extract_ticker_from_headline(headline) == _reference_ticker(
+            headline, collector.relevant_tickers
+        ), headline
@@ -0,0 +1,182 @@
+"""Unit tests for the archived options flow collector's anomaly detection."""
+
+import asyncio
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.archive_modules import load_collector
+
+options_flow = load_collector('options_flow_collector')
+
+
+def _chain_frame(n_tickers: int, contracts: int = 40, seed: int = 7) -> pd.DataFrame:
+    """A multi-ticker options frame with skewed, spiky and whale-heavy chains."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for i in range(n_tickers):
+        volume = rng.integers(10, 500, contracts).astype(float)
+        iv = rng.uniform(0.2, 0.4, contracts)
+        if i % 3 == 0:
+            volume[:3] = [20000, 15000, 12000]
+        if i % 4 == 1:
+            iv[0] = 2.5
+        if i % 5 == 4:
+            is_put = np.arange(contracts) % 5 != 0
+        else:
+            is_put = np.arange(contracts) % (5 if i % 2 else 2) == 0
+        frames.append(pd.DataFrame({
+            'ticker': f'T{i:02d}',
+            'contract_ticker': [f'O:T{i:02d}{j:03d}' for j in range(contracts)],
+            'contract_type': np.where(is_put, 'put', 'call'),
+            'volume': volume,
+            'implied_volatility': iv,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _reference_anomalies(options_data, ticker):
+    """Per-ticker detection as it was before the groupby rewrite (skew, volume and IV spikes)."""
+    anomalies = []
+    df = pd.DataFrame(options_data)
+
+    calls = df[df['contract_type'] == 'call'] if 'contract_type' in df.columns else df
+    puts = df[df['contract_type'] == 'put'] if 'contract_type' in df.columns else pd.DataFrame()
+    total_call_volume = calls['volume'].sum() if not calls.empty else 0
+    total_put_volume = puts['volume'].sum() if not puts.empty else 0
+    if total_call_volume + total_put_volume == 0:
+        return anomalies
+
+    call_put_ratio = total_call_volume / total_put_volume if total_put_volume > 0 else float('inf')
+    details = {'call_volume': total_call_volume, 'put_volume': total_put_volume, 'ratio': call_put_ratio}
+    if call_put_ratio > 3.0:
+        anomalies.append({
+            'ticker': ticker, 'metric': 'call_skew',
+            'anomaly_score': min(call_put_ratio / 10.0, 1.0),
+            'severity': 'high' if call_put_ratio > 5.0 else 'medium',
+            'explanation': f'Unusual call volume detected. Call/Put ratio: {call_put_ratio:.2f}',
+            'details': details
+        })
+    elif call_put_ratio < 0.33:
+        anomalies.append({
+            'ticker': ticker, 'metric': 'put_skew',
+            'anomaly_score': min(3.0 / call_put_ratio / 10.0, 1.0),
+            'severity': 'high' if call_put_ratio < 0.2 else 'medium',
+            'explanation': f'Unusual put volume detected. Call/Put ratio: {call_put_ratio:.2f}',
+            'details': details
+        })
+
+    volume_mean = df['volume'].mean()
+    volume_std = df['volume'].std()
+    if volume_std > 0:
+        high = df[df['volume'] > volume_mean + 2 * volume_std]
+        if len(high):
+            max_volume = high['volume'].max()
+            score = min((max_volume - volume_mean) / (volume_std * 3), 1.0)
+            anomalies.append({
+                'ticker': ticker, 'metric': 'volume_spike', 'anomaly_score': score,
+                'severity': 'high' if score > 0.7 else 'medium',
+                'explanation': f'High volume spike detected. Max volume: {max_volume}, Mean: {volume_mean:.0f}',
+                'details': {'max_volume': max_volume, 'mean_volume': volume_mean, 'contracts_affected': len(high)}
+            })
+
+    iv_data = df[df['implied_volatility'] > 0]['implied_volatility']
+    iv_mean = iv_data.mean()
+    iv_std = iv_data.std()
+    if len(iv_data) and iv_std > 0:
+        high = df[df['implied_volatility'] > iv_mean + 2 * iv_std]
+        if len(high):
+            max_iv = high['implied_volatility'].max()
+            score = min((max_iv - iv_mean) / (iv_std * 3), 1.0)
+            anomalies.append({
+                'ticker': ticker, 'metric': 'iv_spike', 'anomaly_score': score,
+                'severity': 'high' if score > 0.7 else 'medium',
+                'explanation': f'Implied volatility spike detected. Max IV: {max_iv:.2f}, Mean: {iv_mean:.2f}',
+                'details': {'max_iv': max_iv, 'mean_iv': iv_mean, 'contracts_affected': len(high)}
+            })
+
+    return anomalies
+
+
+def _comparable(anomalies):
+    """Anomalies keyed by (ticker, metric) with the timestamp dropped."""
+    return {
+        (anomaly['ticker'], anomaly['metric']): {k: v for k, v in anomaly.items() if k != 'timestamp'}
+        for anomaly in anomalies
+    }
+
+
+def test_large_universe_runs_in_worker_processes_and_matches_inline_detection():
+    if options_flow.DETECTION_START_METHOD == 'forkserver':
+        # Workers import the collector through the synthetic test package
+        multiprocessing.get_context('forkserver').set_forkserver_preload(['tests.archive_modules'])
+
+    df = _chain_frame(options_flow.DETECTION_POOL_MIN_TICKERS)
+    inline = options_flow.OptionsFlowCollector().detect_options_anomalies_frame(df)
+
+    async def detect_in_pool():
+        collector = options_flow.OptionsFlowCollector()
+        try:
+            anomalies = await collector.async_detect_options_anomalies(df)
+            pool = collector._detection_pool
+            assert pool is not None
+            assert pool._mp_context.get_start_method() in ('forkserver', 'spawn')
+            return anomalies, collector._quantiles
+        finally:
+            await collector.close()
+
+    pooled, quantiles = asyncio.run(detect_in_pool())
+
+    assert inline
+    assert _comparable(pooled) == _comparable(inline)
+    # The cycle is folded into the history after the workers return
+    assert quantiles[('T00', 'volume')].count == 40
+
+
+@pytest.mark.parametrize('p, draw', [
+    (0.99, lambda rng, n: rng.lognormal(5, 1, n)),
+    (0.99, lambda rng, n: rng.exponential(300, n)),
+    (0.5, lambda rng, n: rng.normal(0, 1, n)),
+])
+def test_p2_quantile_tracks_numpy_quantile(p, draw):
+    stream = draw(np.random.default_rng(3), 20000)
+    estimate = options_flow.P2Quantile(p)
+    for value in stream:
+        estimate.update(float(value))
+
+    assert estimate.count == len(stream)
+    expected = np.quantile(stream, p)
+    spread = np.quantile(stream, 0.75) - np.quantile(stream, 0.25)
+    assert abs(estimate.value - expected) < 0.05 * spread
+
+
+def test_p2_quantile_before_five_observations_uses_the_sorted_sample():
+    estimate = options_flow.P2Quantile(0.5)
+    assert np.isnan(estimate.value)
+    for value in (9.0, 1.0, 5.0):
+        estimate.update(value)
+    assert estimate.value == 5.0
+
+
+def test_groupby_detection_matches_per_ticker_detection():
+    df = _chain_frame(12)
+    detected = options_flow.OptionsFlowCollector().detect_options_anomalies_frame(df)
+
+    expected = []
+    for ticker, chain in df.groupby('ticker', sort=False):
+        expected.extend(_reference_anomalies(chain.drop(columns='ticker').to_dict('records'), ticker))
+
+    # Whale concentration was added after the rewrite and has no per-ticker counterpart
+    detected = _comparable(a for a in detected if a['metric'] != 'whale_concentration')
+    expected = _comparable(expected)
+
+    assert {metric for _, metric in expected} == {'call_skew', 'put_skew', 'volume_spike', 'iv_spike'}
+    assert detected.keys() == expected.keys()
+    for key, anomaly in expected.items():
+        got = detected[key]
+        assert got['severity'] == anomaly['severity']
+        assert got['explanation'] == anomaly['explanation']
+        assert got['anomaly_score'] == pytest.approx(anomaly['anomaly_score'])
+        assert got['details'] == pytest.approx(anomaly['details'])